@@ -0,0 +1,356 @@
+import concurrent.futures
+import contextlib
+import ctypes
+import io
+import math
+import os
+import pickle
+import sys
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from diagnosticos import establecer_modo_predeterminado
+
+class EspecificacionModelo:
+	"""
+	Descripción serializable de un modelo termodinámico: su clase y los argumentos de su constructor.
+
+	Los procesos de trabajo reciben la especificación (unos pocos bytes) y construyen el modelo localmente, en
+	lugar de recibir el modelo ya construido con sus tablas. La clase debe poder importarse desde su módulo.
+
+	Attributes:
+		clase (type): Clase del modelo, por ejemplo `ModeloVanDerWaals`.
+		argumentos (dict): Argumentos con nombre del constructor.
+	"""
+
+	def __init__(self, clase, **argumentos):
+		self.clase = clase
+		self.argumentos = argumentos
+
+	def construir(self):
+		"""Construye una instancia nueva del modelo."""
+		return self.clase(**self.argumentos)
+
+def barrer(evaluar, configuraciones, modelo=None, n_procesos=None, tamano_bloque=None, progreso=None, silencioso=True):
+	"""
+	Evalúa una función de ciclo sobre muchas configuraciones, repartiéndolas en bloques entre procesos.
+
+	Está pensado para modelos que no se pueden vectorizar (por ejemplo subclases escalares de
+	`ModeloTermodinamico`); para ciclos con modelos vectorizados, `PlantillaCiclo` suele ser más rápido. Las
+	configuraciones se agrupan en bloques para amortizar la comunicación entre procesos; cada proceso de trabajo
+	construye el modelo una vez por bloque y evalúa sus configuraciones en orden. Un error en una configuración
+	se registra en su fila y no detiene el resto del barrido; si falla el bloque completo (por ejemplo, porque su
+	proceso termina de forma abrupta), el error se registra en todas las filas del bloque.
+
+	Args:
+		evaluar (callable): Función definida en el nivel superior de un módulo (para poder serializarla), con firma
+			`evaluar(modelo, **configuracion)`, que construye y resuelve un ciclo y devuelve un diccionario de
+			resultados escalares (por ejemplo {'eficiencia': ...}).
+		configuraciones (list[dict] | pandas.DataFrame): Argumentos de cada evaluación.
+		modelo (EspecificacionModelo | ModeloTermodinamico, optional): Modelo que recibe `evaluar`. Una
+			especificación se construye en cada proceso; una instancia se serializa tal cual. Con varios procesos,
+			una instancia que no se puede serializar produce `ValueError` antes de repartir el trabajo.
+		n_procesos (int, optional): Número de procesos. Por defecto, el número de núcleos; con 1 no se crean procesos.
+		tamano_bloque (int, optional): Configuraciones por bloque. Por defecto se reparten unos cuatro bloques por proceso.
+		progreso (callable, optional): Se llama en el proceso principal como `progreso(completadas, total)` cada
+			vez que termina un bloque.
+		silencioso (bool): Si es `True` se descarta lo que los ciclos impriman durante la evaluación y sus
+			diagnósticos se crean en modo 'silencioso'.
+
+	Returns:
+		pandas.DataFrame: Una fila por configuración, en el orden de entrada, con las columnas de la configuración,
+		las de los resultados y 'error' (nulo si la evaluación fue exitosa).
+	"""
+	configuraciones = _lista_configuraciones(configuraciones)
+	total = len(configuraciones)
+	n_procesos = n_procesos or os.cpu_count() or 1
+	if n_procesos > 1:
+		_comprobar_modelo_serializable(modelo)
+	tamano_bloque = tamano_bloque or max(1, math.ceil(total/(4*n_procesos)))
+	bloques = [(inicio, configuraciones[inicio:inicio + tamano_bloque]) for inicio in range(0, total, tamano_bloque)]
+
+	resultados = [None]*total
+	completadas = 0
+	def recibir(inicio, filas):
+		nonlocal completadas
+		resultados[inicio:inicio + len(filas)] = filas
+		completadas += len(filas)
+		if progreso is not None:
+			progreso(completadas, total)
+
+	argumentos = (evaluar, modelo, silencioso)
+	if n_procesos == 1:
+		for inicio, bloque in bloques:
+			recibir(*_evaluar_bloque(*argumentos, inicio, bloque))
+	else:
+		with concurrent.futures.ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+			_ejecutar_bloques(ejecutor, _evaluar_bloque, argumentos, bloques, recibir,
+							  lambda mensaje, inicio, bloque: [{'error': mensaje} for _ in bloque])
+
+	import pandas as pd
+
+	filas = [{**configuracion, **resultado} for configuracion, resultado in zip(configuraciones, resultados)]
+	return pd.DataFrame(filas)
+
+def _lista_configuraciones(configuraciones):
+	"""
+	Convierte las configuraciones en una lista de diccionarios; un DataFrame se convierte fila por fila.
+	"""
+	# Si pandas no se ha importado, las configuraciones no pueden ser un DataFrame
+	pandas = sys.modules.get('pandas')
+	if pandas is not None and isinstance(configuraciones, pandas.DataFrame):
+		configuraciones = configuraciones.to_dict('records')
+	return list(configuraciones)
+
+def _serializable(objeto):
+	"""Indica si `objeto` se puede serializar con pickle para enviarlo a un proceso de trabajo."""
+	try:
+		pickle.dumps(objeto)
+	except Exception:
+		# PicklingError, AttributeError o TypeError, según el objeto que no se puede serializar
+		return False
+	return True
+
+def _comprobar_modelo_serializable(modelo):
+	"""
+	Lanza `ValueError` si `modelo` es una instancia que no se puede enviar a los procesos de trabajo; en ese caso
+	cada bloque fallaría con el mismo error de serialización.
+	"""
+	if modelo is not None and not isinstance(modelo, EspecificacionModelo) and not _serializable(modelo):
+		raise ValueError(f"El modelo {type(modelo).__name__} no se puede serializar para enviarlo a los procesos de "
+						 "trabajo. Use una EspecificacionModelo, que construye el modelo en cada proceso, o n_procesos=1.")
+
+def _evaluar_bloque(evaluar, modelo, silencioso, inicio, bloque):
+	"""
+	Evalúa un bloque de configuraciones en un proceso de trabajo.
+
+	Returns:
+		tuple[int, list[dict]]: Posición del bloque y resultados de cada configuración, con la llave 'error'.
+	"""
+	if isinstance(modelo, EspecificacionModelo):
+		modelo = modelo.construir()
+	filas = []
+	for configuracion in bloque:
+		try:
+			with _silenciar(silencioso):
+				resultado = dict(evaluar(modelo, **configuracion))
+			resultado['error'] = None
+		except Exception as error:
+			resultado = {'error': f"{type(error).__name__}: {error}"}
+		filas.append(resultado)
+	return inicio, filas
+
+def _ejecutar_bloques(ejecutor, funcion, argumentos, bloques, recibir, filas_error):
+	"""
+	Envía cada bloque a `ejecutor` como `funcion(*argumentos, inicio, bloque)` y entrega a `recibir` cada resultado
+	a medida que termina.
+
+	Los errores dentro de cada configuración ya los registra `funcion`; aquí se atrapan los del bloque completo
+	(un proceso de trabajo que termina de forma abrupta, `BrokenProcessPool`, argumentos o resultados que no se
+	pueden serializar). Las filas de ese bloque reciben `filas_error(mensaje, inicio, bloque)` y el resto de los
+	bloques continúa.
+	"""
+	def fallar(error, inicio, bloque):
+		recibir(inicio, filas_error(f"{type(error).__name__}: {error}", inicio, bloque))
+
+	futuros = {}
+	for inicio, bloque in bloques:
+		try:
+			futuros[ejecutor.submit(funcion, *argumentos, inicio, bloque)] = (inicio, bloque)
+		except Exception as error:
+			fallar(error, inicio, bloque)
+	for futuro in concurrent.futures.as_completed(futuros):
+		try:
+			resultado = futuro.result()
+		except Exception as error:
+			fallar(error, *futuros[futuro])
+		else:
+			recibir(*resultado)
+
+@contextlib.contextmanager
+def _silenciar(silencioso):
+	"""
+	Descarta lo que se imprima y deja los diagnósticos de los ciclos nuevos en modo 'silencioso' (solo conteo).
+	"""
+	if not silencioso:
+		yield
+		return
+	anterior = establecer_modo_predeterminado('silencioso')
+	try:
+		with contextlib.redirect_stdout(io.StringIO()):
+			yield
+	finally:
+		establecer_modo_predeterminado(anterior)
+
+_PROPIEDADES_BUFFER = ('P', 'T', 'v', 'u', 'h', 's')
+_COLUMNAS_BUFFER = ('P [Pa]', 'T [K]', 'v [m³/kg]', 'u [J/kg]', 'h [J/kg]', 's [J/kg·K]')
+
+class ResultadoEstados:
+	"""
+	Propiedades de todos los estados (principales e internos) de un barrido, guardadas en memoria compartida.
+
+	Los arreglos son vistas directas del bloque de memoria compartida en el que escribieron los procesos de
+	trabajo; no se copian ni se serializan. Cada vista (incluidas las columnas de `dataframe`) mantiene mapeado el
+	bloque, que se cierra y elimina cuando ya no queda ninguna (ver `_BloqueCompartido`).
+
+	Attributes:
+		P, T, v, u, h, s (np.ndarray): Arreglos de forma (n_configuraciones, n_filas).
+		nombres (np.ndarray): Nombre de cada fila de un ciclo ("1", "1.1", ...), común a todas las configuraciones.
+		proceso, subindice (np.ndarray): Índice del proceso y subíndice de cada fila, como en `generar_dataframes(opcion=2)`.
+		errores (list): Mensaje de error de cada configuración, o `None`; las filas con error quedan en `NaN`.
+	"""
+
+	def __init__(self, memoria, n_configuraciones, nombres, proceso, subindice, errores):
+		self._memoria = memoria
+		self.nombres = nombres
+		self.proceso = proceso
+		self.subindice = subindice
+		self.errores = errores
+		datos = np.asarray(_BloqueCompartido(memoria, (len(_PROPIEDADES_BUFFER), n_configuraciones, len(nombres))))
+		for prop, arreglo in zip(_PROPIEDADES_BUFFER, datos):
+			setattr(self, prop, arreglo)
+
+	def dataframe(self):
+		"""
+		DataFrame largo con las columnas de `generar_dataframes(opcion=2)` más 'configuracion'; las columnas de
+		propiedades son vistas de la memoria compartida, sin copia.
+
+		Returns:
+			pandas.DataFrame: Una fila por estado y configuración.
+		"""
+		import pandas as pd
+
+		n_configuraciones, n_filas = self.P.shape
+		columnas = {'configuracion': np.repeat(np.arange(n_configuraciones), n_filas),
+					'nombre': np.tile(self.nombres, n_configuraciones),
+					'proceso': np.tile(self.proceso, n_configuraciones),
+					'subindice': np.tile(self.subindice, n_configuraciones)}
+		for prop, columna in zip(_PROPIEDADES_BUFFER, _COLUMNAS_BUFFER):
+			columnas[columna] = getattr(self, prop).reshape(-1)
+		return pd.DataFrame(columnas, copy=False)
+
+	def liberar(self):
+		"""
+		Suelta los arreglos del resultado. El bloque de memoria compartida se cierra y elimina en cuanto tampoco
+		quedan vistas obtenidas antes (arreglos o DataFrames); mientras existan, siguen siendo válidas.
+		"""
+		for prop in _PROPIEDADES_BUFFER:
+			setattr(self, prop, None)
+
+class _BloqueCompartido:
+	"""
+	Dueño de un bloque de memoria compartida, expuesto a NumPy como arreglo float64 mediante `__array_interface__`.
+
+	Los arreglos construidos con `np.asarray(bloque)`, y todas sus vistas, guardan el bloque como `base`, de modo
+	que el mapeo no se cierra mientras alguna de ellas siga viva: el bloque se cierra y elimina (`unlink`) solo
+	cuando se recolecta la última.
+	"""
+
+	def __init__(self, memoria, forma):
+		self.memoria = memoria
+		# Dirección del mapeo; el objeto ctypes se descarta en seguida para no dejar el búfer exportado
+		puntero = ctypes.c_char.from_buffer(memoria.buf)
+		direccion = ctypes.addressof(puntero)
+		del puntero
+		self.__array_interface__ = {'shape': tuple(forma), 'typestr': np.dtype(np.float64).str,
+									'data': (direccion, False), 'version': 3}
+		weakref.finalize(self, _liberar_memoria, memoria)
+
+def _liberar_memoria(memoria):
+	memoria.close()
+	memoria.unlink()
+
+def barrer_estados(construir_ciclo, configuraciones, modelo=None, n_procesos=None, tamano_bloque=None, progreso=None, silencioso=True):
+	"""
+	Resuelve un ciclo por configuración en varios procesos y reúne todos sus estados en memoria compartida.
+
+	El proceso principal resuelve la primera configuración para conocer el número de filas de cada ciclo y
+	reserva un bloque de `multiprocessing.shared_memory` para P, T, v, u, h y s de todas las configuraciones.
+	Cada proceso de trabajo escribe sus filas directamente en ese bloque, en la posición de su configuración, y
+	solo devuelve los mensajes de error; los estados nunca se serializan.
+
+	Args:
+		construir_ciclo (callable): Función del nivel superior de un módulo, con firma
+			`construir_ciclo(modelo, **configuracion)`, que devuelve un `CicloTermodinamico` ya resuelto. Todas
+			las configuraciones deben producir el mismo número de estados internos.
+		configuraciones, modelo, n_procesos, tamano_bloque, progreso, silencioso: Como en `barrer`.
+
+	Returns:
+		ResultadoEstados: Arreglos de forma (n_configuraciones, n_filas) sobre la memoria compartida.
+	"""
+	configuraciones = _lista_configuraciones(configuraciones)
+	total = len(configuraciones)
+	if total == 0:
+		raise ValueError("Se requiere al menos una configuración.")
+	n_procesos = n_procesos or os.cpu_count() or 1
+	if n_procesos > 1:
+		_comprobar_modelo_serializable(modelo)
+	tamano_bloque = tamano_bloque or max(1, math.ceil(total/(4*n_procesos)))
+
+	modelo_local = modelo.construir() if isinstance(modelo, EspecificacionModelo) else modelo
+	with _silenciar(silencioso):
+		nombres, valores = construir_ciclo(modelo_local, **configuraciones[0])._columnas_completas()
+	n_filas = len(nombres)
+
+	forma = (len(_PROPIEDADES_BUFFER), total, n_filas)
+	memoria = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(forma))*8))
+	np.ndarray(forma, dtype=np.float64, buffer=memoria.buf).fill(np.nan)
+
+	errores = [None]*total
+	completadas = 0
+	def recibir(inicio, errores_bloque):
+		nonlocal completadas
+		errores[inicio:inicio + len(errores_bloque)] = errores_bloque
+		completadas += len(errores_bloque)
+		if progreso is not None:
+			progreso(completadas, total)
+
+	def fallo_bloque(mensaje, inicio, bloque):
+		# El proceso pudo haber escrito parte del bloque antes de fallar
+		np.ndarray(forma, dtype=np.float64, buffer=memoria.buf)[:, inicio:inicio + len(bloque)] = np.nan
+		return [mensaje]*len(bloque)
+
+	bloques = [(inicio, configuraciones[inicio:inicio + tamano_bloque]) for inicio in range(0, total, tamano_bloque)]
+	argumentos = (construir_ciclo, modelo, memoria.name, forma, silencioso)
+	try:
+		if n_procesos == 1:
+			for inicio, bloque in bloques:
+				recibir(*_escribir_bloque(*argumentos, inicio, bloque))
+		else:
+			with concurrent.futures.ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+				_ejecutar_bloques(ejecutor, _escribir_bloque, argumentos, bloques, recibir, fallo_bloque)
+	except BaseException:
+		_liberar_memoria(memoria)
+		raise
+	return ResultadoEstados(memoria, total, nombres, valores['proceso'], valores['subindice'], errores)
+
+def _escribir_bloque(construir_ciclo, modelo, nombre_memoria, forma, silencioso, inicio, bloque):
+	"""
+	Resuelve un bloque de configuraciones y escribe sus estados en la memoria compartida.
+
+	Returns:
+		tuple[int, list]: Posición del bloque y mensaje de error (o `None`) de cada configuración.
+	"""
+	if isinstance(modelo, EspecificacionModelo):
+		modelo = modelo.construir()
+	memoria = shared_memory.SharedMemory(name=nombre_memoria)
+	try:
+		datos = np.ndarray(forma, dtype=np.float64, buffer=memoria.buf)
+		errores = []
+		for k, configuracion in enumerate(bloque, start=inicio):
+			try:
+				with _silenciar(silencioso):
+					_, valores = construir_ciclo(modelo, **configuracion)._columnas_completas()
+				if len(valores['P']) != forma[2]:
+					raise ValueError(f"El ciclo tiene {len(valores['P'])} estados y se esperaban {forma[2]}.")
+				for p, prop in enumerate(_PROPIEDADES_BUFFER):
+					datos[p, k] = valores[prop]
+				errores.append(None)
+			except Exception as error:
+				errores.append(f"{type(error).__name__}: {error}")
+		del datos
+	finally:
+		memoria.close()
+	return inicio, errores
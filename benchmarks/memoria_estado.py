@@ -0,0 +1,91 @@
+"""
+Memoria por estado y costo de acceso a las propiedades de `Estado`.
+
+Mide, con `tracemalloc`, los bytes que ocupa cada estado calculado (el objeto más los valores de sus
+propiedades) y los compara con un punto interno guardado en `AlmacenEstados`. También mide el tiempo de lectura y
+asignación de una propiedad, de la carga de una fila completa con `Estado.cargar`, del cálculo de un estado a
+partir de (P, T) y de la construcción de un ciclo de cuatro procesos con `n_values` por defecto.
+
+Uso (desde la raíz del repositorio):
+	python benchmarks/memoria_estado.py [n_estados]
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from ciclo_estados import AlmacenEstados, CicloTermodinamico, Estado
+from modelos import ModeloGasIdeal
+
+def bytes_por_estado(modelo, n):
+	"""Bytes asignados por cada estado calculado a partir de (P, T), incluidos los valores de sus propiedades."""
+	P = np.linspace(1e5, 1e6, n).tolist()
+	tracemalloc.start()
+	inicial = tracemalloc.get_traced_memory()[0]
+	estados = []
+	for k in range(n):
+		estado = Estado(modelo, k)
+		estado.actualizar(P=P[k], T=300.0)
+		modelo.calcular_estado(estado)
+		estados.append(estado)
+	total = tracemalloc.get_traced_memory()[0] - inicial
+	tracemalloc.stop()
+	# La lista que guarda los estados no cuenta
+	return (total - sys.getsizeof(estados))/n
+
+def bytes_por_punto_interno(n):
+	"""Bytes por punto interno en el almacenamiento columnar de un ciclo."""
+	almacen = AlmacenEstados(1)
+	valores = {nombre: np.linspace(1.0, 2.0, n) for nombre in ('P', 'T', 'v', 'u', 'h', 's')}
+	almacen.asignar_proceso(0, **valores)
+	arreglos = [getattr(almacen, nombre) for nombre in AlmacenEstados.propiedades] + [almacen.proceso]
+	return sum(arreglo.nbytes for arreglo in arreglos)/n
+
+def tiempos(modelo, repeticiones=100_000):
+	"""Nanosegundos por operación."""
+	estado = Estado(modelo, 1)
+	estado.actualizar(P=1e5, T=300.0)
+	modelo.calcular_estado(estado)
+	fila = {nombre: getattr(estado, nombre) for nombre in Estado.propiedades}
+	def medir(funcion, numero):
+		# El mínimo de varias repeticiones es el menos afectado por otros procesos
+		return 1e9*min(timeit.repeat(funcion, number=numero, repeat=5))/numero
+	def calcular():
+		nuevo = Estado(modelo, 1)
+		nuevo.actualizar(P=1e5, T=300.0)
+		modelo.calcular_estado(nuevo)
+	return {'lectura': medir(lambda: estado.P, repeticiones),
+			'asignacion': medir(lambda: setattr(estado, 'h', 1.0), repeticiones),
+			'cargar (7 propiedades)': medir(lambda: estado.cargar(**fila), repeticiones//10),
+			'estado (P, T)': medir(calcular, repeticiones//50),
+			'ciclo n_values=35': medir(lambda: ciclo_ericsson(modelo), 20)}
+
+def ciclo_ericsson(modelo):
+	"""Ciclo de cuatro procesos (dos isotérmicos y dos isobáricos) con el muestreo por defecto."""
+	ciclo = CicloTermodinamico(modelo, n_estados=4)
+	e = ciclo.estados
+	ciclo.agregar_estado(1, T=1200)
+	ciclo.agregar_estado(2, T=1200)
+	ciclo.agregar_estado(3, T=300.15, P=120e3)
+	ciclo.agregar_estado(4)
+	calor = -150e3
+	ciclo.proceso_in_or_out_calor(e[2], e[3], calor)
+	ciclo.proceso_isobarico(e[1], e[2])
+	ciclo.proceso_isobarico(e[3], e[0])
+	ciclo.proceso_in_or_out_calor(e[0], e[1], -calor*e[0].T/e[2].T)
+	return ciclo
+
+def main(n=20_000):
+	modelo = ModeloGasIdeal(R_gas=287.0, cp=1005.0, cv=718.0)
+	print(f"Estado (__slots__):      {bytes_por_estado(modelo, n):8.1f} bytes por estado ({n} estados)")
+	print(f"  objeto sin propiedades: {sys.getsizeof(Estado(modelo)):7d} bytes")
+	print(f"AlmacenEstados:          {bytes_por_punto_interno(n):8.1f} bytes por punto interno")
+	for nombre, ns in tiempos(modelo).items():
+		print(f"{nombre:25s}{ns/1e3:10.2f} µs")
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,70 @@
+"""
+Tiempo de arranque: importar `modelos` y `ciclo_estados` y calcular un estado de gas ideal.
+
+Cada medición se hace en un intérprete nuevo. Se informa el mínimo de varias repeticiones, junto con el de
+importar solo NumPy (dependencia inevitable), y se comprueba que el arranque no importe matplotlib, pandas, SciPy
+ni sympy, que solo se cargan al usar las funciones que los necesitan (gráficos, DataFrames, integración numérica,
+resolución de estados acoplados). Termina con código 1 si alguna comprobación falla, para usarlo como guarda.
+
+Uso (desde la raíz del repositorio):
+	python benchmarks/tiempo_importacion.py [repeticiones] [limite_ms]
+"""
+import json
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos pesados que el arranque no debe importar
+DIFERIDOS = ('matplotlib', 'pandas', 'scipy', 'sympy')
+
+ARRANQUE = f"""
+import sys, time
+inicio = time.perf_counter()
+sys.path.insert(0, {RAIZ!r})
+from modelos import ModeloGasIdeal
+from ciclo_estados import Estado
+modelo = ModeloGasIdeal(R_gas=287.0, cp=1005.0, cv=718.0)
+estado = Estado(modelo, 1)
+estado.actualizar(P=1e5, T=300.0)
+modelo.calcular_estado(estado)
+import json
+print(json.dumps({{'segundos': time.perf_counter() - inicio,
+				  'cargados': [m for m in {DIFERIDOS!r} if m in sys.modules]}}))
+"""
+
+SOLO_NUMPY = """
+import time
+inicio = time.perf_counter()
+import numpy
+import json
+print(json.dumps({'segundos': time.perf_counter() - inicio, 'cargados': []}))
+"""
+
+def medir(codigo, repeticiones):
+	"""Ejecuta `codigo` en intérpretes nuevos y devuelve el menor tiempo (s) y los módulos diferidos cargados."""
+	mediciones = []
+	for _ in range(repeticiones):
+		salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+		mediciones.append(json.loads(salida.stdout.strip().splitlines()[-1]))
+	return min(m['segundos'] for m in mediciones), sorted({nombre for m in mediciones for nombre in m['cargados']})
+
+def main(repeticiones=5, limite_ms=50.0):
+	numpy_s, _ = medir(SOLO_NUMPY, repeticiones)
+	arranque_s, cargados = medir(ARRANQUE, repeticiones)
+	adicional_ms = 1e3*(arranque_s - numpy_s)
+	print(f"import numpy:                      {1e3*numpy_s:8.1f} ms")
+	print(f"import + estado de gas ideal:      {1e3*arranque_s:8.1f} ms")
+	print(f"  adicional a numpy:               {adicional_ms:8.1f} ms (límite {limite_ms:.0f} ms)")
+	print(f"  módulos diferidos importados:    {', '.join(cargados) or 'ninguno'}")
+	correcto = not cargados and adicional_ms <= limite_ms
+	if not correcto:
+		print("El arranque supera el límite o importa dependencias que deberían diferirse.")
+	return correcto
+
+if __name__ == "__main__":
+	argumentos = sys.argv[1:]
+	repeticiones = int(argumentos[0]) if len(argumentos) > 0 else 5
+	limite_ms = float(argumentos[1]) if len(argumentos) > 1 else 50.0
+	sys.exit(0 if main(repeticiones, limite_ms) else 1)
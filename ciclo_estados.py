@@ -1,6 +1,10 @@
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
+
+from diagnosticos import Diagnosticos, diagnosticos_de
+from integracion import integrar
+
+# Columna de cada propiedad en los DataFrames del ciclo
+_COLUMNAS = {"P": "P [Pa]", "T": "T [K]", "v": "v [m³/kg]", "u": "u [J/kg]", "h": "h [J/kg]", "s": "s [J/kg·K]"}
 
 # Definición de la clase estado
 class Estado:
@@ -17,8 +21,22 @@ class Estado:
 		h (float): Entalpía específica en J/kg.
 		s (float): Entropía específica en J/kg·K.
 		x (float): Calidad del fluido, cantidad del fluido que se encuentra en vapor, constante en cada estado.
+		diagnosticos (Diagnosticos | None): Recolector al que los modelos reportan los eventos del estado; lo asigna el ciclo.
+
+	El estado distingue las propiedades de entrada (asignadas por el usuario o por las relaciones de un proceso)
+	de las derivadas (calculadas por el modelo). Asignar una propiedad es una escritura directa, sin
+	intermediarios; las entradas se marcan donde se definen (`actualizar`, relaciones del ciclo) y, al terminar
+	un cálculo, el estado guarda los valores calculados. Mientras ninguna propiedad difiera de ellos el estado
+	está vigente y los modelos no lo vuelven a calcular; al comenzar el siguiente cálculo, las propiedades que
+	cambiaron desde entonces (por ejemplo `estado.T = ...`) pasan a ser entradas y las derivadas se descartan.
 	"""
 
+	propiedades = ('P', 'T', 'v', 'u', 'h', 's', 'x')
+	# Bit de cada propiedad en las máscaras de entradas y derivadas
+	_BITS = {nombre: 1 << k for k, nombre in enumerate(propiedades)}
+
+	# Sin __dict__ por instancia: cada estado ocupa un bloque fijo de referencias
+	__slots__ = ('nombre', 'modelo', 'diagnosticos', '_entradas', '_derivadas', '_calculado') + propiedades
 
 	def __init__(self, modelo, nombre=0):
 		"""
@@ -30,6 +48,12 @@ class Estado:
 		"""
 		self.nombre = nombre
 		self.modelo = modelo
+		self.diagnosticos = None
+
+		# Seguimiento de entradas y propiedades derivadas, como máscaras de bits (ver `_BITS`)
+		self._entradas = 0
+		self._derivadas = 0
+		self._calculado = None # Valores de las propiedades al terminar el último cálculo
 
 		# Propiedades termodinámicas
 		self.P = None # Presion Pa
@@ -50,16 +74,112 @@ class Estado:
 
 		# A continuacion se presentan los casos que va a revisar el programa si se tiene los datos y calcula los datos faltantes si es posible
 
-		atributos_validos = ['P', 'T', 'v', 'u', 'h', 's','x']
 		for key, value in kwargs.items():
-			if key not in atributos_validos:
+			if key not in Estado._BITS:
 				raise AttributeError(f"'{key}' no es una propiedad válida del estado.")
 			
 			# Validación especial para calidad (x) en gases ideales
 			if key == 'x':
 				if self.modelo.__class__.__name__ == "ModeloGasIdeal" and value != 1:
 					raise AttributeError("Gas ideal no puede tener calidad diferente de 1")
-			setattr(self, key, value)
+			self.asignar_entrada(key, value)
+
+	def asignar_entrada(self, nombre, valor):
+		"""
+		Asigna una propiedad como dato del estado, sin validarla (`None` la deja como desconocida).
+
+		Args:
+			nombre (str): Propiedad, uno de `Estado.propiedades`.
+			valor (float | None): Valor de la propiedad.
+		"""
+		bit = Estado._BITS[nombre]
+		setattr(self, nombre, valor)
+		self._entradas = self._entradas | bit if valor is not None else self._entradas & ~bit
+		self._derivadas &= ~bit
+
+	def cargar(self, **valores):
+		"""
+		Asigna de una vez propiedades ya calculadas por el modelo (por ejemplo una fila de `AlmacenEstados`), sin
+		validar cada llave. Las propiedades que no son entradas quedan como derivadas y el estado queda vigente si
+		todas están definidas.
+
+		Args:
+			**valores: Propiedades del estado; las llaves deben ser nombres de `Estado.propiedades`.
+		"""
+		for nombre, valor in valores.items():
+			setattr(self, nombre, valor)
+		self.terminar_calculo()
+
+	def _valores(self):
+		return (self.P, self.T, self.v, self.u, self.h, self.s, self.x)
+
+	def _definidas(self):
+		"""Máscara de las propiedades con valor."""
+		# Mismo orden que `propiedades`
+		return ((self.P is not None) | (self.T is not None) << 1 | (self.v is not None) << 2 | (self.u is not None) << 3
+				| (self.h is not None) << 4 | (self.s is not None) << 5 | (self.x is not None) << 6)
+
+	def _cambiadas(self):
+		"""Máscara de las propiedades cuyo valor cambió desde el último cálculo."""
+		if self._calculado is None:
+			return 0
+		mascara = 0
+		for bit, actual, calculado in zip(Estado._BITS.values(), self._valores(), self._calculado):
+			if actual is not calculado and not (actual == calculado):
+				mascara |= bit
+		return mascara
+
+	@staticmethod
+	def _nombres(mascara):
+		"""Nombres de las propiedades presentes en una máscara de bits."""
+		return frozenset(nombre for nombre, bit in Estado._BITS.items() if mascara & bit)
+
+	@property
+	def entradas(self):
+		"""frozenset: Propiedades asignadas como datos del estado."""
+		return Estado._nombres((self._entradas | self._cambiadas()) & self._definidas())
+
+	@property
+	def derivadas(self):
+		"""frozenset: Propiedades calculadas por el modelo."""
+		return Estado._nombres(self._derivadas & ~self._cambiadas())
+
+	@property
+	def vigente(self):
+		"""bool: `True` si el estado está completamente calculado y ninguna propiedad cambió desde entonces."""
+		calculado = self._calculado
+		return calculado is not None and calculado == self._valores() and None not in calculado
+
+	def comenzar_calculo(self):
+		"""
+		Prepara el estado para que el modelo lo calcule: las propiedades conocidas que no son derivadas vigentes
+		pasan a ser entradas, y las derivadas se descartan. Lo que el modelo asigne hasta `terminar_calculo` queda
+		como derivado.
+		"""
+		if self._calculado is None and not self._derivadas:
+			# Primer cálculo: todo lo conocido es dato (la calidad, solo si se asignó como tal)
+			self._entradas = self._definidas() & ~_BIT_X | self._entradas & _BIT_X
+			return
+		cambiadas = self._cambiadas()
+		derivadas = self._derivadas & ~cambiadas
+		entradas = 0
+		for nombre, bit in Estado._BITS.items():
+			if derivadas & bit:
+				setattr(self, nombre, 1 if nombre == 'x' else None)
+			elif getattr(self, nombre) is not None and (nombre != 'x' or (self._entradas | cambiadas) & bit):
+				entradas |= bit
+		self._entradas = entradas
+		self._derivadas = 0
+		self._calculado = None
+
+	def terminar_calculo(self):
+		"""
+		Cierra el cálculo del modelo: las propiedades definidas que no son entradas quedan como derivadas, y el
+		estado queda vigente si todas están definidas.
+		"""
+		self._derivadas = self._definidas() & ~self._entradas
+		self._calculado = self._valores()
+
 	def calcular_propiedades(self):
 		'''
 		Calcula las propiedades termodinamicas de los estados del ciclo.
@@ -89,6 +209,105 @@ class Estado:
 		"""
 		return {self.nombre : {"P" : self.P, "T" : self.T, "v" : self.v, "u" : self.u, "h" : self.h, "s" : self.s}}
 
+_BIT_X = Estado._BITS['x']
+
+# Definición del almacenamiento columnar de estados internos
+class AlmacenEstados:
+	"""
+	Almacenamiento columnar (estructura de arreglos) de los estados internos de un ciclo.
+
+	Cada propiedad termodinámica se guarda en un único arreglo float64. Los puntos internos de todos los
+	procesos se ubican uno tras otro, ordenados por proceso, y el arreglo `proceso` indica a qué proceso
+	pertenece cada punto. Los objetos `Estado` solo se construyen cuando se solicitan explícitamente.
+
+	Attributes:
+		n_procesos (int): Número de procesos (tramos) del ciclo.
+		P, T, v, u, h, s, x (np.ndarray): Propiedades de cada punto interno.
+		proceso (np.ndarray): Índice del proceso al que pertenece cada punto interno.
+		inicios (np.ndarray): Posición del primer punto de cada proceso, de largo n_procesos + 1.
+		version (int): Número de modificaciones; cambia cada vez que se reemplazan los puntos de un proceso.
+	"""
+
+	propiedades = ('P', 'T', 'v', 'u', 'h', 's', 'x')
+
+	def __init__(self, n_procesos):
+		self.n_procesos = n_procesos
+		self.version = 0
+		self.inicios = np.zeros(n_procesos + 1, dtype=np.intp)
+		self.proceso = np.empty(0, dtype=np.intp)
+		for nombre in self.propiedades:
+			setattr(self, nombre, np.empty(0))
+
+	def __len__(self):
+		return len(self.proceso)
+
+	def tramo(self, i):
+		"""
+		Devuelve el rango de posiciones que ocupan los puntos internos del proceso i.
+
+		Args:
+			i (int): Índice del proceso.
+
+		Returns:
+			slice: Rango aplicable a cualquiera de los arreglos de propiedades.
+		"""
+		return slice(self.inicios[i], self.inicios[i + 1])
+
+	def n_puntos(self, i):
+		"""
+		Devuelve el número de puntos internos guardados para el proceso i.
+		"""
+		return int(self.inicios[i + 1] - self.inicios[i])
+
+	def asignar_proceso(self, i, **valores):
+		"""
+		Reemplaza los puntos internos del proceso i por los valores dados.
+
+		Args:
+			i (int): Índice del proceso.
+			**valores: Arreglos (o escalares) con las propiedades de cada punto. Las propiedades que no se
+				entreguen quedan como NaN, excepto la calidad `x`, que por defecto es 1.
+		"""
+		n = max(np.size(valor) for valor in valores.values()) if valores else 0
+		ini, fin = self.inicios[i], self.inicios[i + 1]
+		for nombre in self.propiedades:
+			por_defecto = 1.0 if nombre == 'x' else np.nan
+			columna = np.asarray(valores.get(nombre, por_defecto), dtype=float)
+			if columna.shape != (n,):
+				columna = np.broadcast_to(columna, (n,))
+			actual = getattr(self, nombre)
+			setattr(self, nombre, np.concatenate((actual[:ini], columna, actual[fin:])))
+		self.proceso = np.concatenate((self.proceso[:ini], np.full(n, i, dtype=np.intp), self.proceso[fin:]))
+		self.inicios[i + 1:] += n - (fin - ini)
+		self.version += 1
+
+	def fila(self, k):
+		"""
+		Devuelve las propiedades del punto interno k como diccionario.
+		"""
+		return {nombre: float(getattr(self, nombre)[k]) for nombre in self.propiedades}
+
+class _VistaEstadosInternos:
+	"""
+	Vista de solo lectura que construye objetos `Estado` a partir del almacenamiento columnar del ciclo.
+
+	Mantiene la forma de acceso `ciclo.estados_internos[i][j]`, pero cada `Estado` se crea al momento de pedirlo.
+	"""
+
+	def __init__(self, ciclo):
+		self._ciclo = ciclo
+
+	def __len__(self):
+		return len(self._ciclo.estados)
+
+	def __getitem__(self, i):
+		n = self._ciclo.almacen.n_puntos(i)
+		return [self._ciclo.estado_interno(i, j) for j in range(n)]
+
+	def __iter__(self):
+		for i in range(len(self)):
+			yield self[i]
+
 # Definición de la clase CicloTermodinamico
 class CicloTermodinamico:
 	"""
@@ -99,17 +318,76 @@ class CicloTermodinamico:
 		n_estados (int): Número de estados que conforman el ciclo.
 		n_values (int): Número de estados internos a cada proceso del ciclo, debe ser un número mayor o igual a 0. Default n_values = 35.
 		estados (list[Estado]): Lista de estados que componen el ciclo.
+		almacen (AlmacenEstados): Propiedades de los estados internos de cada proceso, guardadas por columnas.
+		procesos (np.ndarray): (tipo, estado_in, estado_out, parametros) de cada proceso ejecutado con `proceso_*`,
+			en la posición de su estado de entrada; `None` si el proceso aún no se ejecuta.
+		tolerancia (float | None): Tolerancia relativa del trabajo en el muestreo adaptativo; `None` si es fijo.
+		muestreo (np.ndarray): Diccionario {'n_puntos', 'error_trabajo', 'convergido'} de cada proceso ejecutado. En
+			el muestreo fijo el error no se estima y es `None`.
 		direccion (str): Dirección en la que se recorre el ciclo. Use "horario" o "antihorario".
+		diagnosticos (Diagnosticos): Avisos y comprobaciones de congruencia registrados al resolver el ciclo.
+		perezoso (bool): Si los estados internos de cada proceso se calculan solo cuando se necesitan (ver `almacen`).
+
+	Los procesos pueden ejecutarse uno a uno con los métodos `proceso_*`, en un orden que propague suficiente
+	información, o declararse con `declarar_proceso` y `relacionar` y resolverse todos juntos con `resolver`.
 	"""
 
-	def __init__(self, modelo,n_estados, n_values = 35):
+	# Propiedad que conserva cada tipo de proceso
+	_PROPIEDAD_CONSERVADA = {'isocorico': 'v', 'isotermico': 'T', 'isobarico': 'P', 'isoentalipico': 'h',
+							 'isoentropico': 's', 'in_or_out_calor': 'T'}
+
+	def __init__(self, modelo,n_estados, n_values = 35, diagnosticos = None, tolerancia = None, max_niveles = 10, perezoso = False):
+		"""
+		Args:
+			modelo (ModeloTermodinamico): Modelo termodinámico utilizado.
+			n_estados (int): Número de estados del ciclo.
+			n_values (int): Número de estados internos a cada proceso, si el muestreo es fijo.
+			diagnosticos (Diagnosticos | str, optional): Recolector de eventos (para compartirlo entre ciclos) o el
+				modo de uno nuevo ('registrar', 'imprimir' o 'silencioso'). Por defecto, uno nuevo en el modo
+				predeterminado del módulo `diagnosticos`.
+			tolerancia (float, optional): Si se indica, el muestreo de cada proceso es adaptativo (ver `_muestrear`):
+				se refina hasta que el error estimado del trabajo del proceso, integrado con la regla de Simpson, sea
+				menor que `tolerancia` por el valor absoluto del trabajo. Por defecto el muestreo es fijo, de `n_values`.
+			max_niveles (int): Número máximo de subdivisiones de un tramo en el muestreo adaptativo.
+			perezoso (bool): Si es verdadero, cada `proceso_*` solo resuelve la trayectoria del proceso y guarda su
+				función (la devuelta por `resolver_*`) con los estados extremos; los estados internos de todos los
+				procesos pendientes se calculan juntos la primera vez que se consulta `almacen` (DataFrame completo,
+				gráficos, integración numérica) y quedan guardados. Útil cuando solo interesan los estados principales
+				y la eficiencia. En este modo `muestreo` se llena también al calcularlos.
+		"""
 		self.modelo = modelo
+		self.perezoso = perezoso
+		self.tolerancia = tolerancia
+		self.max_niveles = max_niveles
+		self.diagnosticos = diagnosticos if isinstance(diagnosticos, Diagnosticos) else Diagnosticos(diagnosticos)
 		self.n_values = n_values +2
 		self.estados = np.empty(n_estados, dtype=object) # Se conocen la cantidad de estados que tiene el ciclo
-		self.estados_internos = np.empty((n_estados,n_values), dtype=object) # Se genera una lista para los estados internos entre cada proceso.
+		self._almacen = AlmacenEstados(n_estados) # Estados internos de cada proceso, una columna por propiedad.
+		self._pendientes = {} # Índice de proceso -> función que da las entradas de `calcular_estados` de sus estados internos
+		self._dataframes = {} # Opción de `generar_dataframes` -> (llave, DataFrames) de la última llamada
+		self.procesos = np.empty(n_estados, dtype=object) # (tipo, estado_in, estado_out, parametros) de cada proceso ejecutado
+		self.muestreo = np.empty(n_estados, dtype=object) # Puntos usados y error estimado del trabajo de cada proceso
+		self.procesos_declarados = [] # (tipo, estado_in, estado_out, kwargs) de cada proceso declarado
+		self.relaciones = [] # Relaciones adicionales entre propiedades de los estados
 		self._indice_estado_actual = 0  # Contador de estado
 		self._indice_proceso_actual = 0 # Contador de proceso
 
+	@property
+	def almacen(self):
+		"""
+		AlmacenEstados: Propiedades de los estados internos de cada proceso. Al consultarlo se calculan antes los
+		estados internos de los procesos pendientes (modo perezoso).
+		"""
+		self._materializar()
+		return self._almacen
+
+	@property
+	def estados_internos(self):
+		"""
+		Estados internos de cada proceso como objetos `Estado`, construidos a partir de `almacen` al accederlos.
+		"""
+		return _VistaEstadosInternos(self)
+
 	def agregar_estado(self, nombre, **kwargs):
 		"""
 		Crea y agrega un nuevo estado al ciclo. Se espera que se coloquen en el orden que se va a recorrer el ciclo.
@@ -123,21 +401,152 @@ class CicloTermodinamico:
 			raise IndexError("Se han agregado más estados de los permitidos.")
 
 		estado = Estado(self.modelo, nombre)
+		estado.diagnosticos = self.diagnosticos
 		estado.actualizar(**kwargs)
 		self.estados[self._indice_estado_actual] = estado
 		self._indice_estado_actual +=1
 
-	def _generar_estado_interno(self, **kwargs):
+	def estado_interno(self, i, j):
 		"""
-		Genera un nuevo estado interno a un proceso del ciclo.
+		Construye el objeto `Estado` correspondiente a un punto interno guardado en `almacen`.
 
 		Args:
-			**kwargs: Propiedades conocidas para calcular el estado.
+			i (int): Índice del proceso.
+			j (int): Índice del punto interno dentro del proceso.
+
+		Returns:
+			Estado: Estado con las propiedades del punto solicitado.
+		"""
+		if not 0 <= j < self.almacen.n_puntos(i):
+			raise IndexError(f"El proceso {i} no tiene el estado interno {j}.")
+		estado = Estado(self.modelo, f"{self.estados[i].nombre}.{j + 1}")
+		estado.diagnosticos = self.diagnosticos
+		# Las propiedades guardadas ya fueron calculadas por el modelo
+		estado.cargar(**self.almacen.fila(self.almacen.inicios[i] + j))
+		return estado
+
+	def _indice_proceso(self, estado_in):
+		"""
+		Devuelve el índice del proceso que inicia en `estado_in`, es decir, su posición en `self.estados`.
+		"""
+		for i, estado in enumerate(self.estados):
+			if estado is estado_in:
+				return i
+		raise ValueError(f"El estado {estado_in.nombre} no pertenece al ciclo.")
+
+	def _guardar_proceso(self, tipo, estado_in, estado_out, entradas, **parametros):
+		"""
+		Registra el tipo y los parámetros del proceso que inicia en `estado_in` y deja pendiente el cálculo de sus
+		estados internos, que se hace de inmediato salvo en modo perezoso.
+
+		Args:
+			tipo (str): Tipo de proceso, como en `declarar_proceso`.
+			estado_in (Estado): Estado de entrada del proceso.
+			estado_out (Estado): Estado de salida del proceso.
+			entradas (callable): Sin argumentos; muestrea el proceso y devuelve el par de propiedades de sus estados
+				internos que recibe `calcular_estados` (por ejemplo {'v': ..., 'P': ...}).
+			**parametros: Parámetros del proceso (por ejemplo `calor`).
+		"""
+		i = self._indice_proceso(estado_in)
+		self.procesos[i] = (tipo, estado_in, estado_out, parametros)
+		self._pendientes[i] = entradas
+		if not self.perezoso:
+			self._materializar()
+
+	def _materializar(self):
+		"""
+		Calcula y guarda en `almacen` los estados internos de los procesos pendientes. Los procesos cuyas entradas
+		son el mismo par de propiedades se calculan en una sola llamada a `calcular_estados`.
+		"""
+		if not self._pendientes:
+			return
+		pendientes, self._pendientes = self._pendientes, {}
+		grupos = {}
+		for i, entradas in pendientes.items():
+			valores = {nombre: np.atleast_1d(np.asarray(valor, dtype=float)) for nombre, valor in entradas().items()}
+			grupos.setdefault(tuple(sorted(valores)), []).append((i, valores))
+		for nombres, miembros in grupos.items():
+			resultado = self.modelo.calcular_estados(**{nombre: np.concatenate([valores[nombre] for _, valores in miembros])
+													   for nombre in nombres})
+			fin = 0
+			for i, valores in miembros:
+				inicio, fin = fin, fin + len(valores[nombres[0]])
+				self._almacen.asignar_proceso(i, **{prop: columna[inicio:fin] for prop, columna in resultado.items()})
+
+	def _muestrear(self, estado_in, inicio, fin, trayectoria):
+		"""
+		Elige los valores internos de la variable que recorre el proceso (v, o P en los isocóricos) y registra
+		cuántos puntos se usaron en `muestreo`.
+
+		Con muestreo fijo son `n_values` puntos equiespaciados. Con `tolerancia`, el tramo se divide en paneles y
+		cada panel se evalúa con la regla de Simpson en cinco puntos; los paneles cuyo error estimado (Richardson)
+		supera su parte proporcional de `tolerancia*|W|` se parten en dos, todos a la vez, hasta `max_niveles`
+		subdivisiones. Solo se evalúa la trayectoria dada por `resolver_*`, que es barata; los estados internos se
+		calculan después, una sola vez, en los puntos elegidos. Los tramos rectos (isocóricos, isobáricos) quedan con
+		tres puntos internos y los tramos curvos reciben más puntos donde más se curvan.
+
+		Args:
+			estado_in (Estado): Estado de entrada del proceso.
+			inicio, fin (float): Valores extremos de la variable del proceso.
+			trayectoria (callable): Recibe un arreglo de valores de la variable y devuelve (P, v) a lo largo del proceso.
+
+		Returns:
+			np.ndarray: Valores internos de la variable, sin los extremos.
+		"""
+		i = self._indice_proceso(estado_in)
+		if self.tolerancia is not None:
+			P_extremos, v_extremos = trayectoria(np.array([inicio, fin], dtype=float))
+		if self.tolerancia is None or P_extremos is None:
+			self.muestreo[i] = {'n_puntos': self.n_values - 2, 'error_trabajo': None, 'convergido': None}
+			return np.linspace(inicio, fin, self.n_values)[1:-1]
+
+		# Escala mínima del trabajo, para no refinar sin fin un proceso con trabajo casi nulo
+		escala_minima = 1e-12*np.max(np.abs(P_extremos))*abs(v_extremos[1] - v_extremos[0])
+		izquierda, derecha = np.array([inicio], dtype=float), np.array([fin], dtype=float)
+		aceptados, errores = [], []
+		for nivel in range(self.max_niveles + 1):
+			ancho = derecha - izquierda
+			x = np.column_stack((izquierda, izquierda + ancho/4, izquierda + ancho/2, izquierda + 3*ancho/4, derecha))
+			P, v = trayectoria(x)
+			W, error = integrar(P, v, 'simpson')
+			trabajo = sum(W_k for W_k, _ in aceptados) + W.sum()
+			escala = max(abs(trabajo), escala_minima)
+			permitido = self.tolerancia*escala*np.abs(ancho/(fin - inicio)) if fin != inicio else np.zeros(len(ancho))
+			listo = (error <= permitido) | (nivel == self.max_niveles)
+			aceptados += [(W_k, x_k) for W_k, x_k in zip(W[listo], x[listo])]
+			errores += list(error[listo])
+			if np.all(listo):
+				break
+			medio = x[~listo, 2]
+			izquierda, derecha = np.concatenate((izquierda[~listo], medio)), np.concatenate((medio, derecha[~listo]))
+
+		puntos = np.unique(np.concatenate([x_k for _, x_k in aceptados]))
+		if fin < inicio:
+			puntos = puntos[::-1]
+		error_total = float(np.sum(errores))
+		convergido = bool(error_total <= self.tolerancia*escala)
+		self.muestreo[i] = {'n_puntos': len(puntos) - 2, 'error_trabajo': error_total, 'convergido': convergido}
+		if not convergido:
+			self.diagnosticos.registrar('sin_convergencia', "El muestreo adaptativo del proceso que inicia en {} no alcanzó la tolerancia: error estimado {error:.3e} J/kg.",
+										estado_in.nombre, error=error_total)
+		return puntos[1:-1]
+
+	def _trayectoria(self, i, propiedad):
+		"""
+		Devuelve los valores de una propiedad a lo largo del proceso i, incluyendo los estados inicial y final.
+
+		Args:
+			i (int): Índice del proceso.
+			propiedad (str): Nombre de la propiedad ('P', 'T', 'v', 'u', 'h', 's' o 'x').
+
+		Returns:
+			np.ndarray: Valores en el orden estado inicial -> internos -> estado final.
 		"""
-		estado_interno = Estado(self.modelo)
-		estado_interno.actualizar(**kwargs)
-		estado_interno.calcular_propiedades()
-		return estado_interno
+		n = len(self.estados)
+		interno = getattr(self.almacen, propiedad)[self.almacen.tramo(i)]
+		inicio = getattr(self.estados[i], propiedad)
+		fin = getattr(self.estados[(i + 1) % n], propiedad)
+		return np.concatenate(([inicio], interno, [fin])).astype(float)
 
 	def proceso_isocorico(self, estado_in, estado_out):
 		'''
@@ -149,10 +558,10 @@ class CicloTermodinamico:
 		'''
 
 		result = self.modelo.resolver_isocorico(estado_in,estado_out)
-		P_values = np.linspace(estado_in.P,estado_out.P, self.n_values)[1:-1]
-		T_values = result(P_values)
-		for i in range(self.n_values-2):
-			self.estados_internos[estado_in.nombre-1][i] = self._generar_estado_interno(P = P_values[i], T=T_values[i])
+		def entradas():
+			P_values = self._muestrear(estado_in, estado_in.P, estado_out.P, lambda P: (P, np.full_like(P, estado_in.v)))
+			return {'P': P_values, 'T': result(P_values)}
+		self._guardar_proceso('isocorico', estado_in, estado_out, entradas)
 
 
 		self._indice_proceso_actual += 1
@@ -167,11 +576,10 @@ class CicloTermodinamico:
 		'''
 
 		result = self.modelo.resolver_isotermico(estado_in,estado_out)
-		v_values = np.linspace(estado_in.v,estado_out.v, self.n_values)[1:-1]
-
-		P_values = result(v_values)
-		for i in range(self.n_values-2):
-			self.estados_internos[estado_in.nombre-1][i] = self._generar_estado_interno(v = v_values[i], P=P_values[i])
+		def entradas():
+			v_values = self._muestrear(estado_in, estado_in.v, estado_out.v, lambda v: (result(v), v))
+			return {'v': v_values, 'P': result(v_values)}
+		self._guardar_proceso('isotermico', estado_in, estado_out, entradas)
 
 		self._indice_proceso_actual += 1
 
@@ -185,10 +593,10 @@ class CicloTermodinamico:
 		'''
 
 		result = self.modelo.resolver_isobarico(estado_in,estado_out)
-		v_values = np.linspace(estado_in.v,estado_out.v, self.n_values)[1:-1]
-		T_values = result(v_values)
-		for i in range(self.n_values-2):
-			self.estados_internos[estado_in.nombre-1][i] = self._generar_estado_interno(v = v_values[i], T=T_values[i])
+		def entradas():
+			v_values = self._muestrear(estado_in, estado_in.v, estado_out.v, lambda v: (np.full_like(v, estado_in.P), v))
+			return {'v': v_values, 'T': result(v_values)}
+		self._guardar_proceso('isobarico', estado_in, estado_out, entradas)
 
 		self._indice_proceso_actual += 1
 
@@ -202,10 +610,10 @@ class CicloTermodinamico:
 		'''
 
 		result = self.modelo.resolver_isoentalpico(estado_in,estado_out)
-		v_values = np.linspace(estado_in.v,estado_out.v, self.n_values)[1:-1]
-		P_values = result(v_values)
-		for i in range(self.n_values-2):
-			self.estados_internos[estado_in.nombre-1][i] = self._generar_estado_interno(v = v_values[i], P=P_values[i])
+		def entradas():
+			v_values = self._muestrear(estado_in, estado_in.v, estado_out.v, lambda v: (result(v), v))
+			return {'v': v_values, 'P': result(v_values)}
+		self._guardar_proceso('isoentalipico', estado_in, estado_out, entradas)
 
 		self._indice_proceso_actual += 1
 
@@ -219,10 +627,10 @@ class CicloTermodinamico:
 		'''
 
 		result = self.modelo.resolver_isoentropico(estado_in,estado_out)
-		v_values = np.linspace(estado_in.v,estado_out.v, self.n_values)[1:-1]
-		P_values = result(v_values)
-		for i in range(self.n_values-2):
-			self.estados_internos[estado_in.nombre-1][i] = self._generar_estado_interno(v=v_values[i], P = P_values[i])
+		def entradas():
+			v_values = self._muestrear(estado_in, estado_in.v, estado_out.v, lambda v: (result(v), v))
+			return {'v': v_values, 'P': result(v_values)}
+		self._guardar_proceso('isoentropico', estado_in, estado_out, entradas)
 
 		self._indice_proceso_actual += 1
 
@@ -236,10 +644,10 @@ class CicloTermodinamico:
 			calor (float): Calor de entrada (positivo) o salida (negativo) del proceso.
 		'''
 		result = self.modelo.resolver_in_or_out_calor(estado_in, estado_out, calor)
-		v_values = np.linspace(estado_in.v,estado_out.v, self.n_values)[1:-1]
-		P_values = result(v_values)
-		for i in range(self.n_values-2):
-			self.estados_internos[estado_in.nombre-1][i] = self._generar_estado_interno(v=v_values[i], P = P_values[i])
+		def entradas():
+			v_values = self._muestrear(estado_in, estado_in.v, estado_out.v, lambda v: (result(v), v))
+			return {'v': v_values, 'P': result(v_values)}
+		self._guardar_proceso('in_or_out_calor', estado_in, estado_out, entradas, calor=calor)
 
 		self._indice_proceso_actual += 1
 
@@ -261,6 +669,154 @@ class CicloTermodinamico:
 		self._indice_proceso_actual += 1 """
 
 
+	def declarar_proceso(self, tipo, estado_in, estado_out, **kwargs):
+		"""
+		Declara un proceso del ciclo sin resolverlo; los procesos declarados se resuelven con `resolver`.
+
+		Args:
+			tipo (str): Tipo de proceso: 'isocorico', 'isotermico', 'isobarico', 'isoentalipico', 'isoentropico'
+				o 'in_or_out_calor' (este último requiere `calor`).
+			estado_in (Estado): Estado de entrada en la secuencia del ciclo.
+			estado_out (Estado): Estado de salida en la secuencia del ciclo.
+			**kwargs: Argumentos adicionales del respectivo `proceso_*` (por ejemplo, `calor`).
+		"""
+		if tipo not in self._PROPIEDAD_CONSERVADA:
+			raise ValueError(f"Tipo de proceso desconocido: '{tipo}'. Opciones: {', '.join(self._PROPIEDAD_CONSERVADA)}.")
+		if tipo == 'in_or_out_calor' and 'calor' not in kwargs:
+			raise ValueError("El proceso 'in_or_out_calor' requiere el argumento 'calor'.")
+		self.procesos_declarados.append((tipo, estado_in, estado_out, kwargs))
+
+	def relacionar(self, estado, propiedad, origen, desplazamiento=0.0, factor=1.0):
+		"""
+		Declara una relación lineal entre propiedades de dos estados: estado.propiedad = factor*origen.propiedad + desplazamiento.
+
+		Sirve para datos que dependen de otro estado todavía no calculado, por ejemplo un recalentamiento con
+		un aumento de temperatura conocido: `ciclo.relacionar(e5, 'T', e4, desplazamiento=20)`.
+
+		Args:
+			estado (Estado): Estado cuya propiedad se define.
+			propiedad (str): Propiedad relacionada ('P', 'T', 'v', 'u', 'h' o 's').
+			origen (Estado): Estado de referencia.
+			desplazamiento (float): Término constante de la relación.
+			factor (float): Factor que multiplica la propiedad del estado de referencia.
+		"""
+		if propiedad not in ('P', 'T', 'v', 'u', 'h', 's'):
+			raise AttributeError(f"'{propiedad}' no es una propiedad válida del estado.")
+		self.relaciones.append(_Relacion(origen, estado, propiedad, factor, desplazamiento))
+
+	def resolver(self):
+		"""
+		Resuelve todos los estados a partir de los procesos declarados y las propiedades conocidas, y genera los
+		estados internos de cada proceso.
+
+		Cada proceso y cada relación es una restricción entre dos estados. Las restricciones propagan los valores
+		conocidos, y cada estado con dos propiedades conocidas se calcula una sola vez, en cuanto es posible (orden
+		topológico del grafo de restricciones); sus propiedades nuevas se vuelven a propagar. Los estados que no se
+		pueden definir así, por estar acoplados entre sí, se resuelven juntos como un sistema no lineal en (P, T) con
+		mínimos cuadrados. Finalmente se ejecuta cada `proceso_*` declarado, en orden, para sus estados internos;
+		los estados ya vigentes no se recalculan.
+		"""
+		restricciones = list(self.relaciones)
+		for tipo, estado_in, estado_out, kwargs in self.procesos_declarados:
+			restricciones.append(_Relacion(estado_in, estado_out, self._PROPIEDAD_CONSERVADA[tipo]))
+			if tipo == 'in_or_out_calor':
+				restricciones.append(_RelacionCalor(estado_in, estado_out, kwargs['calor']))
+
+		pendientes = [estado for estado in self.estados if estado is not None and not estado.vigente]
+		hubo_cambios = True
+		while hubo_cambios:
+			hubo_cambios = False
+			for restriccion in restricciones:
+				hubo_cambios |= restriccion.propagar()
+			for estado in [estado for estado in pendientes if _numero_definidas(estado) >= 2]:
+				pendientes.remove(estado)
+				self.modelo.calcular_estado(estado)
+				hubo_cambios = True
+
+		acoplados = [estado for estado in self.estados if estado is not None and not estado.vigente]
+		if acoplados:
+			self._resolver_acoplados(acoplados, restricciones)
+
+		for tipo, estado_in, estado_out, kwargs in self.procesos_declarados:
+			getattr(self, f"proceso_{tipo}")(estado_in, estado_out, **kwargs)
+
+	def _resolver_acoplados(self, acoplados, restricciones):
+		"""
+		Resuelve simultáneamente los estados que las restricciones no alcanzan a definir por separado.
+
+		Las incógnitas son ln P y ln T de cada estado acoplado; los residuos son sus propiedades conocidas y las
+		restricciones que los involucran, adimensionalizados con las escalas de referencia del modelo.
+		"""
+		modelo = self.modelo
+		escalas = {'P': modelo.P0, 'T': modelo.T0, 'v': modelo.v0, 'u': modelo.R_gas*modelo.T0,
+				   'h': modelo.R_gas*modelo.T0, 's': modelo.R_gas}
+		conocidas = [{nombre: getattr(estado, nombre) for nombre in escalas if getattr(estado, nombre) is not None}
+					 for estado in acoplados]
+		posicion = {id(estado): k for k, estado in enumerate(acoplados)}
+		involucradas = [r for r in restricciones if id(r.origen) in posicion or id(r.destino) in posicion]
+
+		def residuos(z):
+			puntos = modelo.calcular_estados(P=np.exp(z[0::2]), T=np.exp(z[1::2]))
+			def valor(estado, nombre):
+				k = posicion.get(id(estado))
+				return getattr(estado, nombre) if k is None else puntos[nombre][k]
+			r = [(valor(estado, nombre) - dato)/escalas[nombre]
+				 for estado, datos in zip(acoplados, conocidas) for nombre, dato in datos.items()]
+			r += [restriccion.residuo(valor)/escalas[restriccion.propiedad] for restriccion in involucradas]
+			return np.nan_to_num(np.array(r, dtype=float), nan=1e6)
+
+		z0 = np.log([[datos.get('P', modelo.P0), datos.get('T', modelo.T0)] for datos in conocidas]).ravel()
+		if len(residuos(z0)) < len(z0):
+			self.diagnosticos.registrar('datos_insuficientes', "Los estados {} no tienen suficientes datos para ser definidos.", _lista_nombres(acoplados))
+			return
+		from scipy.optimize import least_squares
+		solucion = least_squares(residuos, z0, xtol=1e-15, ftol=1e-15, gtol=1e-15)
+		if not np.all(np.abs(solucion.fun) < 1e-8):
+			self.diagnosticos.registrar('sin_convergencia', "Los estados {} no pudieron resolverse de forma congruente. Se recomienda revisar.",
+										_lista_nombres(acoplados), residuo_maximo=float(np.max(np.abs(solucion.fun))))
+		for estado, (ln_P, ln_T) in zip(acoplados, solucion.x.reshape(-1, 2)):
+			estado.P, estado.T = float(np.exp(ln_P)), float(np.exp(ln_T))
+			self.modelo.calcular_estado(estado)
+
+	def _columnas_completas(self):
+		"""
+		Nombres, índices y propiedades de todos los estados (cada estado principal seguido de los internos de su
+		proceso), en el orden de `generar_dataframes(opcion=2)`. Las propiedades de los estados internos se toman
+		de `almacen` de una vez, sin recorrerlos uno a uno.
+
+		Returns:
+			tuple[np.ndarray, dict[str, np.ndarray]]: Nombres y un arreglo por columna: 'proceso' (índice del
+			proceso), 'subindice' (0 en el estado principal y k en su k-ésimo estado interno) y las propiedades
+			('P', 'T', 'v', 'u', 'h', 's').
+		"""
+		indices = np.array([i for i, estado in enumerate(self.estados) if estado is not None], dtype=np.intp)
+		almacen = self.almacen
+		n_filas = np.diff(almacen.inicios)[indices] + 1
+		proceso = np.repeat(indices, n_filas)
+		primera_fila = np.cumsum(n_filas) - n_filas
+		subindice = np.arange(len(proceso)) - np.repeat(primera_fila, n_filas)
+		internos = subindice > 0
+		posiciones = almacen.inicios[proceso[internos]] + subindice[internos] - 1
+
+		valores = {'proceso': proceso, 'subindice': subindice}
+		for prop in ("P", "T", "v", "u", "h", "s"):
+			columna = np.empty(len(proceso))
+			columna[primera_fila] = [np.nan if getattr(self.estados[i], prop) is None else getattr(self.estados[i], prop)
+									 for i in indices]
+			columna[internos] = getattr(almacen, prop)[posiciones]
+			valores[prop] = columna
+		nombres = [str(self.estados[i].nombre) if k == 0 else f"{self.estados[i].nombre}.{k}" for i, k in zip(proceso, subindice)]
+		return np.array(nombres, dtype=object), valores
+
+	def _llave_dataframes(self, opcion):
+		"""
+		Llave con que se guardan los DataFrames de `generar_dataframes`: los valores de los estados principales y,
+		para la opción 2, la versión de `almacen`. Cambia en cuanto cambia cualquiera de los dos.
+		"""
+		principales = tuple((estado.nombre,) + tuple(getattr(estado, prop) for prop in ("P", "T", "v", "u", "h", "s"))
+							for estado in self.estados if estado is not None)
+		return (principales, self.almacen.version) if opcion == 2 else principales
+
 	def mostrar_ciclo(self):
 		"""
 		Muestra por pantalla un resumen de todos los estados en el ciclo.
@@ -268,6 +824,12 @@ class CicloTermodinamico:
 		for estado in self.estados:
 			print(estado.resumen())
 
+	def mostrar_diagnosticos(self):
+		"""
+		Muestra por pantalla el reporte de diagnósticos del ciclo (ver `Diagnosticos.reporte`).
+		"""
+		print(self.diagnosticos.reporte())
+
 	def generar_dataframes(self, opcion=1):
 			"""
 			Genera DataFrames con los estados del ciclo termodinámico.
@@ -278,317 +840,368 @@ class CicloTermodinamico:
 				- 1: Retorna un DataFrame con los estados principales del ciclo.
 				- 2: Retorna una lista con dos DataFrames:
 					1. Estados principales
-					2. Todos los estados (principales e internos)
+					2. Todos los estados (principales e internos), con las columnas enteras 'proceso' (índice del
+					   proceso) y 'subindice' (0 en el estado principal, k en su k-ésimo estado interno)
+
+			Los DataFrames se construyen directamente sobre arreglos contiguos de cada propiedad y se guardan; las
+			llamadas siguientes devuelven copias de los guardados mientras no cambien los estados principales ni los
+			internos, sin volver a recorrer los estados.
 
 			Returns
 			-------
 			pandas.DataFrame o list[pandas.DataFrame]
 			"""
-			# Crear DataFrame de estados principales
-			df_principal = pd.DataFrame(
-				[{
-					"nombre": estado.nombre,
-					"P [Pa]": estado.P,
-					"T [K]": estado.T,
-					"v [m³/kg]": estado.v,
-					"u [J/kg]": estado.u,
-					"h [J/kg]": estado.h,
-					"s [J/kg·K]": estado.s
-				} for estado in self.estados if estado is not None]
-			)
-
-			if opcion == 1:
-				return df_principal
-
-			elif opcion == 2:
-				lista_estados = []
-				for i, estado in enumerate(self.estados):
-					if estado is None:
-						continue
-
-					# Estado principal
-					lista_estados.append({
-						"nombre": str(estado.nombre),
-						"P [Pa]": estado.P,
-						"T [K]": estado.T,
-						"v [m³/kg]": estado.v,
-						"u [J/kg]": estado.u,
-						"h [J/kg]": estado.h,
-						"s [J/kg·K]": estado.s
-					})
-
-					# Estados internos del tramo correspondiente
-					if i < len(self.estados_internos):
-						contador_interno = 1
-						for estado_int in self.estados_internos[i]:
-							if estado_int is not None:
-								lista_estados.append({
-									"nombre": f"{estado.nombre}.{contador_interno}",
-									"P [Pa]": estado_int.P,
-									"T [K]": estado_int.T,
-									"v [m³/kg]": estado_int.v,
-									"u [J/kg]": estado_int.u,
-									"h [J/kg]": estado_int.h,
-									"s [J/kg·K]": estado_int.s
-								})
-								contador_interno += 1
-
-				df_completo = pd.DataFrame(lista_estados)
-				return [df_principal, df_completo]
-
-			else:
+			if opcion not in (1, 2):
 				raise ValueError("Opción inválida. Debe ser 1 o 2.")
-
-	def graficar_diagrama_Pv(self, nombre_ciclo="Ciclo termodinámico", ax=None, save = False):
+			import pandas as pd
+
+			llave = self._llave_dataframes(opcion)
+			guardado = self._dataframes.get(opcion)
+			if guardado is None or guardado[0] != llave:
+				estados = [estado for estado in self.estados if estado is not None]
+				# Estados principales
+				columnas = {"nombre": [estado.nombre for estado in estados]}
+				for prop, columna in _COLUMNAS.items():
+					columnas[columna] = np.array([np.nan if getattr(estado, prop) is None else getattr(estado, prop)
+												  for estado in estados], dtype=float)
+				tablas = [pd.DataFrame(columnas, copy=False)]
+
+				if opcion == 2:
+					# Todos los estados: las columnas son los arreglos contiguos de `_columnas_completas`, sin copia
+					nombres, valores = self._columnas_completas()
+					columnas = {"nombre": nombres, "proceso": valores["proceso"], "subindice": valores["subindice"]}
+					columnas.update({columna: valores[prop] for prop, columna in _COLUMNAS.items()})
+					tablas.append(pd.DataFrame(columnas, copy=False))
+				guardado = self._dataframes[opcion] = (llave, tablas)
+
+			# Copias completas: modificar el DataFrame devuelto no altera el guardado, con o sin Copy-on-Write de pandas
+			tablas = [tabla.copy(deep=True) for tabla in guardado[1]]
+			return tablas[0] if opcion == 1 else tablas
+
+	def graficar_diagrama_Pv(self, nombre_ciclo="Ciclo termodinámico", ax=None, save=False, max_puntos=None):
 		"""
 		Grafica el diagrama P-v del ciclo termodinámico.
 		Cada tramo tiene su propio color y etiqueta.
-		"""
-		import matplotlib.pyplot as plt
-		import pandas as pd
-
-		# Obtener DataFrames
-		df_principal, df_completo = self.generar_dataframes(opcion=2)
-
-		# Crear columnas auxiliares para ordenar
-		df_completo["tramo"] = df_completo["nombre"].apply(lambda x: str(x).split(".")[0])
-		df_completo["subindice"] = df_completo["nombre"].apply(
-			lambda x: 0 if "." not in str(x) else int(str(x).split(".")[1])
-		)
-		df_completo.sort_values(by=["tramo", "subindice"], inplace=True)
-
-		colores = plt.cm.tab10.colors
-		if ax is None:
-			fig, ax = plt.subplots(figsize=(6, 4))
-		else:
-			fig = ax.figure
-
-		tramos_unicos = df_principal["nombre"].astype(str).tolist()
-		n_tramos = len(tramos_unicos)
-
-		# Graficar cada tramo
-		for i, tramo in enumerate(tramos_unicos):
-			estado_ini = df_principal.iloc[i]
-			estado_fin = df_principal.iloc[(i + 1) % n_tramos]
-
-			grupo = df_completo[df_completo["tramo"] == tramo]
-
-			# Secuencia: estado inicial -> internos -> estado final
-			v_vals = [estado_ini["v [m³/kg]"]] + grupo["v [m³/kg]"].tolist() + [estado_fin["v [m³/kg]"]]
-			P_vals = [estado_ini["P [Pa]"]] + grupo["P [Pa]"].tolist() + [estado_fin["P [Pa]"]]
-
-			ax.plot(v_vals, P_vals, color=colores[i % len(colores)],
-					label=f"Tramo {tramo} → {estado_fin['nombre']}")
-			ax.scatter(v_vals, P_vals, color=colores[i % len(colores)], s=20)
-
-		# Estados principales
-		ax.scatter(df_principal["v [m³/kg]"], df_principal["P [Pa]"],
-				color='black', s=60, edgecolor='white', zorder=5, label="Estados principales")
 
-		for _, estado in df_principal.iterrows():
-			ax.annotate(estado["nombre"],
-						xy=(estado["v [m³/kg]"] * 1.01, estado["P [Pa]"] * 1.01))
+		Args:
+			nombre_ciclo (str): Nombre del ciclo, para el título.
+			ax (matplotlib.axes.Axes, optional): Eje en el que graficar; por defecto uno nuevo.
+			save (bool | str): Si es una ruta, la figura se guarda en ella; si es `True`, en '<nombre_ciclo>_Pv.png'.
+			max_puntos (int, optional): Número máximo de puntos dibujados por tramo (ver `_graficar_diagrama`).
 
+		Returns:
+			tuple: (figura, eje).
+		"""
+		fig, ax = self._graficar_diagrama("v", "P", ax, max_puntos)
 		ax.set_xlabel(r'Volumen específico [$m^3$/kg]')
 		ax.set_ylabel('Presión [Pa]')
 		ax.set_title(f'Diagrama P-v: {nombre_ciclo}')
-		ax.grid(True)
-		ax.legend()
 		fig.tight_layout()
+		if save:
+			fig.savefig(save if isinstance(save, str) else f"{nombre_ciclo}_Pv.png")
 
 		return fig, ax
 
-	def graficar_diagrama_Ts(self, nombre_ciclo="Ciclo termodinámico", ax=None):
+	def graficar_diagrama_Ts(self, nombre_ciclo="Ciclo termodinámico", ax=None, save=False, max_puntos=None):
 		"""
 		Grafica el diagrama T-s del ciclo termodinámico.
 		Cada tramo tiene su propio color y etiqueta.
+
+		Args:
+			nombre_ciclo (str): Nombre del ciclo, para el título.
+			ax (matplotlib.axes.Axes, optional): Eje en el que graficar; por defecto uno nuevo.
+			save (bool | str): Si es una ruta, la figura se guarda en ella; si es `True`, en '<nombre_ciclo>_Ts.png'.
+			max_puntos (int, optional): Número máximo de puntos dibujados por tramo (ver `_graficar_diagrama`).
+
+		Returns:
+			tuple: (figura, eje).
 		"""
-		import matplotlib.pyplot as plt
-		import pandas as pd
+		fig, ax = self._graficar_diagrama("s", "T", ax, max_puntos)
+		ax.set_xlabel('Entropía específica [J/kg·K]')
+		ax.set_ylabel('Temperatura [K]')
+		ax.set_title(f'Diagrama T-s: {nombre_ciclo}')
+		fig.tight_layout()
+		if save:
+			fig.savefig(save if isinstance(save, str) else f"{nombre_ciclo}_Ts.png")
 
-		# Obtener DataFrames
-		df_principal, df_completo = self.generar_dataframes(opcion=2)
+		return fig, ax
+
+	def _graficar_diagrama(self, prop_x, prop_y, ax, max_puntos):
+		"""
+		Dibuja las trayectorias de todos los tramos y los estados principales en un diagrama prop_y-prop_x.
+
+		Las trayectorias se leen directamente de `almacen` y se dibujan todas con una sola `LineCollection` y una
+		sola nube de puntos, con un color por tramo. Cada tramo se reduce a lo sumo a `max_puntos` puntos
+		equiespaciados en su índice (por defecto, el doble del ancho del eje en píxeles), de modo que el costo de
+		dibujar no depende de `n_values`; los extremos del tramo siempre se conservan. Los puntos muestreados se
+		marcan solo en los tramos que no fue necesario reducir.
 
-		# Crear columnas auxiliares para ordenar
-		df_completo["tramo"] = df_completo["nombre"].apply(lambda x: str(x).split(".")[0])
-		df_completo["subindice"] = df_completo["nombre"].apply(
-			lambda x: 0 if "." not in str(x) else int(str(x).split(".")[1])
-		)
-		df_completo.sort_values(by=["tramo", "subindice"], inplace=True)
+		Returns:
+			tuple: (figura, eje).
+		"""
+		import matplotlib.pyplot as plt
+		from matplotlib.collections import LineCollection
+		from matplotlib.lines import Line2D
 
 		colores = plt.cm.tab10.colors
 		if ax is None:
 			fig, ax = plt.subplots(figsize=(6, 4))
 		else:
 			fig = ax.figure
+		if max_puntos is None:
+			max_puntos = 2*max(2, int(ax.get_window_extent().width))
+
+		indices = [i for i, estado in enumerate(self.estados) if estado is not None]
+		n = len(indices)
+		tramos, colores_tramo, marcados, leyenda = [], [], [], []
+		for k, i in enumerate(indices):
+			x = self._trayectoria(i, prop_x)
+			y = self._trayectoria(i, prop_y)
+			seleccion = _decimar(len(x), max_puntos)
+			tramos.append(np.column_stack((x[seleccion], y[seleccion])))
+			colores_tramo.append(colores[k % len(colores)])
+			marcados.append(len(seleccion) == len(x))
+			# Los tramos van en una sola colección; la leyenda usa una línea de muestra por tramo
+			leyenda.append(Line2D([], [], color=colores_tramo[-1], marker="o" if marcados[-1] else None, markersize=4,
+								  label=f"Tramo {self.estados[i].nombre} → {self.estados[indices[(k + 1) % n]].nombre}"))
+
+		if tramos:
+			ax.add_collection(LineCollection(tramos, colors=colores_tramo), autolim=True)
+			ax.autoscale_view()
+			n_marcas = [len(tramo) if marcado else 0 for tramo, marcado in zip(tramos, marcados)]
+			if sum(n_marcas):
+				puntos = np.concatenate([tramo for tramo, marcado in zip(tramos, marcados) if marcado])
+				ax.scatter(puntos[:, 0], puntos[:, 1], s=20, color=np.repeat(np.asarray(colores_tramo), n_marcas, axis=0))
 
-		tramos_unicos = df_principal["nombre"].astype(str).tolist()
-		n_tramos = len(tramos_unicos)
-
-		# Graficar cada tramo
-		for i, tramo in enumerate(tramos_unicos):
-			estado_ini = df_principal.iloc[i]
-			estado_fin = df_principal.iloc[(i + 1) % n_tramos]
+		# Estados principales
+		x_principal = np.array([getattr(self.estados[i], prop_x) for i in indices], dtype=float)
+		y_principal = np.array([getattr(self.estados[i], prop_y) for i in indices], dtype=float)
+		leyenda.append(ax.scatter(x_principal, y_principal,
+					   color='black', s=60, edgecolor='white', zorder=5, label="Estados principales"))
 
-			grupo = df_completo[df_completo["tramo"] == tramo]
+		for i, x, y in zip(indices, x_principal, y_principal):
+			ax.annotate(self.estados[i].nombre, xy=(x * 1.01, y * 1.01))
 
-			# Secuencia: estado inicial -> internos -> estado final
-			s_vals = [estado_ini["s [J/kg·K]"]] + grupo["s [J/kg·K]"].tolist() + [estado_fin["s [J/kg·K]"]]
-			T_vals = [estado_ini["T [K]"]] + grupo["T [K]"].tolist() + [estado_fin["T [K]"]]
+		ax.grid(True)
+		ax.legend(handles=leyenda)
+		return fig, ax
 
-			ax.plot(s_vals, T_vals, color=colores[i % len(colores)],
-					label=f"Tramo {tramo} → {estado_fin['nombre']}")
-			ax.scatter(s_vals, T_vals, color=colores[i % len(colores)], s=20)
+	def _trayectorias(self, indices, propiedad):
+		"""
+		Devuelve las trayectorias de una propiedad para varios procesos con el mismo número de puntos internos,
+		como un arreglo (len(indices), n_puntos + 2) con los estados inicial y final en los extremos.
+		"""
+		n = len(self.estados)
+		indices = np.asarray(indices)
+		posiciones = self.almacen.inicios[indices][:, None] + np.arange(self.almacen.n_puntos(indices[0]))
+		inicio = [getattr(self.estados[i], propiedad) for i in indices]
+		fin = [getattr(self.estados[(i + 1) % n], propiedad) for i in indices]
+		return np.column_stack((inicio, getattr(self.almacen, propiedad)[posiciones], fin)).astype(float)
 
-		# Estados principales
-		ax.scatter(df_principal["s [J/kg·K]"], df_principal["T [K]"],
-				color='black', s=60, edgecolor='white', zorder=5, label="Estados principales")
+	def calcular_trabajo_y_calor_num(self, metodo=None):
+		"""
+		Calcula el trabajo, el calor y el cambio de energía interna de cada proceso integrando P dv sobre las
+		trayectorias guardadas en `almacen`.
 
-		for _, estado in df_principal.iterrows():
-			ax.annotate(estado["nombre"],
-						xy=(estado["s [J/kg·K]"] * 1.01, estado["T [K]"] * 1.01))
+		Los procesos con el mismo número de puntos se integran juntos, de forma vectorizada (ver
+		`integracion.integrar`). Las reglas de orden 4 ('simpson', 'spline') alcanzan con muchos menos puntos
+		internos (`n_values`) la exactitud de la regla del trapecio.
 
-		ax.set_xlabel('Entropía específica [J/kg·K]')
-		ax.set_ylabel('Temperatura [K]')
-		ax.set_title(f'Diagrama T-s: {nombre_ciclo}')
-		ax.grid(True)
-		ax.legend()
-		fig.tight_layout()
+		Args:
+			metodo (str, optional): 'trapecio', 'simpson' o 'spline'. Por defecto 'trapecio' con muestreo fijo y
+				'simpson', la regla con que se controla el error, con muestreo adaptativo.
 
-		return fig, ax
+		Returns:
+			dict[str, np.ndarray]: 'trabajo', 'calor' (Q = ΔU + W), 'delta_u' y 'error' (estimación del error de
+			cuadratura del trabajo, que es también el del calor) de cada proceso.
+		"""
+		if metodo is None:
+			metodo = 'trapecio' if self.tolerancia is None else 'simpson'
+		n = len(self.estados)
+		delta_u = np.array([self.estados[(i + 1) % n].u - self.estados[i].u for i in range(n)], dtype=float)
+		trabajo = np.empty(n)
+		error = np.empty(n)
+		grupos = {}
+		for i in range(n):
+			grupos.setdefault(self.almacen.n_puntos(i), []).append(i)
+		for indices in grupos.values():
+			trabajo[indices], error[indices] = integrar(self._trayectorias(indices, 'P'), self._trayectorias(indices, 'v'), metodo)
+		return {'trabajo': trabajo, 'calor': delta_u + trabajo, 'delta_u': delta_u, 'error': error}
 
-	def calcular_eficiencia_num(self):
+	def calcular_eficiencia_num(self, metodo=None):
 		"""
-		Calcula la eficiencia térmica del ciclo termodinámico por medio de integral trapezoidal
-		
+		Calcula la eficiencia térmica del ciclo termodinámico integrando numéricamente el trabajo de cada proceso
+		(`calcular_trabajo_y_calor_num`).
+
+		Args:
+			metodo (str, optional): 'trapecio', 'simpson' o 'spline'; por defecto, como en `calcular_trabajo_y_calor_num`.
+
 		Returns:
 		float: Eficiencia térmica del ciclo (0 a 1).
 		"""
-		n = len(self.estados)
-		works = []  # Trabajo en cada proceso
-		heats = []  # Calor en cada proceso
-		
-		for i in range(n):
-			# Estados inicial y final del proceso
-			estado_in = self.estados[i]
-			estado_out = self.estados[(i + 1) % n]
-        
-			# Calcular ΔU entre estados
-			delta_U = estado_out.u - estado_in.u
-        
-			 # Obtener estados internos del proceso (sin valores nulos)
-			internals = [e for e in self.estados_internos[i] if e is not None]
-			all_states = [estado_in] + internals + [estado_out]
-        
-			# Calcular trabajo  usando integral trapezoidal
-			W = 0
-			for j in range(len(all_states) - 1):
-				P_avg = (all_states[j].P + all_states[j + 1].P) / 2
-				delta_V = all_states[j + 1].v - all_states[j].v
-				W += P_avg * delta_V
-        
-			# Calcular calor usando Primera Ley (Q = ΔU + W)
-			Q = delta_U + W
-        
-			works.append(W)
-			heats.append(Q)
-
-		# Calcular trabajo neto (suma de trabajos positivos - suma de trabajos negativos)
-		net_work = sum(W for W in works)
-		
-		# Calcular calor total de entrada (solo valores positivos)
-		heat_input = sum(Q for Q in heats if Q > 0)
-		
+		resultado = self.calcular_trabajo_y_calor_num(metodo)
+		works, heats = resultado['trabajo'], resultado['calor']
+
+		# Calcular trabajo neto y calor total de entrada (solo valores positivos)
+		net_work = works.sum()
+		heat_input = heats[heats > 0].sum()
+
 		# Calcular eficiencia (evitar división por cero)
 		if heat_input > 0:
 			efficiency = net_work / heat_input
 		else:
 			efficiency = 0
-		print(f"La eficiencia del ciclo por método numérico es: {efficiency:.3f}")
-		return efficiency	
-        
-	def calcular_eficiencia(self,modelo, carnot = False):
+		self.diagnosticos.registrar('resultado', "La eficiencia del ciclo por método numérico es: {eficiencia:.3f}", eficiencia=efficiency,
+									error_trabajo=resultado['error'])
+		return efficiency
+
+	def calcular_trabajo_y_calor(self):
 		"""
-		Calcula la eficiencia térmica del ciclo termodinámico.
-		
+		Calcula el trabajo y el calor de cada proceso ejecutado, en forma cerrada según el tipo de proceso registrado
+		por su `proceso_*` (ver `ModeloTermodinamico.trabajo_y_calor`).
+
+		Los procesos del mismo tipo se evalúan juntos en una sola llamada vectorizada al modelo, por lo que el costo
+		es del orden del número de procesos y no depende de los estados internos.
+
 		Returns:
-		float: Eficiencia térmica del ciclo (0 a 1).
+			tuple[np.ndarray, np.ndarray]: Trabajo realizado por el sistema y calor recibido (J/kg) de cada proceso,
+			en la posición de su estado de entrada; `NaN` para los procesos que no se han ejecutado.
 		"""
-		n = len(self.estados)
-		works = []  # Trabajo en cada proceso
-		heats = []  # Calor en cada proceso
+		trabajo = np.full(len(self.procesos), np.nan)
+		calor = np.full(len(self.procesos), np.nan)
+		grupos = {}
+		for i, proceso in enumerate(self.procesos):
+			if proceso is not None:
+				grupos.setdefault(proceso[0], []).append(i)
+		for tipo, indices in grupos.items():
+			extremos = [{prop: np.array([getattr(self.procesos[i][k], prop) for i in indices], dtype=float)
+						 for prop in ('P', 'T', 'v', 'u', 'h', 's')} for k in (1, 2)]
+			trabajo[indices], calor[indices] = self.modelo.trabajo_y_calor(tipo, *extremos)
+		return trabajo, calor
+
+	def calcular_eficiencia(self, modelo=None, carnot = False):
+		"""
+		Calcula la eficiencia térmica del ciclo termodinámico con el trabajo y el calor exactos de cada proceso
+		(`calcular_trabajo_y_calor`).
+
+		Args:
+			modelo (ModeloTermodinamico, optional): Se conserva por compatibilidad; se usa el modelo del ciclo.
+			carnot (bool): Si es `True`, devuelve la eficiencia de Carnot entre las temperaturas extremas del ciclo.
 
+		Returns:
+		float: Eficiencia térmica del ciclo (0 a 1).
+
+		Raises:
+			ValueError: Si algún proceso del ciclo no se ha ejecutado.
+		"""
 		if carnot:
 			T_values = [state.T for state in self.estados]
 			T_values.sort()
-			T_High = T_values[n-1]
+			T_High = T_values[-1]
 			T_low = T_values[0]
 			efficiency = 1 - T_low/T_High
-			print(f"La eficiencia del ciclo de Carnot: {efficiency:.3f}")
+			self.diagnosticos.registrar('resultado', "La eficiencia del ciclo de Carnot: {eficiencia:.3f}", eficiencia=efficiency)
 			return efficiency
-		for i in range(n):
-			# Estados inicial y final del proceso
-			estado_in = self.estados[i]
-			estado_out = self.estados[(i + 1) % n]
-        
-			# Calcular ΔU entre estados
-			delta_U = estado_out.u - estado_in.u
-        
-			 # Obtener estados internos del proceso (sin valores nulos)
-			internals = [e for e in self.estados_internos[i] if e is not None]
-			all_states = [estado_in] + internals + [estado_out]
-            
-			# Calcular trabajo  dependiendo del tipo de modelo
-			W = 0
-			if modelo.__class__.__name__ == "ModeloGasIdeal":
-				if np.allclose(estado_in.P,estado_out.P):
-					''' 
-                        Proceso Isobárico
-                        W = P*(Vf - Vi)
-					'''
-					W = estado_in.P*(estado_out.v - estado_in.v)
-					Q = estado_out.h - estado_in.h
-				elif np.allclose(estado_in.T,estado_out.T):
-					''' 
-                        Proceso Isotérmico
-                        W = R*T*ln(Vf/Vi)
-					'''
-					W = modelo.R_gas*estado_in.T*np.log(estado_out.v/estado_in.v)
-					Q = W
-				elif np.allclose(estado_in.s, estado_out.s):
-					'''
-                        Proceso Isoentrópico
-                        W = -deltaU
-					'''
-					W = -delta_U
-					Q = 0
-				elif np.allclose(estado_in.h, estado_out.h):
-					'''
-                        Proceso Isoentálpico
-                        W = cp*(Tf - Ti)
-					'''
-					W = 0 #modelo.cp*(estado_out.T - estado_in.T)
-					Q = delta_U
-				else:
-					Q = delta_U + W
-                
-			elif modelo.__class__.__name__=="ModeloVanDerWaals":
-				pass  
-        
-        
-			works.append(W)
-			heats.append(Q)
-
-		# Calcular trabajo neto (suma de trabajos positivos - suma de trabajos negativos)
-		net_work = sum(W for W in works)
-		print(works)
-		print(heats)
-		# Calcular calor total de entrada (solo valores positivos)
-		heat_input = sum(Q for Q in heats if Q > 0)
+
+		works, heats = self.calcular_trabajo_y_calor()
+		faltantes = [str(estado.nombre) for estado, proceso in zip(self.estados, self.procesos) if proceso is None]
+		if faltantes:
+			raise ValueError(f"Los procesos que inician en los estados {', '.join(faltantes)} no se han ejecutado.")
+		self.diagnosticos.registrar('resultado', "Trabajos: {trabajos}; calores: {calores}", trabajos=works, calores=heats)
+
+		# Trabajo neto y calor total de entrada (solo valores positivos)
+		net_work = works.sum()
+		heat_input = heats[heats > 0].sum()
 		# Calcular eficiencia (evitar división por cero)
 		if heat_input > 0:
 			efficiency = net_work / heat_input
 		else:
 			efficiency = 0
-		print(f"La eficiencia del ciclo: {efficiency:.3f}")
-		return efficiency
\ No newline at end of file
+		self.diagnosticos.registrar('resultado', "La eficiencia del ciclo: {eficiencia:.3f}", eficiencia=efficiency)
+		return efficiency
+
+
+def _decimar(n, maximo):
+	"""
+	Índices de a lo sumo `maximo` puntos, equiespaciados, de una trayectoria de `n` puntos; conserva los extremos.
+	"""
+	if n <= maximo:
+		return np.arange(n)
+	return np.unique(np.linspace(0, n - 1, max(2, maximo)).round().astype(np.intp))
+
+def _lista_nombres(estados):
+	"""Nombres de los estados separados por comas, para los mensajes de diagnóstico."""
+	return ', '.join(str(estado.nombre) for estado in estados)
+
+def _numero_definidas(estado):
+	"""Número de propiedades termodinámicas (sin contar la calidad) conocidas en el estado."""
+	return sum(getattr(estado, nombre) is not None for nombre in ('P', 'T', 'v', 'u', 'h', 's'))
+
+class _Relacion:
+	"""
+	Restricción destino.propiedad = factor*origen.propiedad + desplazamiento entre dos estados del ciclo.
+	"""
+
+	def __init__(self, origen, destino, propiedad, factor=1.0, desplazamiento=0.0):
+		self.origen = origen
+		self.destino = destino
+		self.propiedad = propiedad
+		self.factor = factor
+		self.desplazamiento = desplazamiento
+		self._avisada = False # El incumplimiento se registra una sola vez
+
+	def propagar(self):
+		"""
+		Asigna la propiedad del estado que no la conoce a partir del otro. Devuelve `True` si asignó algún valor.
+		"""
+		a = getattr(self.origen, self.propiedad)
+		b = getattr(self.destino, self.propiedad)
+		if a is not None and b is None:
+			self.destino.asignar_entrada(self.propiedad, self.factor*a + self.desplazamiento)
+			return True
+		if b is not None and a is None and self.factor != 0:
+			self.origen.asignar_entrada(self.propiedad, (b - self.desplazamiento)/self.factor)
+			return True
+		if a is not None and b is not None and not self._avisada and not np.isclose(b, self.factor*a + self.desplazamiento, rtol=1e-9, atol=0):
+			self._avisada = True
+			diagnosticos_de(self.origen).registrar('incongruente', "La propiedad {propiedad} de los estados {} y {} fue definida en ambos pero no cumple la relación. Se recomienda revisar.",
+												  self.origen.nombre, self.destino.nombre, propiedad=self.propiedad)
+		return False
+
+	def residuo(self, valor):
+		"""Residuo de la restricción con los valores entregados por `valor(estado, propiedad)`."""
+		return valor(self.destino, self.propiedad) - (self.factor*valor(self.origen, self.propiedad) + self.desplazamiento)
+
+class _RelacionCalor:
+	"""
+	Restricción de un proceso de adición o rechazo de calor a temperatura constante: s_out = s_in + calor/T.
+	"""
+
+	propiedad = 's'
+
+	def __init__(self, origen, destino, calor):
+		self.origen = origen
+		self.destino = destino
+		self.calor = calor
+
+	def _temperatura(self):
+		return self.destino.T if self.destino.T is not None else self.origen.T
+
+	def propagar(self):
+		"""
+		Asigna la entropía del estado que no la conoce, si se conoce la temperatura. Devuelve `True` si asignó algún valor.
+		"""
+		T = self._temperatura()
+		if T is None:
+			return False
+		if self.origen.s is not None and self.destino.s is None:
+			self.destino.asignar_entrada('s', self.origen.s + self.calor/T)
+			return True
+		if self.destino.s is not None and self.origen.s is None:
+			self.origen.asignar_entrada('s', self.destino.s - self.calor/T)
+			return True
+		return False
+
+	def residuo(self, valor):
+		"""Residuo de la restricción con los valores entregados por `valor(estado, propiedad)`."""
+		return valor(self.destino, 's') - valor(self.origen, 's') - self.calor/valor(self.destino, 'T')
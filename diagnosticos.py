@@ -0,0 +1,168 @@
+from collections import Counter, deque
+
+# Tipo de cada evento y su nivel de severidad
+TIPOS = {
+	'congruente': 'info',           # Una propiedad definida en ambos estados cumple el proceso
+	'estado_vigente': 'info',       # El estado ya estaba calculado y no se recalcula
+	'resultado': 'info',            # Resultado de un cálculo del ciclo (eficiencia, trabajos, calores)
+	'incongruente': 'aviso',        # Una propiedad definida en ambos estados no cumple el proceso o la relación
+	'datos_insuficientes': 'aviso', # No hay datos suficientes para definir los estados
+	'sin_convergencia': 'aviso',    # Un sistema de estados no se pudo resolver de forma congruente
+	'dato_faltante': 'error',       # Falta una propiedad necesaria para construir la trayectoria
+	'no_implementado': 'error',     # El modelo no implementa el cálculo pedido
+}
+NIVELES = ('info', 'aviso', 'error')
+MODOS = ('registrar', 'imprimir', 'silencioso')
+
+_modo_predeterminado = 'registrar'
+
+def establecer_modo_predeterminado(modo):
+	"""
+	Cambia el modo con que se crean los recolectores a los que no se les indica uno (por ejemplo el de cada
+	`CicloTermodinamico`). Útil para barridos: `establecer_modo_predeterminado('silencioso')`.
+
+	Args:
+		modo (str): 'registrar', 'imprimir' o 'silencioso'.
+
+	Returns:
+		str: El modo predeterminado anterior.
+	"""
+	global _modo_predeterminado
+	if modo not in MODOS:
+		raise ValueError(f"Modo '{modo}' no válido. Use uno de: {', '.join(MODOS)}.")
+	anterior, _modo_predeterminado = _modo_predeterminado, modo
+	return anterior
+
+class Evento:
+	"""
+	Evento de diagnóstico registrado durante la resolución de un ciclo.
+
+	Attributes:
+		tipo (str): Tipo del evento, una de las llaves de `TIPOS`.
+		nivel (str): 'info', 'aviso' o 'error', según el tipo.
+		estados (tuple): Nombres de los estados involucrados.
+		datos (dict): Valores asociados al evento (por ejemplo la eficiencia calculada).
+	"""
+
+	def __init__(self, tipo, plantilla, estados=(), datos=None):
+		self.tipo = tipo
+		self.nivel = TIPOS[tipo]
+		self.plantilla = plantilla
+		self.estados = tuple(estados)
+		self.datos = datos or {}
+
+	@property
+	def mensaje(self):
+		"""str: Mensaje legible; se arma solo al consultarlo."""
+		return self.plantilla.format(*self.estados, **self.datos)
+
+	def __repr__(self):
+		return f"Evento({self.tipo!r}, {self.mensaje!r})"
+
+class Diagnosticos:
+	"""
+	Recolector de los avisos y comprobaciones de congruencia producidos al resolver un ciclo.
+
+	Los modelos y el ciclo registran eventos tipados en lugar de imprimir mensajes; nada se escribe en la
+	terminal salvo en modo 'imprimir' o al pedir el reporte. Los mensajes se guardan como plantilla y valores, y
+	solo se arman al consultarlos.
+
+	Modos:
+		'registrar': guarda cada evento (predeterminado).
+		'imprimir': guarda cada evento y además imprime su mensaje al registrarlo, como las versiones anteriores.
+		'silencioso': solo cuenta los eventos por tipo, sin guardarlos; pensado para barridos grandes.
+
+	Attributes:
+		modo (str): Modo del recolector.
+		eventos (collections.deque[Evento]): Eventos guardados, del más antiguo al más reciente.
+		conteo (collections.Counter): Número de eventos de cada tipo, en cualquier modo.
+	"""
+
+	def __init__(self, modo=None, maximo_eventos=None):
+		"""
+		Args:
+			modo (str, optional): 'registrar', 'imprimir' o 'silencioso'. Por defecto el modo predeterminado del módulo.
+			maximo_eventos (int, optional): Si se indica, solo se guardan los últimos `maximo_eventos` eventos (el
+				conteo sigue incluyéndolos a todos).
+		"""
+		modo = modo or _modo_predeterminado
+		if modo not in MODOS:
+			raise ValueError(f"Modo '{modo}' no válido. Use uno de: {', '.join(MODOS)}.")
+		self.modo = modo
+		self.eventos = deque(maxlen=maximo_eventos)
+		self.conteo = Counter()
+
+	def registrar(self, tipo, plantilla, *estados, **datos):
+		"""
+		Registra un evento.
+
+		Args:
+			tipo (str): Tipo del evento, una de las llaves de `TIPOS`.
+			plantilla (str): Mensaje con campos de `str.format`: los posicionales son los estados y los nombrados, los datos.
+			*estados: Nombres de los estados involucrados.
+			**datos: Valores asociados al evento.
+		"""
+		self.conteo[tipo] += 1
+		if self.modo == 'silencioso':
+			return
+		evento = Evento(tipo, plantilla, estados, datos)
+		self.eventos.append(evento)
+		if self.modo == 'imprimir':
+			print(evento.mensaje)
+
+	def filtrar(self, tipo=None, nivel=None):
+		"""
+		Eventos guardados de un tipo o nivel dados.
+
+		Returns:
+			list[Evento]: Eventos que cumplen ambos filtros.
+		"""
+		return [evento for evento in self.eventos
+				if (tipo is None or evento.tipo == tipo) and (nivel is None or evento.nivel == nivel)]
+
+	def resumen(self):
+		"""
+		Conteo de eventos por nivel y por tipo.
+
+		Returns:
+			dict: {'info': n, 'aviso': n, 'error': n, 'tipos': {tipo: n}}.
+		"""
+		resumen = {nivel: 0 for nivel in NIVELES}
+		for tipo, n in self.conteo.items():
+			resumen[TIPOS[tipo]] += n
+		resumen['tipos'] = dict(self.conteo)
+		return resumen
+
+	def reporte(self):
+		"""
+		Reporte legible: conteo por nivel y tipo, seguido de los mensajes de avisos y errores guardados.
+
+		Returns:
+			str: El reporte.
+		"""
+		resumen = self.resumen()
+		total = sum(self.conteo.values())
+		lineas = [f"Diagnósticos: {total} eventos ({', '.join(f'{resumen[nivel]} {nivel}' for nivel in NIVELES)})"]
+		for tipo, n in sorted(self.conteo.items(), key=lambda item: (NIVELES.index(TIPOS[item[0]]), item[0])):
+			lineas.append(f"  {tipo} [{TIPOS[tipo]}]: {n}")
+		relevantes = [evento for evento in self.eventos if evento.nivel != 'info']
+		if relevantes:
+			lineas.append("Avisos y errores:")
+			lineas += [f"  [{evento.nivel}] {evento.mensaje}" for evento in relevantes]
+		return "\n".join(lineas)
+
+	def limpiar(self):
+		"""Descarta los eventos y el conteo."""
+		self.eventos.clear()
+		self.conteo.clear()
+
+	def __len__(self):
+		return sum(self.conteo.values())
+
+# Recolector de los estados que no pertenecen a un ciclo
+SIN_CICLO = Diagnosticos(maximo_eventos=1000)
+
+def diagnosticos_de(estado):
+	"""Recolector al que reportan los eventos de un estado: el de su ciclo, o `SIN_CICLO`."""
+	diagnosticos = getattr(estado, 'diagnosticos', None)
+	return SIN_CICLO if diagnosticos is None else diagnosticos
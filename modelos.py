@@ -1,5 +1,10 @@
+from collections import OrderedDict
+import functools
+
 import numpy as np
-from scipy.integrate import quad
+
+from diagnosticos import diagnosticos_de
+from resolvedores import continuar_raices, raices_acotadas, raices_cubicas
 
 class ModeloTermodinamico:
 	"""
@@ -8,8 +13,77 @@ class ModeloTermodinamico:
 	Métodos:
 		resolver_xxxxxx(self, estado_in, estado_out, **kwargs): Resuelve el respectivo proceso, tal que se definan las variables termodinámicas de cada estado.
 		calcular_estado(estado, **kwargs): Calcula las propiedades termodinámicas de un estado.
+		activar_cache(tamano_maximo, cifras): Activa la memoria de resultados de `calcular_estado`.
+
+	Atributos:
+		calculos_evitados (int): Número de llamadas a `calcular_estado` omitidas porque el estado ya estaba vigente.
+
+	El `calcular_estado` de cada subclase se envuelve automáticamente: los estados vigentes (calculados y sin
+	entradas modificadas desde entonces) no se recalculan, y el resto pasa por la memoria (caché) del modelo, que está
+	desactivada por defecto. Las subclases declaran en `parametros` los atributos que determinan sus resultados;
+	si alguno cambia, la memoria se vacía en la siguiente llamada.
 	"""
 
+	parametros = ()
+	calculos_evitados = 0
+	_cache = None
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+		if 'calcular_estado' in cls.__dict__:
+			cls.calcular_estado = _envolver_calcular_estado(cls.__dict__['calcular_estado'])
+
+	def activar_cache(self, tamano_maximo=4096, cifras=12):
+		"""
+		Activa la memoria de resultados de `calcular_estado`, con desalojo del menos usado recientemente (LRU).
+
+		La llave de cada resultado son las propiedades conocidas del estado al momento de la llamada, con sus
+		valores redondeados a `cifras` cifras significativas, de modo que estados repetidos (esquinas compartidas,
+		condiciones de entrada iguales, llamadas repetidas dentro de `resolver_*`) no se recalculan.
+
+		Args:
+			tamano_maximo (int): Número máximo de resultados guardados.
+			cifras (int): Cifras significativas con que se comparan los valores de entrada.
+		"""
+		self._cache = _CacheEstados(tamano_maximo, cifras)
+
+	def desactivar_cache(self):
+		"""Desactiva y descarta la memoria de resultados."""
+		self._cache = None
+
+	def estadisticas_cache(self):
+		"""
+		Devuelve las estadísticas de la memoria de resultados.
+
+		Returns:
+			dict | None: Aciertos, fallos, desalojos, invalidaciones y tamaño actual; `None` si la memoria está desactivada.
+		"""
+		return None if self._cache is None else self._cache.estadisticas()
+
+	def _definir_alguno(self, estado_in, estado_out):
+		"""
+		Calcula el primero de los dos estados que tenga al menos dos propiedades termodinámicas conocidas.
+		Los estados vigentes no se recalculan (ver `calculos_evitados`).
+		"""
+		for estado in (estado_in, estado_out):
+			if _numero_definidas(estado) >= 2:
+				if getattr(estado, 'vigente', False):
+					self._registrar('estado_vigente', "{} esta definido", estado)
+				self.calcular_estado(estado)
+				return
+
+	def _registrar(self, tipo, plantilla, *estados, **datos):
+		"""
+		Registra un evento de diagnóstico (ver `diagnosticos.TIPOS`) en el recolector del ciclo del primer estado.
+		"""
+		diagnosticos_de(estados[0]).registrar(tipo, plantilla, *(estado.nombre for estado in estados), **datos)
+
+	def _huella_parametros(self):
+		"""
+		Huella de los parámetros del modelo: tupla con los valores de los atributos listados en `parametros`.
+		"""
+		return tuple(_valor_huella(getattr(self, nombre, None)) for nombre in self.parametros)
+
 	def resolver_isocorico(self, estado_in, estado_out):
 		'''
 		Esta función relaciona dos estados a través de un proceso isocórico o a volumen constante.
@@ -19,23 +93,14 @@ class ModeloTermodinamico:
 			estado_out (Estado): Estado de salida en la secuencia del ciclo.
 		'''
 		# Definir alguno de los estados involucrados si es posible:
-		if sum(value is not None for value in vars(estado_in).values()) >= 3:
-			if sum(value is not None for value in vars(estado_in).values()) ==7:
-				print(f"{estado_in.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_in)
-		elif sum(value is not None for value in vars(estado_out).values()) >= 3:
-			if sum(value is not None for value in vars(estado_out).values()) ==7:
-				print(f"{estado_out.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_out)
+		self._definir_alguno(estado_in, estado_out)
 
 		# Ambos están definidos
 		if estado_in.v is not None and estado_out.v is not None:
 			if estado_in.v == estado_out.v:
-				print(f"Los volúmenes de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidos y son iguales.")
+				self._registrar('congruente', "Los volúmenes de los estados {} y {} fueron definidos y son iguales.", estado_in, estado_out)
 			else:
-				print(f"Los volúmenes de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidos pero no son iguales. Se recomienda revisar.")
+				self._registrar('incongruente', "Los volúmenes de los estados {} y {} fueron definidos pero no son iguales. Se recomienda revisar.", estado_in, estado_out)
 
 		# Solo el estado_in tiene volumen definido
 		elif estado_in.v is not None:
@@ -47,7 +112,7 @@ class ModeloTermodinamico:
 
 		# Ninguno tiene volumen definido
 		else:
-			print(f"Ninguno de los estados {estado_in.nombre} ni {estado_out.nombre} tiene el volumen definido. Se requiere al menos uno.")
+			self._registrar('datos_insuficientes', "Ninguno de los estados {} ni {} tiene el volumen definido. Se requiere al menos uno.", estado_in, estado_out)
 
 	def resolver_isotermico(self, estado_in, estado_out):
 		'''
@@ -58,23 +123,14 @@ class ModeloTermodinamico:
 			estado_out (Estado): Estado de salida en la secuencia del ciclo.
 		'''
 		# Definir alguno de los estados involucrados si es posible:
-		if sum(value is not None for value in vars(estado_in).values()) >= 3:
-			if sum(value is not None for value in vars(estado_in).values()) ==7:
-				print(f"{estado_in.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_in)
-		elif sum(value is not None for value in vars(estado_out).values()) >= 3:
-			if sum(value is not None for value in vars(estado_out).values()) ==7:
-				print(f"{estado_out.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_out)
+		self._definir_alguno(estado_in, estado_out)
 
 		# Ambos están definidos
 		if estado_in.T is not None and estado_out.T is not None:
 			if estado_in.T == estado_out.T:
-				print(f"Las temperaturas de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas y son iguales.")
+				self._registrar('congruente', "Las temperaturas de los estados {} y {} fueron definidas y son iguales.", estado_in, estado_out)
 			else:
-				print(f"Las temperaturas de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas pero no son iguales. Se recomienda revisar.")
+				self._registrar('incongruente', "Las temperaturas de los estados {} y {} fueron definidas pero no son iguales. Se recomienda revisar.", estado_in, estado_out)
 
 		# Solo el estado_in tiene temperatura definido
 		elif estado_in.T is not None:
@@ -86,7 +142,7 @@ class ModeloTermodinamico:
 
 		# Ninguno tiene volumen definido
 		else:
-			print(f"Ninguno de los estados {estado_in.nombre} ni {estado_out.nombre} tiene la temperatura definida. Se requiere al menos una.")
+			self._registrar('datos_insuficientes', "Ninguno de los estados {} ni {} tiene la temperatura definida. Se requiere al menos una.", estado_in, estado_out)
 
 	def resolver_isobarico(self,estado_in, estado_out):
 		'''
@@ -97,22 +153,13 @@ class ModeloTermodinamico:
 			estado_out (Estado): Estado de salida en la secuencia del ciclo.
 		'''
 		# Definir alguno de los estados involucrados si es posible:
-		if sum(value is not None for value in vars(estado_in).values()) >= 3:
-			if sum(value is not None for value in vars(estado_in).values()) ==7:
-				print(f"{estado_in.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_in)
-		elif sum(value is not None for value in vars(estado_out).values()) >= 3:
-			if sum(value is not None for value in vars(estado_out).values()) ==7:
-				print(f"{estado_out.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_out)
+		self._definir_alguno(estado_in, estado_out)
 
 		if estado_in.P is not None and estado_out.P is not None:
 			if estado_in.P == estado_out.P:
-				print(f"Las presiones de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas y son iguales.")
+				self._registrar('congruente', "Las presiones de los estados {} y {} fueron definidas y son iguales.", estado_in, estado_out)
 			else:
-				print(f"Las presiones de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas pero no son iguales. Se recomienda revisar.")
+				self._registrar('incongruente', "Las presiones de los estados {} y {} fueron definidas pero no son iguales. Se recomienda revisar.", estado_in, estado_out)
 
 		# Solo el estado_in tiene volumen definido
 		elif estado_in.P is not None:
@@ -124,7 +171,7 @@ class ModeloTermodinamico:
 
 		# Ninguno tiene volumen definido
 		else:
-			print(f"Ninguno de los estados {estado_in.nombre} ni {estado_out.nombre} tiene la presión definida. Se requiere al menos una.")
+			self._registrar('datos_insuficientes', "Ninguno de los estados {} ni {} tiene la presión definida. Se requiere al menos una.", estado_in, estado_out)
 
 	def resolver_isoentalpico(self, estado_in, estado_out):
 		'''
@@ -135,23 +182,14 @@ class ModeloTermodinamico:
 			estado_out (Estado): Estado de salida en la secuencia del ciclo.
 		'''
 		# Definir alguno de los estados involucrados si es posible:
-		if sum(value is not None for value in vars(estado_in).values()) >= 3:
-			if sum(value is not None for value in vars(estado_in).values()) ==7:
-				print(f"{estado_in.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_in)
-		elif sum(value is not None for value in vars(estado_out).values()) >= 2:
-			if sum(value is not None for value in vars(estado_out).values()) ==7:
-				print(f"{estado_out.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_out)
+		self._definir_alguno(estado_in, estado_out)
 
 		# Ambos están definidos
 		if estado_in.h is not None and estado_out.h is not None:
 			if estado_in.h == estado_out.h:
-				print(f"Las entalpias de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas y son iguales.")
+				self._registrar('congruente', "Las entalpias de los estados {} y {} fueron definidas y son iguales.", estado_in, estado_out)
 			else:
-				print(f"Las entalpias de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas pero no son iguales. Se recomienda revisar.")
+				self._registrar('incongruente', "Las entalpias de los estados {} y {} fueron definidas pero no son iguales. Se recomienda revisar.", estado_in, estado_out)
 
 		# Solo el estado_in tiene volumen definido
 		elif estado_in.h is not None:
@@ -163,7 +201,7 @@ class ModeloTermodinamico:
 
 		# Ninguno tiene volumen definido
 		else:
-			print(f"Ninguno de los estados {estado_in.nombre} ni {estado_out.nombre} tiene la entalpía definida. Se requiere al menos una.")
+			self._registrar('datos_insuficientes', "Ninguno de los estados {} ni {} tiene la entalpía definida. Se requiere al menos una.", estado_in, estado_out)
 
 	def resolver_isoentropico(self, estado_in, estado_out):
 		'''
@@ -174,23 +212,14 @@ class ModeloTermodinamico:
 			estado_out (Estado): Estado de salida en la secuencia del ciclo.
 		'''
 		# Definir alguno de los estados involucrados si es posible:
-		if sum(value is not None for value in vars(estado_in).values()) >= 3:
-			if sum(value is not None for value in vars(estado_in).values()) ==7:
-				print(f"{estado_in.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_in)
-		elif sum(value is not None for value in vars(estado_out).values()) >= 2:
-			if sum(value is not None for value in vars(estado_out).values()) ==7:
-				print(f"{estado_out.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_out)
+		self._definir_alguno(estado_in, estado_out)
 
 		# Ambos están definidos
 		if estado_in.s is not None and estado_out.s is not None:
 			if estado_in.s == estado_out.s:
-				print(f"Las entropías de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas y son iguales.")
+				self._registrar('congruente', "Las entropías de los estados {} y {} fueron definidas y son iguales.", estado_in, estado_out)
 			else:
-				print(f"Las entropías de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas pero no son iguales. Se recomienda revisar.")
+				self._registrar('incongruente', "Las entropías de los estados {} y {} fueron definidas pero no son iguales. Se recomienda revisar.", estado_in, estado_out)
 
 		# Solo el estado_in tiene volumen definido
 		elif estado_in.s is not None:
@@ -202,7 +231,7 @@ class ModeloTermodinamico:
 
 		# Ninguno tiene volumen definido
 		else:
-			print(f"Ninguno de los estados {estado_in.nombre} ni {estado_out.nombre} tiene la entropía definida. Se requiere al menos una.")
+			self._registrar('datos_insuficientes', "Ninguno de los estados {} ni {} tiene la entropía definida. Se requiere al menos una.", estado_in, estado_out)
 
 	def resolver_politropico(self, estado_in, estado_out, n):
 		raise NotImplementedError()
@@ -218,25 +247,16 @@ class ModeloTermodinamico:
 			estado_out (Estado): Estado de salida en la secuencia del ciclo.
 		'''
 		# Definir alguno de los estados involucrados si es posible:
-		if sum(value is not None for value in vars(estado_in).values()) >= 2:
-			if sum(value is not None for value in vars(estado_in).values()) ==6:
-				print(f"{estado_in.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_in)
-		elif sum(value is not None for value in vars(estado_out).values()) >= 2:
-			if sum(value is not None for value in vars(estado_out).values()) ==6:
-				print(f"{estado_out.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_out)
+		self._definir_alguno(estado_in, estado_out)
 
 		# Revisar que las temperatura de los estados sean la misma
 
 		# Ambos están definidos
 		if estado_in.T is not None and estado_out.T is not None:
 			if estado_in.T == estado_out.T:
-				print(f"Las temperaturas de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas y son iguales.")
+				self._registrar('congruente', "Las temperaturas de los estados {} y {} fueron definidas y son iguales.", estado_in, estado_out)
 			else:
-				print(f"Las temperaturas de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas pero no son iguales. Se recomienda revisar.")
+				self._registrar('incongruente', "Las temperaturas de los estados {} y {} fueron definidas pero no son iguales. Se recomienda revisar.", estado_in, estado_out)
 
 		# Solo el estado_in tiene temperatura definido
 		elif estado_in.T is not None:
@@ -248,7 +268,7 @@ class ModeloTermodinamico:
 
 		# Ninguno tiene volumen definido
 		else:
-			print(f"Ninguno de los estados {estado_in.nombre} ni {estado_out.nombre} tiene la temperatura definida. Se requiere al menos una.")
+			self._registrar('datos_insuficientes', "Ninguno de los estados {} ni {} tiene la temperatura definida. Se requiere al menos una.", estado_in, estado_out)
 
 	""" def resolver_interenfriamiento_recalentamiento(self, estado_in, estado_out, delta_T):
 		'''
@@ -262,16 +282,7 @@ class ModeloTermodinamico:
 			delta_T (float): Cambio de temperatura estado_out.T - estado_in.T.
 		'''
 		# Definir alguno de los estados involucrados si es posible:
-		if sum(value is not None for value in vars(estado_in).values()) >= 2:
-			if sum(value is not None for value in vars(estado_in).values()) ==6:
-				print(f"{estado_in.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_in)
-		elif sum(value is not None for value in vars(estado_out).values()) >= 2:
-			if sum(value is not None for value in vars(estado_out).values()) ==6:
-				print(f"{estado_out.nombre} esta definido")
-			else:
-				self.calcular_estado(estado_out)
+		self._definir_alguno(estado_in, estado_out)
 
 		# Revisar que las temperatura de los estados sean la misma
 
@@ -340,6 +351,57 @@ class ModeloTermodinamico:
 """
 
 
+	def trabajo_y_calor(self, tipo, inicial, final, **parametros):
+		"""
+		Trabajo y calor de procesos cuasiestáticos, en forma cerrada según el tipo de proceso y de forma vectorizada.
+
+		Las expresiones dependen solo de los estados extremos, por lo que el costo no depende de cuántos estados
+		internos tenga la trayectoria. El trabajo de los procesos isocóricos, isobáricos e isoentrópicos es común a
+		todos los modelos; el de los isotérmicos e isoentálpicos lo da cada modelo a partir de su ecuación de estado
+		(`_trabajo_isotermico` y `_trabajo_isoentalpico`). El calor se obtiene de la primera ley, Q = Δu + W.
+
+		Args:
+			tipo (str): 'isocorico', 'isotermico', 'isobarico', 'isoentalipico', 'isoentropico' o 'in_or_out_calor'.
+			inicial, final (dict[str, array_like]): Propiedades 'P', 'T', 'v', 'u', 'h' y 's' de los estados inicial y
+				final de cada proceso; los arreglos pueden tener cualquier forma común (procesos, ciclos, ...).
+			**parametros: Parámetros del proceso tal como se registraron (por ejemplo `calor`); las expresiones
+				cerradas no los necesitan.
+
+		Returns:
+			tuple[np.ndarray, np.ndarray]: Trabajo realizado por el sistema y calor recibido (J/kg) de cada proceso.
+
+		Raises:
+			ValueError: Si el tipo de proceso no es válido.
+		"""
+		inicial = {nombre: np.asarray(valor, dtype=float) for nombre, valor in inicial.items()}
+		final = {nombre: np.asarray(valor, dtype=float) for nombre, valor in final.items()}
+		delta_u = final['u'] - inicial['u']
+		if tipo == 'isocorico':
+			W = np.zeros_like(delta_u)
+		elif tipo == 'isobarico':
+			W = inicial['P']*(final['v'] - inicial['v'])
+		elif tipo == 'isoentropico':
+			return -delta_u, np.zeros_like(delta_u)
+		elif tipo in ('isotermico', 'in_or_out_calor'):
+			W = self._trabajo_isotermico(inicial, final)
+		elif tipo == 'isoentalipico':
+			W = self._trabajo_isoentalpico(inicial, final)
+		else:
+			raise ValueError(f"Tipo de proceso '{tipo}' no válido.")
+		return W, delta_u + W
+
+	def _trabajo_isotermico(self, inicial, final):
+		"""
+		Trabajo de un proceso isotérmico reversible, W = T Δs - Δu, válido para cualquier modelo con entropía congruente.
+		"""
+		return inicial['T']*(final['s'] - inicial['s']) - (final['u'] - inicial['u'])
+
+	def _trabajo_isoentalpico(self, inicial, final):
+		"""
+		Trabajo de un proceso isoentálpico cuasiestático; depende de la ecuación de estado de cada modelo.
+		"""
+		raise NotImplementedError("Este método debe ser implementado en una subclase.")
+
 	def calcular_estado(self, estado, **kwargs):
 		"""
 		Método abstracto para calcular las propiedades de un estado.
@@ -353,7 +415,282 @@ class ModeloTermodinamico:
 		"""
 		raise NotImplementedError("Este método debe ser implementado en una subclase.")
 
+	def calcular_estados(self, P=None, T=None, v=None, h=None, s=None, x=None):
+		"""
+		Calcula las propiedades de muchos estados a la vez a partir de arreglos de propiedades conocidas.
+
+		Cada punto puede usar una combinación de entrada distinta: los valores desconocidos se indican con
+		`None` o `NaN`. Esta implementación genérica evalúa `calcular_estado` punto a punto; los modelos que
+		puedan vectorizar sus ecuaciones deben sobrescribirla.
+
+		Args:
+			P, T, v, h, s, x (float | array_like, optional): Propiedades conocidas. Se difunden (broadcast) a una forma común.
+
+		Returns:
+			dict[str, np.ndarray]: Arreglos con 'P', 'T', 'v', 'u', 'h', 's' y 'x'. Los puntos que no se puedan
+			resolver quedan con `NaN`.
+		"""
+		entradas = _arreglos_entrada(P=P, T=T, v=v, h=h, s=s, x=x)
+		forma = entradas['P'].shape
+		resultado = {nombre: np.full(forma, np.nan) for nombre in _PROPIEDADES}
+		for indice in np.ndindex(forma):
+			punto = _EstadoPuntual(**{nombre: float(valor[indice]) for nombre, valor in entradas.items() if not np.isnan(valor[indice])})
+			self.calcular_estado(punto)
+			for nombre in _PROPIEDADES:
+				valor = getattr(punto, nombre)
+				if valor is not None:
+					resultado[nombre][indice] = valor
+		return resultado
+
+
+_PROPIEDADES = ('P', 'T', 'v', 'u', 'h', 's', 'x')
+
+class _CacheEstados:
+	"""
+	Memoria LRU de resultados de `calcular_estado`, con estadísticas de uso.
+	"""
+
+	def __init__(self, tamano_maximo, cifras):
+		if tamano_maximo < 1:
+			raise ValueError("El tamaño máximo de la memoria debe ser al menos 1.")
+		self.tamano_maximo = int(tamano_maximo)
+		self.cifras = int(cifras)
+		self.huella = None
+		self.resultados = OrderedDict()
+		self.aciertos = self.fallos = self.desalojos = self.invalidaciones = 0
+
+	def llave(self, huella, estado):
+		"""Llave del estado: huella del modelo y propiedades conocidas, redondeadas a `cifras` cifras significativas."""
+		if huella != self.huella:
+			# Cambiaron los parámetros del modelo: los resultados guardados ya no son válidos
+			if self.resultados:
+				self.invalidaciones += 1
+				self.resultados.clear()
+			self.huella = huella
+		conocidas = tuple((nombre, float(f"{valor:.{self.cifras}g}")) for nombre in _PROPIEDADES
+						  if (valor := getattr(estado, nombre)) is not None)
+		return huella, conocidas
+
+	def buscar(self, llave):
+		"""Devuelve las propiedades guardadas para la llave (o `None`) y la marca como usada recientemente."""
+		valores = self.resultados.get(llave)
+		if valores is None:
+			self.fallos += 1
+			return None
+		self.aciertos += 1
+		self.resultados.move_to_end(llave)
+		return valores
+
+	def guardar(self, llave, valores):
+		"""Guarda las propiedades calculadas, desalojando la menos usada si se supera el tamaño máximo."""
+		self.resultados[llave] = valores
+		if len(self.resultados) > self.tamano_maximo:
+			self.resultados.popitem(last=False)
+			self.desalojos += 1
+
+	def estadisticas(self):
+		"""Diccionario con aciertos, fallos, desalojos, invalidaciones y tamaño actual."""
+		return {'aciertos': self.aciertos, 'fallos': self.fallos, 'desalojos': self.desalojos,
+				'invalidaciones': self.invalidaciones, 'tamano': len(self.resultados)}
+
+def _valor_huella(valor):
+	"""Convierte un parámetro en un valor comparable para la huella; los objetos no hashables se comparan por identidad."""
+	if isinstance(valor, (list, tuple, np.ndarray)):
+		return tuple(_valor_huella(elemento) for elemento in valor)
+	try:
+		hash(valor)
+	except TypeError:
+		return id(valor)
+	return valor
+
+def _numero_definidas(estado):
+	"""Número de propiedades termodinámicas (sin contar la calidad) conocidas en el estado."""
+	return sum(getattr(estado, nombre) is not None for nombre in _PROPIEDADES if nombre != 'x')
+
+def _envolver_calcular_estado(calcular_estado):
+	"""
+	Envuelve el `calcular_estado` de un modelo. Si el estado está vigente no se recalcula y se cuenta en
+	`calculos_evitados`; si no, se delimita el cálculo en el estado (`comenzar_calculo`/`terminar_calculo`) para
+	marcar las propiedades derivadas. La memoria del modelo solo se consulta si está activa: sin ella, la llamada
+	va directo al `calcular_estado` original, sin armar llaves. En un acierto de la memoria solo se asignan las
+	propiedades que el estado no tenía; las conocidas se dejan como están.
+	"""
+	def calcular_con_cache(self, estado, cache):
+		llave = cache.llave(self._huella_parametros(), estado)
+		valores = cache.buscar(llave)
+		if valores is not None:
+			for nombre, valor in valores.items():
+				if getattr(estado, nombre) is None:
+					setattr(estado, nombre, valor)
+			return None
+		resultado = calcular_estado(self, estado)
+		cache.guardar(llave, {nombre: getattr(estado, nombre) for nombre in _PROPIEDADES})
+		return resultado
+
+	@functools.wraps(calcular_estado)
+	def calcular_estado_envuelto(self, estado, *args, **kwargs):
+		if args or kwargs:
+			return calcular_estado(self, estado, *args, **kwargs)
+		cache = self._cache
+		comenzar_calculo = getattr(estado, 'comenzar_calculo', None)
+		if comenzar_calculo is None:
+			# Estados sin seguimiento de entradas (por ejemplo `_EstadoPuntual`)
+			return calcular_estado(self, estado) if cache is None else calcular_con_cache(self, estado, cache)
+		if estado.vigente:
+			self.calculos_evitados += 1
+			return None
+		comenzar_calculo()
+		try:
+			return calcular_estado(self, estado) if cache is None else calcular_con_cache(self, estado, cache)
+		finally:
+			estado.terminar_calculo()
+	return calcular_estado_envuelto
+
+class _EstadoPuntual:
+	"""
+	Estado mínimo usado internamente para evaluar `calcular_estado` dentro de los cálculos por lotes.
+	"""
+
+	__slots__ = ('nombre', 'P', 'T', 'v', 'u', 'h', 's', 'x')
+
+	def __init__(self, nombre=0, **propiedades):
+		self.nombre = nombre
+		self.P = self.T = self.v = self.u = self.h = self.s = None
+		self.x = 1
+		for nombre_prop, valor in propiedades.items():
+			setattr(self, nombre_prop, valor)
+
+def _arreglos_entrada(**propiedades):
+	"""
+	Convierte las propiedades conocidas en arreglos float64 escribibles de forma común, con `NaN` para las desconocidas.
+	"""
+	arreglos = np.broadcast_arrays(*(np.asarray(np.nan if valor is None else valor, dtype=float) for valor in propiedades.values()))
+	return {nombre: np.array(arreglo, dtype=float) for nombre, arreglo in zip(propiedades, arreglos)}
+
+
+
+def _evaluar_calor(calor, T):
+	"""
+	Evalúa una capacidad calorífica (constante, función o expresión de sympy) sobre un arreglo de temperaturas.
+
+	Args:
+		calor (float | callable | sympy.Expr): Capacidad calorífica.
+		T (np.ndarray): Temperaturas [K].
+
+	Returns:
+		np.ndarray: Valores de la capacidad calorífica con la misma forma que `T`.
+	"""
+	T = np.asarray(T, dtype=float)
+	if hasattr(calor, 'free_symbols'):
+		import sympy
+		calor = sympy.lambdify(sorted(calor.free_symbols, key=str), calor, 'numpy')
+	if not callable(calor):
+		return np.full(T.shape, float(calor))
+	try:
+		valores = np.asarray(calor(T), dtype=float)
+	except (TypeError, ValueError):
+		valores = None
+	if valores is None or valores.shape != T.shape:
+		# La función no admite arreglos; se evalúa punto a punto
+		valores = np.vectorize(calor, otypes=[float])(T)
+	return valores
+
+def _evaluar_calor_sobre_T(calor, T):
+	"""Evalúa calor(T)/T, el integrando de la entropía (ver `_evaluar_calor`)."""
+	return _evaluar_calor(calor, T)/T
+
+class _TablaIntegral:
+	r"""
+	Tabla acumulada de $F(T) = \int_{T_0}^{T} f(T')\,dT'$ sobre una malla uniforme de temperaturas.
+
+	Cada intervalo de la malla se integra con cuadratura de Gauss-Legendre de 5 puntos (exacta para integrandos
+	polinómicos de grado 9 o menor) y $F$ se interpola con splines cúbicos de Hermite usando $F' = f$ en los nodos.
+	El error de interpolación está acotado por $\Delta T^4 \max|f^{(3)}| / 384$; con la malla por defecto
+	(1024 nodos entre 100 K y 3500 K) es menor que 1e-6 J/kg (J/kg·K para la entropía) con los polinomios de cp usuales.
+
+	Args:
+		integrando (callable): Función vectorizada f(T).
+		T0 (float): Temperatura de referencia, donde F(T0) = 0 [K].
+		T_min, T_max (float): Rango de la tabla [K].
+		n (int): Número de nodos de la malla.
+	"""
 
+	def __init__(self, integrando, T0, T_min, T_max, n):
+		self.integrando = integrando
+		self.T0 = T0
+		self.T = np.linspace(T_min, T_max, n)
+		self.dT = self.T[1] - self.T[0]
+		self.f = integrando(self.T)
+
+		x_gauss, w_gauss = np.polynomial.legendre.leggauss(5)
+		nodos = (self.T[:-1, None] + self.T[1:, None])/2 + x_gauss[None, :]*self.dT/2
+		parciales = (integrando(nodos.ravel()).reshape(nodos.shape) @ w_gauss)*self.dT/2
+		self.F = np.concatenate(([0.0], np.cumsum(parciales)))
+		self.F -= self.evaluar(T0)
+
+	def contiene(self, T):
+		"""Devuelve una máscara con las temperaturas que se encuentran dentro del rango de la tabla."""
+		return (T >= self.T[0]) & (T <= self.T[-1])
+
+	def _intervalo(self, T):
+		"""Índice del intervalo de la malla y coordenada local t en [0, 1] de cada temperatura."""
+		k = np.clip(np.floor(np.nan_to_num((T - self.T[0])/self.dT)).astype(np.intp), 0, len(self.T) - 2)
+		return k, (T - self.T[k])/self.dT
+
+	def evaluar(self, T):
+		"""
+		Interpola F(T). Las temperaturas fuera del rango de la tabla se extrapolan con el polinomio del intervalo extremo.
+		"""
+		T = np.asarray(T, dtype=float)
+		k, t = self._intervalo(T)
+		h00 = (1 + 2*t)*(1 - t)**2
+		h10 = t*(1 - t)**2
+		h01 = t**2*(3 - 2*t)
+		h11 = t**2*(t - 1)
+		return h00*self.F[k] + h10*self.dT*self.f[k] + h01*self.F[k + 1] + h11*self.dT*self.f[k + 1]
+
+	def _evaluar_con_derivada(self, T):
+		"""Devuelve F(T) y dF/dT del interpolante de Hermite en una sola pasada."""
+		k, t = self._intervalo(T)
+		F_k, F_k1, f_k, f_k1 = self.F[k], self.F[k + 1], self.f[k], self.f[k + 1]
+		t2 = t*t
+		F = (1 + 2*t)*(1 - t)**2*F_k + t*(1 - t)**2*self.dT*f_k + t2*(3 - 2*t)*F_k1 + t2*(t - 1)*self.dT*f_k1
+		dF = (6*t2 - 6*t)*(F_k - F_k1)/self.dT + (3*t2 - 4*t + 1)*f_k + (3*t2 - 2*t)*f_k1
+		return F, dF
+
+	def rango(self, c_log=0.0):
+		"""Valores mínimo y máximo de G(T) = F(T) + c_log ln(T/T0) dentro de la tabla."""
+		G_nodos = self.F + c_log*np.log(self.T/self.T0)
+		return G_nodos[0], G_nodos[-1]
+
+	def invertir(self, y, c_log=0.0, tol=1e-10, max_iter=6):
+		r"""
+		Resuelve $G(T) = F(T) + c_{log}\ln(T/T_0) = y$ para T, con G monótona creciente en el rango de la tabla.
+
+		La estimación inicial se obtiene interpolando linealmente la tabla invertida (error del orden de 1e-3 K con
+		la malla por defecto) y se pule con pasos de Newton sobre el interpolante de Hermite; dos pasos suelen
+		bastar para llegar a precisión de máquina, y `evaluar` e `invertir` quedan consistentes entre sí. Los
+		valores de `y` fuera de `rango(c_log)` se devuelven en el extremo correspondiente de la tabla.
+
+		Args:
+			y (array_like): Valores objetivo de G.
+			c_log (float): Coeficiente del término logarítmico (por ejemplo -R_gas para la entropía a volumen constante).
+			tol (float): Tolerancia relativa en T para detener las iteraciones.
+			max_iter (int): Número máximo de pasos de Newton.
+
+		Returns:
+			np.ndarray: Temperaturas [K].
+		"""
+		y = np.asarray(y, dtype=float)
+		G_nodos = self.F + c_log*np.log(self.T/self.T0)
+		T = np.interp(y, G_nodos, self.T)
+		for _ in range(max_iter):
+			F, dF = self._evaluar_con_derivada(T)
+			paso = (F + c_log*np.log(T/self.T0) - y)/(dF + c_log/T)
+			T = np.clip(T - paso, self.T[0], self.T[-1])
+			if not np.any(np.abs(paso) > tol*T):
+				break
+		return T
 
 class ModeloGasIdeal(ModeloTermodinamico):
 	r"""
@@ -380,12 +717,20 @@ class ModeloGasIdeal(ModeloTermodinamico):
 				- Una función (`callable`) que reciba la temperatura y devuelva el valor numérico.
 		T0 (float): Temperatura de referencia [K].
 		P0 (float): Presión de referencia [Pa].
+		T_min, T_max (float): Rango de temperaturas [K] de las tablas de integrales de cp y cv. Solo se usa con calores variables.
+		n_tabla (int): Número de nodos de las tablas de integrales. Solo se usa con calores variables.
+
+	Con calores variables, las integrales $\int c_v\,dT$, $\int c_p\,dT$ y $\int c_p/T\,dT$ se tabulan una sola vez
+	al construir el modelo (ver `_TablaIntegral`) y se reconstruyen solo si se reasignan `cp` o `cv`. Las
+	temperaturas fuera de [T_min, T_max] se integran directamente con `quad`.
 
 	Métodos:
 		calcular_estado(estado, **kwargs): Calcula propiedades del estado con base en combinaciones de propiedades conocidas.
 	"""
 
-	def __init__(self, calores_constantes = True, R_gas=287, cp = 1005, cv = 0.718, T0=298.15, P0=101325):
+	parametros = ('calores_constantes', 'R_gas', 'cp', 'cv', 'T0', 'P0', 'v0', 'T_min', 'T_max', 'n_tabla')
+
+	def __init__(self, calores_constantes = True, R_gas=287, cp = 1005, cv = 0.718, T0=298.15, P0=101325, T_min=100, T_max=3500, n_tabla=1024):
 		self.calores_constantes = calores_constantes
 		self.R_gas = float(R_gas)
 		if self.calores_constantes == True:
@@ -399,8 +744,50 @@ class ModeloGasIdeal(ModeloTermodinamico):
 		self.T0 = float(T0)
 		self.P0 = float(P0)
 		self.v0 = self.R_gas*self.T0/self.P0  # volumen específico de referencia
+		self.T_min = float(T_min)
+		self.T_max = float(T_max)
+		self.n_tabla = int(n_tabla)
+		if not self.calores_constantes:
+			if not self.T_min < self.T0 < self.T_max:
+				raise ValueError("La temperatura de referencia T0 debe estar dentro del rango [T_min, T_max] de las tablas.")
+			self._tablas_calores()
+
+	@property
+	def cp(self):
+		"""Capacidad calorífica a presión constante. Reasignarla invalida las tablas de integrales."""
+		return self._cp
+
+	@cp.setter
+	def cp(self, valor):
+		self._cp = valor
+		self._tablas = None
+
+	@property
+	def cv(self):
+		"""Capacidad calorífica a volumen constante. Reasignarla invalida las tablas de integrales."""
+		return self._cv
+
+	@cv.setter
+	def cv(self, valor):
+		self._cv = valor
+		self._tablas = None
+
+	def _tablas_calores(self):
+		"""
+		Devuelve las tablas de integrales acumuladas de cv, cp y cp/T, construyéndolas si no existen.
 
-
+		Returns:
+			dict[str, _TablaIntegral]: Tablas con las llaves 'cv', 'cp' y 'cp/T'.
+		"""
+		if self._tablas is None:
+			# Integrandos sin funciones locales, para que el modelo se pueda serializar con sus tablas
+			integrandos = {
+				'cv': functools.partial(_evaluar_calor, self._cv),
+				'cp': functools.partial(_evaluar_calor, self._cp),
+				'cp/T': functools.partial(_evaluar_calor_sobre_T, self._cp),
+			}
+			self._tablas = {clave: _TablaIntegral(f, self.T0, self.T_min, self.T_max, self.n_tabla) for clave, f in integrandos.items()}
+		return self._tablas
 
 	def resolver_isocorico(self, estado_in, estado_out):
 		super().resolver_isocorico(estado_in, estado_out)
@@ -452,9 +839,9 @@ class ModeloGasIdeal(ModeloTermodinamico):
 		# Ambos están definidos
 		if estado_in.T is not None and estado_out.T is not None:
 			if estado_in.T == estado_out.T:
-				print(f"Las temperaturas de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas y son iguales.")
+				self._registrar('congruente', "Las temperaturas de los estados {} y {} fueron definidas y son iguales.", estado_in, estado_out)
 			else:
-				print(f"Las temperaturas de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas pero no son iguales. Se recomienda revisar.")
+				self._registrar('incongruente', "Las temperaturas de los estados {} y {} fueron definidas pero no son iguales. Se recomienda revisar.", estado_in, estado_out)
 
 		# Solo el estado_in tiene volumen definido
 		elif estado_in.T is not None:
@@ -466,7 +853,7 @@ class ModeloGasIdeal(ModeloTermodinamico):
 
 		# Ninguno tiene volumen definido
 		else:
-			print(f"Ninguno de los estados {estado_in.nombre} ni {estado_out.nombre} tiene la temperatura definida. Se requiere al menos una.")
+			self._registrar('datos_insuficientes', "Ninguno de los estados {} ni {} tiene la temperatura definida. Se requiere al menos una.", estado_in, estado_out)
 
 		def isoentalpico_ModeloGasIdeal(v):
 			"""
@@ -491,16 +878,16 @@ class ModeloGasIdeal(ModeloTermodinamico):
 				if estado_in.P is not None:
 					return estado_in.P*(estado_in.v/v)**(self.cp/self.cv)
 				else:
-					print("ERROR: No estan definida la presion en el estado de entrada")
+					self._registrar('dato_faltante', "No esta definida la presion en el estado {}", estado_in)
 					return None
 			elif estado_out.v is not None:
 				if estado_out.P is not None:
 					return  estado_out.P*(estado_out.v/v)**(self.cp/self.cv)
 				else:
-					print("ERROR: No estan definida la presion en el estado de salida")
+					self._registrar('dato_faltante', "No esta definida la presion en el estado {}", estado_out)
 					return None
 			else:
-				print("ERROR: No estan definidos los volumenes")
+				self._registrar('dato_faltante', "No estan definidos los volumenes de los estados {} ni {}", estado_in, estado_out)
 				return None
 		return isoentropico_ModeloGasIdeal
 
@@ -511,12 +898,13 @@ class ModeloGasIdeal(ModeloTermodinamico):
 		# La entropia
 		if estado_in.s is not None and estado_out.s is not None:
 			if estado_in.s == estado_out.s:
-				print(f"Las entropias de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidos y son iguales. Esto es un error, agregar o sacar calor cambia la entropia.")
+				self._registrar('incongruente', "Las entropias de los estados {} y {} fueron definidos y son iguales. Esto es un error, agregar o sacar calor cambia la entropia.", estado_in, estado_out)
 			else:
 				if (estado_in.s -(estado_out.s + calor/estado_out.T)< 1e-6):
-					print(f"Las entropias de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidos pero no son iguales. Son congruentes con el cambio esperado")
+					self._registrar('congruente', "Las entropias de los estados {} y {} fueron definidos pero no son iguales. Son congruentes con el cambio esperado", estado_in, estado_out)
 				else:
-					print(f"Las entropias de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidos pero no son iguales. NO SON congruentes con el cambio esperado " + r"$\Delta$ s =" + f"{estado_in.s - estado_out.s}" + r"Q/T =" +f"{calor/estado_out.T}")
+					self._registrar('incongruente', "Las entropias de los estados {} y {} fueron definidos pero no son iguales. NO SON congruentes con el cambio esperado: Δs = {delta_s}, Q/T = {calor_T}", estado_in, estado_out,
+									 delta_s=estado_in.s - estado_out.s, calor_T=calor/estado_out.T)
 
 		# Solo el estado_in tiene volumen definido
 		elif estado_in.s is not None:
@@ -532,7 +920,7 @@ class ModeloGasIdeal(ModeloTermodinamico):
 
 		# Ninguno tiene volumen definido
 		else:
-			print(f"Ninguno de los estados {estado_in.nombre} ni {estado_out.nombre} puede ser definido.")
+			self._registrar('datos_insuficientes', "Ninguno de los estados {} ni {} puede ser definido.", estado_in, estado_out)
 
 		def in_or_out_calor_ModeloGasIdeal(v):
 			"""
@@ -558,6 +946,151 @@ class ModeloGasIdeal(ModeloTermodinamico):
 		super().resolver_politropico(estado_in, estado_out)
 		# Gas ideal
 
+	def _trabajo_isotermico(self, inicial, final):
+		"""Trabajo isotérmico del gas ideal, W = R T ln(v_f/v_i)."""
+		return self.R_gas*inicial['T']*np.log(final['v']/inicial['v'])
+
+	def _trabajo_isoentalpico(self, inicial, final):
+		"""En el gas ideal h depende solo de T, así que el proceso isoentálpico es isotérmico."""
+		return self._trabajo_isotermico(inicial, final)
+
+	def _integral_desde_T0(self, clave, T):
+		"""
+		Integra una capacidad calorífica variable desde T0 hasta T usando las tablas del modelo.
+
+		Args:
+			clave (str): Integrando: 'cv', 'cp' o 'cp/T'.
+			T (float | array_like): Temperatura(s) final(es) [K].
+
+		Returns:
+			float | np.ndarray: Valor de la integral para cada temperatura.
+		"""
+		tabla = self._tablas_calores()[clave]
+		T = np.asarray(T, dtype=float)
+		resultado = tabla.evaluar(T)
+		fuera = ~tabla.contiene(T) & ~np.isnan(T)
+		if np.any(fuera):
+			# Fuera del rango tabulado se integra directamente
+			from scipy.integrate import quad
+			integrando = lambda t: float(tabla.integrando(np.asarray(t)))
+			integrar = np.vectorize(lambda t: quad(integrando, self.T0, t)[0], otypes=[float])
+			resultado = np.where(fuera, integrar(np.where(fuera, T, self.T0)), resultado)
+		return float(resultado) if resultado.ndim == 0 else resultado
+
+	def _invertir_integral(self, clave, y, c_log=0.0, max_iter=50):
+		"""
+		Invierte una integral de capacidad calorífica: encuentra T tal que integral(T) + c_log ln(T/T0) = y.
+
+		Usa la inversión de la tabla (`_TablaIntegral.invertir`). Si el resultado queda fuera del rango tabulado,
+		se pule con Newton sobre la integral directa con `quad`.
+
+		Args:
+			clave (str): Integrando: 'cv', 'cp' o 'cp/T'.
+			y (float | array_like): Valores objetivo.
+			c_log (float): Coeficiente del término logarítmico.
+
+		Returns:
+			float | np.ndarray: Temperaturas [K].
+		"""
+		tabla = self._tablas_calores()[clave]
+		y = np.asarray(y, dtype=float)
+		T = tabla.invertir(y, c_log)
+		y_min, y_max = tabla.rango(c_log)
+		fuera = (y < y_min) | (y > y_max)
+		if np.any(fuera):
+			T_fuera, y_fuera = T[fuera], y[fuera]
+			for _ in range(max_iter):
+				residuo = self._integral_desde_T0(clave, T_fuera) + c_log*np.log(T_fuera/self.T0) - y_fuera
+				paso = residuo/(tabla.integrando(T_fuera) + c_log/T_fuera)
+				T_fuera = T_fuera - paso
+				if not np.any(np.abs(paso) > 1e-12*np.abs(T_fuera)):
+					break
+			T = np.array(T)
+			T[fuera] = T_fuera
+		return float(T) if T.ndim == 0 else T
+
+	def _energia_interna(self, T):
+		"""Energía interna específica u(T) relativa a T0 [J/kg]."""
+		if self.calores_constantes:
+			return self.cv*(T - self.T0)
+		return self._integral_desde_T0('cv', T)
+
+	def _entalpia(self, T):
+		"""Entalpía específica h(T) relativa a T0 [J/kg]."""
+		if self.calores_constantes:
+			return self.cp*(T - self.T0)
+		return self._integral_desde_T0('cp', T)
+
+	def _entropia_estandar(self, T):
+		r"""Función de entropía $s^\circ(T) = \int_{T_0}^{T} c_p/T\,dT$ [J/kg·K]."""
+		if self.calores_constantes:
+			return self.cp*np.log(T/self.T0)
+		return self._integral_desde_T0('cp/T', T)
+
+	def _entropia(self, T, P):
+		"""Entropía específica s(T, P) relativa al estado de referencia (T0, P0) [J/kg·K]."""
+		return self._entropia_estandar(T) - self.R_gas*np.log(P/self.P0)
+
+	def _temperatura_desde_h(self, h):
+		"""Temperatura a partir de la entalpía específica."""
+		if self.calores_constantes:
+			return self.T0 + h/self.cp
+		return self._invertir_integral('cp', h)
+
+	def _temperatura_desde_u(self, u):
+		"""Temperatura a partir de la energía interna específica."""
+		if self.calores_constantes:
+			return self.T0 + u/self.cv
+		return self._invertir_integral('cv', u)
+
+	def _temperatura_desde_s0(self, s0):
+		r"""Temperatura a partir de la función de entropía $s^\circ(T)$."""
+		if self.calores_constantes:
+			return self.T0*np.exp(s0/self.cp)
+		return self._invertir_integral('cp/T', s0)
+
+	def _temperatura_desde_sv(self, s, v):
+		"""Temperatura a partir de la entropía y el volumen específico."""
+		if self.calores_constantes:
+			return self.T0*np.exp((1/self.cv)*(s - self.R_gas*np.log(v/self.v0)))
+		# s = s°(T) - R ln(T/T0) + R ln(v/v0)
+		return self._invertir_integral('cp/T', s - self.R_gas*np.log(v/self.v0), c_log=-self.R_gas)
+
+	def _temperatura_desde_sP(self, s, P):
+		"""Temperatura a partir de la entropía y la presión."""
+		if self.calores_constantes:
+			return self.T0*np.exp((1/self.cp)*(s + self.R_gas*np.log(P/self.P0)))
+		return self._temperatura_desde_s0(s + self.R_gas*np.log(P/self.P0))
+
+	def buscar_temperatura(self, h=None, u=None, s0=None):
+		r"""
+		Búsqueda inversa de temperatura al estilo de las tablas de gas ideal, vectorizada.
+
+		Se debe entregar exactamente una de las propiedades. Con calores variables se usa la tabla de integrales
+		del modelo con refinamiento de Newton, por lo que el resultado es consistente con `calcular_estados`.
+
+		Args:
+			h (float | array_like, optional): Entalpía específica relativa a T0 [J/kg].
+			u (float | array_like, optional): Energía interna específica relativa a T0 [J/kg].
+			s0 (float | array_like, optional): Función de entropía $s^\circ(T)$ [J/kg·K].
+
+		Returns:
+			float | np.ndarray: Temperatura(s) [K].
+
+		Raises:
+			ValueError: Si no se entrega exactamente una propiedad.
+		"""
+		dados = {nombre: valor for nombre, valor in (('h', h), ('u', u), ('s0', s0)) if valor is not None}
+		if len(dados) != 1:
+			raise ValueError("Se debe entregar exactamente una de las propiedades h, u o s0.")
+		nombre, valor = dados.popitem()
+		inversa = {'h': self._temperatura_desde_h, 'u': self._temperatura_desde_u, 's0': self._temperatura_desde_s0}[nombre]
+		return inversa(np.asarray(valor, dtype=float) if np.ndim(valor) else float(valor))
+
+	def _presion_desde_Ts(self, T, s):
+		"""Presión a partir de la temperatura y la entropía."""
+		return self.P0*np.exp((1/self.R_gas)*(self._entropia_estandar(T) - s))
+
 	def calcular_estado(self, estado):
 		"""
 		Calcula las propiedades del estado en función de combinaciones de propiedades conocidas.
@@ -580,120 +1113,191 @@ class ModeloGasIdeal(ModeloTermodinamico):
 		"""
 
 		# A continuacion se presentan los casos que va a revisar el programa si se tiene los datos y calcula los datos faltantes si es posible
+		# Los casos definen T y P (y v si no es dato); el resto de propiedades se obtiene a partir de T y P.
+		entropia_desconocida = True
+
+		# Caso 1: Conozco Presión (P) y Temperatura (T)
+		if (estado.P is not None) and (estado.T is not None):
+			estado.v = self.R_gas * estado.T / estado.P
+
+		# Caso 2: Conozco Presión (P) y Volumen (v)
+		elif (estado.P is not None) and (estado.v is not None):
+			estado.T = estado.P * estado.v / self.R_gas
+
+		# Caso 3: Conozco Temperatura (T) y Volumen (v)
+		elif (estado.T is not None) and (estado.v is not None):
+			estado.P = self.R_gas * estado.T / estado.v
+
+		# Caso 4: Conozco Presión (P) y Entalpía (h)
+		elif (estado.P is not None) and (estado.h is not None):
+			estado.T = self._temperatura_desde_h(estado.h)
+			estado.v = self.R_gas * estado.T / estado.P
+			estado.u = self._energia_interna(estado.T)
+			estado.s = self._entropia(estado.T, estado.P)
+			return
+
+		# Caso 5: Conozco Entropía (s) y Volumen (v)
+		elif (estado.s is not None) and (estado.v is not None):
+			entropia_desconocida = False
+			estado.T = self._temperatura_desde_sv(estado.s, estado.v)
+			estado.P = self.R_gas * estado.T / estado.v
+
+		# Caso 6: Conozco Entropía (s) y Presion (P)
+		elif (estado.s is not None) and (estado.P is not None):
+			entropia_desconocida = False
+			estado.T = self._temperatura_desde_sP(estado.s, estado.P)
+			estado.v = self.R_gas * estado.T / estado.P
+
+		# Caso 7: Conozco Entropía (s) y Temperatura (T)
+		elif (estado.s is not None) and (estado.T is not None):
+			entropia_desconocida = False
+			estado.P = self._presion_desde_Ts(estado.T, estado.s)
+			estado.v = self.R_gas * estado.T / estado.P
 
-		# Solucionador para calores especificos constantes
-		if self.calores_constantes == True:
-
-			# Caso 1: Conozco Presión (P) y Temperatura (T)
-			if (estado.P is not None) and (estado.T is not None):
-				estado.v = self.R_gas * estado.T / estado.P
-				estado.u = self.cv*(estado.T - self.T0)
-				estado.h = self.cp * (estado.T - self.T0)
-				estado.s = self.cp * np.log(estado.T / self.T0) - self.R_gas * np.log(estado.P / self.P0)
-
-			# Caso 2: Conozco Presión (P) y Volumen (v)
-			elif (estado.P is not None) and (estado.v is not None):
-				estado.T = estado.P * estado.v / self.R_gas
-				estado.u = self.cv*(estado.T - self.T0)
-				estado.h = self.cp * (estado.T - self.T0)
-				estado.s = self.cp * np.log(estado.T / self.T0) - self.R_gas * np.log(estado.P / self.P0)
-
-			# Caso 3: Conozco Temperatura (T) y Volumen (v)
-			elif (estado.T is not None) and (estado.v is not None):
-				estado.P = self.R_gas * estado.T / estado.v
-				estado.u = self.cv*(estado.T - self.T0)
-				estado.h = self.cp * (estado.T - self.T0)
-				estado.s = self.cp * np.log(estado.T / self.T0) - self.R_gas * np.log(estado.P / self.P0)
-
-			# Caso 4: Conozco Presión (P) y Entalpía (h)
-			elif (estado.P is not None) and (estado.h is not None):
-				estado.T = estado.h / self.cp
-				estado.u = self.cv*(estado.T - self.T0)
-				estado.v = self.R_gas * estado.T / estado.P
-				estado.s = self.cp * np.log(estado.T / self.T0) - self.R_gas * np.log(estado.P / self.P0)
-
-			# Caso 5: Conozco Entropía (s) y Volumen (v)
-			elif (estado.s is not None) and (estado.v is not None):
-				estado.T = self.T0*np.exp((1/self.cv)*(estado.s-self.R_gas*np.log(estado.v/self.v0)))
-				estado.P = self.R_gas * estado.T / estado.v
-				estado.u = self.cv*(estado.T - self.T0)
-				estado.h = self.cp * (estado.T - self.T0)
-
-			# Caso 6: Conozco Entropía (s) y Presion (P)
-			elif (estado.s is not None) and (estado.P is not None):
-				estado.T = self.T0*np.exp((1/self.cp)*(estado.s+self.R_gas*np.log(estado.P/self.P0)))
-				estado.v = self.R_gas * estado.T / estado.P
-				estado.u = self.cv*(estado.T - self.T0)
-				estado.h = self.cp * (estado.T - self.T0)
-
-			# Caso 7: Conozco Entropía (s) y Temperatura (T)
-			elif (estado.s is not None) and (estado.T is not None):
-				estado.P = self.P0*np.exp((1/self.R_gas)*(self.cp*np.log(estado.T/self.T0)-estado.s))
-				estado.v = self.R_gas * estado.T / estado.P
-				estado.u = self.cv*(estado.T - self.T0)
-				estado.h = self.cp * (estado.T - self.T0)
-
-			else:
-				print(f"Combinación de propiedades no soportada o insuficiente.")
-
-		# Solucionador para calores especificos variables dependientes de la temperatura
-		elif self.calores_constantes == False:
+		else:
+			self._registrar('datos_insuficientes', "Combinación de propiedades no soportada o insuficiente en el estado {}.", estado)
+			return
 
-			# Caso 1: Conozco Presión (P) y Temperatura (T)
-			if (estado.P is not None) and (estado.T is not None):
-				estado.v = self.R_gas * estado.T / estado.P
-				estado.u = quad(self.cv, self.T0, estado.T)
-				estado.h = quad(self.cp, self.T0, estado.T)
-				estado.s = quad(self.cp,self.T0,estado.T) - self.R_gas * np.log(estado.P / self.P0)
+		estado.u = self._energia_interna(estado.T)
+		estado.h = self._entalpia(estado.T)
+		if entropia_desconocida:
+			estado.s = self._entropia(estado.T, estado.P)
 
-			# Caso 2: Conozco Presión (P) y Volumen (v)
-			elif (estado.P is not None) and (estado.v is not None):
-				estado.T = estado.P * estado.v / self.R_gas
-				estado.u = quad(self.cv, self.T0, estado.T)
-				estado.h = quad(self.cp, self.T0, estado.T)
-				estado.s = quad(self.cp,self.T0,estado.T) - self.R_gas * np.log(estado.P / self.P0)
+	def calcular_estados(self, P=None, T=None, v=None, h=None, s=None, x=None):
+		"""
+		Calcula en una sola pasada vectorizada las propiedades de muchos estados de gas ideal.
 
-			# Caso 3: Conozco Temperatura (T) y Volumen (v)
-			elif (estado.T is not None) and (estado.v is not None):
-				estado.P = self.R_gas * estado.T / estado.v
-				estado.u = quad(self.cv, self.T0, estado.T)
-				estado.h = quad(self.cp, self.T0, estado.T)
-				estado.s = quad(self.cp,self.T0,estado.T) - self.R_gas * np.log(estado.P / self.P0)
+		Acepta las mismas combinaciones que `calcular_estado`. Cada punto puede usar una combinación distinta:
+		los valores desconocidos se indican con `None` o `NaN` y cada combinación se resuelve sobre su propia
+		máscara, respetando el mismo orden de prioridad que `calcular_estado`.
 
-			# Caso 4: Conozco Presión (P) y Entalpía (h)
-			elif (estado.P is not None) and (estado.h is not None):
-				estado.T = estado.h / self.cp
-				estado.u = quad(self.cv, self.T0, estado.T)
-				estado.v = self.R_gas * estado.T / estado.P
-				estado.s = quad(self.cp,self.T0,estado.T) - self.R_gas * np.log(estado.P / self.P0)
+		Args:
+			P, T, v, h, s (float | array_like, optional): Propiedades conocidas. Se difunden (broadcast) a una forma común.
+			x (float | array_like, optional): Calidad; en un gas ideal solo se admite 1.
 
-			# Caso 5: Conozco Entropía (s) y Volumen (v)
-			elif (estado.s is not None) and (estado.v is not None):
-				estado.T = self.T0*np.exp((1/self.cv)*(estado.s-self.R_gas*np.log(estado.v/self.v0)))
-				estado.P = self.R_gas * estado.T / estado.v
-				estado.u = quad(self.cv, self.T0, estado.T)
-				estado.h = quad(self.cp, self.T0, estado.T)
+		Returns:
+			dict[str, np.ndarray]: Arreglos con 'P', 'T', 'v', 'u', 'h', 's' y 'x'. Los puntos con una combinación
+			no soportada o insuficiente quedan con `NaN`.
 
-			# Caso 6: Conozco Entropía (s) y Presion (P)
-			elif (estado.s is not None) and (estado.P is not None):
-				estado.T = self.T0*np.exp((1/self.cp)*(estado.s+self.R_gas*np.log(estado.P/self.P0)))
-				estado.v = self.R_gas * estado.T / estado.P
-				estado.u = quad(self.cv, self.T0, estado.T)
-				estado.h = quad(self.cp, self.T0, estado.T)
-
-			# Caso 7: Conozco Entropía (s) y Temperatura (T)
-			elif (estado.s is not None) and (estado.T is not None):
-				estado.P = self.P0*np.exp((1/self.R_gas)*(self.cp*np.log(estado.T/self.T0)-estado.s))
-				estado.v = self.R_gas * estado.T / estado.P
-				estado.u = quad(self.cv, self.T0, estado.T)
-				estado.h = quad(self.cp, self.T0, estado.T)
+		Raises:
+			AttributeError: Si se entrega una calidad diferente de 1.
+		"""
+		entradas = _arreglos_entrada(P=P, T=T, v=v, h=h, s=s, x=x)
+		if np.any(~np.isnan(entradas['x']) & (entradas['x'] != 1)):
+			raise AttributeError("Gas ideal no puede tener calidad diferente de 1")
+		P, T, v, h, s = (entradas[nombre] for nombre in ('P', 'T', 'v', 'h', 's'))
+		conocido = {nombre: ~np.isnan(entradas[nombre]) for nombre in ('P', 'T', 'v', 'h', 's')}
+		pendiente = np.ones(P.shape, dtype=bool)
+
+		def mascara(a, b):
+			m = pendiente & conocido[a] & conocido[b]
+			pendiente[m] = False
+			return m
+
+		# Se resuelven los casos en el mismo orden que calcular_estado; cada uno define T y P.
+		mascara('P', 'T')
+		caso_Pv = mascara('P', 'v')
+		T[caso_Pv] = P[caso_Pv]*v[caso_Pv]/self.R_gas
+		caso_Tv = mascara('T', 'v')
+		P[caso_Tv] = self.R_gas*T[caso_Tv]/v[caso_Tv]
+		caso_Ph = mascara('P', 'h')
+		if np.any(caso_Ph):
+			T[caso_Ph] = self._temperatura_desde_h(h[caso_Ph])
+		caso_sv = mascara('s', 'v')
+		if np.any(caso_sv):
+			T[caso_sv] = self._temperatura_desde_sv(s[caso_sv], v[caso_sv])
+			P[caso_sv] = self.R_gas*T[caso_sv]/v[caso_sv]
+		caso_sP = mascara('s', 'P')
+		if np.any(caso_sP):
+			T[caso_sP] = self._temperatura_desde_sP(s[caso_sP], P[caso_sP])
+		caso_Ts = mascara('T', 's')
+		if np.any(caso_Ts):
+			P[caso_Ts] = self._presion_desde_Ts(T[caso_Ts], s[caso_Ts])
+
+		# Propiedades dependientes; se conservan los datos de entrada de cada combinación
+		resuelto = ~pendiente
+		T[pendiente] = np.nan
+		P[pendiente] = np.nan
+		with np.errstate(invalid='ignore', divide='ignore'):
+			v = np.where(caso_Pv | caso_Tv | caso_sv, v, self.R_gas*T/P)
+			u = self._energia_interna(T)
+			h = np.where(caso_Ph, h, self._entalpia(T))
+			s = np.where(caso_sv | caso_sP | caso_Ts, s, self._entropia(T, P))
+		x = np.where(resuelto, 1.0, np.nan)
+		return {'P': P, 'T': T, 'v': v, 'u': u, 'h': h, 's': s, 'x': x}
+
+
+_TABLA_SATURACION_VDW = None
+
+def _tabla_saturacion_reducida(n=4001, Tr_min=0.2, n_biseccion=40, n_newton=8):
+	r"""
+	Curva de coexistencia líquido-vapor de Van der Waals en variables reducidas, por construcción de Maxwell.
 
-			else:
-				print(f"Combinación de propiedades no soportada o insuficiente.")
+	En variables reducidas la ecuación es $P_r = 8T_r/(3v_r - 1) - 3/v_r^2$ y no depende de la sustancia, por lo que
+	la tabla se calcula una sola vez por proceso y cada modelo la reescala con sus constantes críticas. Para cada
+	$T_r$ se busca la presión que iguala las áreas, $g(P_r) = \int_{v_f}^{v_g} P_r\,dv_r - P_r (v_g - v_f) = 0$,
+	con $v_f$ y $v_g$ las raíces extremas de la cúbica: primero por bisección en $\ln P_r$ y luego con Newton,
+	usando $dg/dP_r = -(v_g - v_f)$. Ambas etapas están vectorizadas sobre toda la malla.
 
-			
+	La malla es uniforme en $\xi = \sqrt{(1 - T_r)/(1 - T_{r,min})}$, variable en la que $v_f$ y $v_g$ son suaves
+	cerca del punto crítico; con la malla por defecto la interpolación lineal de los logaritmos tiene un error relativo
+	menor que 2e-5.
 
-from scipy.optimize import fsolve
+	Returns:
+		dict[str, np.ndarray]: Arreglos 'xi', 'Tr', 'Pr', 'vr_f' y 'vr_g' ordenados por $T_r$ creciente.
+	"""
+	global _TABLA_SATURACION_VDW
+	if _TABLA_SATURACION_VDW is not None:
+		return _TABLA_SATURACION_VDW
+
+	xi = np.linspace(1, 0, n)
+	Tr = 1 - (1 - Tr_min)*xi**2
+
+	def raices_y_residuo(Pr):
+		vr_f, vr_m, vr_g = raices_cubicas(-(1/3 + 8*Tr/(3*Pr)), 3/Pr, -1/Pr)
+		with np.errstate(invalid='ignore', divide='ignore'):
+			residuo = (8*Tr/3)*np.log((3*vr_g - 1)/(3*vr_f - 1)) + 3/vr_g - 3/vr_f - Pr*(vr_g - vr_f)
+		return vr_f, vr_m, vr_g, residuo
+
+	# Espinodales: dP_r/dv_r = 0 equivale a la cúbica 4T_r v_r^3 - 9v_r^2 + 6v_r - 1 = 0, cuyas raíces intermedia y
+	# mayor son el mínimo (líquido) y el máximo (vapor) locales de la isoterma. La presión de saturación queda entre
+	# ambas presiones, donde la cúbica siempre tiene tres raíces reales.
+	_, vr_espinodal_f, vr_espinodal_g = raices_cubicas(-9/(4*Tr), 6/(4*Tr), -1/(4*Tr))
+	with np.errstate(invalid='ignore', divide='ignore'):
+		Pr_espinodal_f = 8*Tr/(3*vr_espinodal_f - 1) - 3/vr_espinodal_f**2
+		Pr_espinodal_g = 8*Tr/(3*vr_espinodal_g - 1) - 3/vr_espinodal_g**2
+		ln_Pr_bajo = np.maximum(np.log(np.where(Pr_espinodal_f > 0, Pr_espinodal_f, 0.0)), 4.5*(1 - 1/Tr))
+		ln_Pr_alto = np.minimum(np.log(Pr_espinodal_g), 0.0)
+	ln_Pr_bajo = np.where(np.isfinite(ln_Pr_bajo), ln_Pr_bajo, 4.5*(1 - 1/Tr))
+	ln_Pr_alto = np.where(np.isfinite(ln_Pr_alto), ln_Pr_alto, 0.0)
+	vr_referencia = np.where(np.isnan(vr_espinodal_f), 1.0, (vr_espinodal_f + vr_espinodal_g)/2)
+	for _ in range(n_biseccion):
+		ln_Pr = (ln_Pr_bajo + ln_Pr_alto)/2
+		vr_f, vr_m, vr_g, residuo = raices_y_residuo(np.exp(ln_Pr))
+		# Con una sola raíz real, la presión está por debajo (raíz de vapor) o por encima (raíz de líquido) de la zona de coexistencia
+		presion_baja = np.where(np.isnan(vr_m), vr_g > vr_referencia, residuo > 0)
+		ln_Pr_bajo = np.where(presion_baja, ln_Pr, ln_Pr_bajo)
+		ln_Pr_alto = np.where(presion_baja, ln_Pr_alto, ln_Pr)
+
+	ln_Pr = (ln_Pr_bajo + ln_Pr_alto)/2
+	for _ in range(n_newton):
+		Pr = np.exp(ln_Pr)
+		vr_f, vr_m, vr_g, residuo = raices_y_residuo(Pr)
+		with np.errstate(invalid='ignore', divide='ignore'):
+			candidato = ln_Pr + residuo/(Pr*(vr_g - vr_f))
+		# Se descartan los pasos que salen del intervalo de bisección
+		valido = np.isfinite(candidato) & (candidato > ln_Pr_bajo) & (candidato < ln_Pr_alto)
+		paso = np.where(valido, candidato - ln_Pr, 0.0)
+		ln_Pr = ln_Pr + paso
+		if not np.any(np.abs(paso) > 1e-14):
+			break
+
+	Pr = np.exp(ln_Pr)
+	vr_f, _, vr_g = raices_cubicas(-(1/3 + 8*Tr/(3*Pr)), 3/Pr, -1/Pr)
+	# Punto crítico exacto
+	Pr[-1], vr_f[-1], vr_g[-1] = 1.0, 1.0, 1.0
+	_TABLA_SATURACION_VDW = {'xi': xi, 'Tr': Tr, 'Pr': Pr, 'vr_f': vr_f, 'vr_g': vr_g}
+	return _TABLA_SATURACION_VDW
 
 ######################################
 ######################################
@@ -731,9 +1335,25 @@ class ModeloVanDerWaals(ModeloTermodinamico):
 		Presión de referencia (Pa).
 	MM : float, opcional
 		Masa Molar de la sustancia
+	calores_constantes : bool, opcional
+		`True` si se usan calores específicos constantes (único caso implementado).
+	intervalo_T : tuple[float, float], opcional
+		Intervalo de búsqueda de temperatura (K) para las combinaciones implícitas (P, h) y (s, P).
+		Por defecto (0.1 T0, 10 T0).
+	continuacion : bool, opcional
+		Si es `True`, `calcular_estados` trata los puntos implícitos (P, h) y (s, P) como una trayectoria ordenada:
+		solo el primero se resuelve desde cero y cada solución (T, v) inicializa la siguiente. La rama se sigue de
+		forma continua, sin saltar entre raíces de la cúbica. Las iteraciones de Newton por punto de la última
+		llamada quedan en `iteraciones_continuacion`.
 	"""
 
-	def __init__(self, a, b, R_gas=8.314, cp = 1005, cv = 0.718, T0=298.15, P0=101325, MM = 0.018):
+	parametros = ('a', 'b', 'R_gas', 'cp', 'cv', 'T0', 'P0', 'v0', 'MM', 'calores_constantes', 'intervalo_T')
+
+	def __init__(self, a, b, R_gas=8.314, cp = 1005, cv = 0.718, T0=298.15, P0=101325, MM = 0.018, calores_constantes = True, intervalo_T = None, continuacion = False):
+		self.calores_constantes = calores_constantes
+		self.intervalo_T = intervalo_T if intervalo_T is not None else (0.1*T0, 10*T0)
+		self.continuacion = continuacion
+		self.iteraciones_continuacion = None
 		self.a = a
 		self.b = b
 		self.R_gas = R_gas
@@ -744,6 +1364,75 @@ class ModeloVanDerWaals(ModeloTermodinamico):
 		self.v0 = self.R_gas * self.T0 / self.P0  # volumen molar de referencia (ideal)
 		self.MM = MM
 
+	@property
+	def T_critica(self):
+		"""Temperatura crítica Tc = 8a/(27 b R) [K]."""
+		return 8*self.a/(27*self.b*self.R_gas)
+
+	@property
+	def P_critica(self):
+		"""Presión crítica Pc = a/(27 b²) [Pa]."""
+		return self.a/(27*self.b**2)
+
+	@property
+	def v_critico(self):
+		"""Volumen específico crítico vc = 3b."""
+		return 3*self.b
+
+	def presion_saturacion(self, T):
+		"""
+		Presión de saturación Psat(T) según la construcción de Maxwell, interpolada de la tabla reducida.
+
+		Args:
+			T (float | array_like): Temperatura [K].
+
+		Returns:
+			float | np.ndarray: Presión de saturación [Pa]; `NaN` por encima de Tc o por debajo del rango tabulado.
+		"""
+		return self._interpolar_saturacion(T, 'Pr')*self.P_critica
+
+	def volumenes_saturacion(self, T):
+		"""
+		Volúmenes de líquido saturado y de vapor saturado a la temperatura T.
+
+		Args:
+			T (float | array_like): Temperatura [K].
+
+		Returns:
+			tuple: (v_f, v_g) en las unidades de b; `NaN` fuera del domo.
+		"""
+		return self._interpolar_saturacion(T, 'vr_f')*self.v_critico, self._interpolar_saturacion(T, 'vr_g')*self.v_critico
+
+	def temperatura_saturacion(self, P):
+		"""
+		Temperatura de saturación Tsat(P), inversa monótona de `presion_saturacion`.
+
+		Args:
+			P (float | array_like): Presión [Pa].
+
+		Returns:
+			float | np.ndarray: Temperatura de saturación [K]; `NaN` por encima de Pc o por debajo del rango tabulado.
+		"""
+		tabla = _tabla_saturacion_reducida()
+		Pr = np.asarray(P, dtype=float)/self.P_critica
+		with np.errstate(invalid='ignore', divide='ignore'):
+			xi = np.interp(np.log(Pr), np.log(tabla['Pr']), tabla['xi'], left=np.nan, right=np.nan)
+		Tr = 1 - (1 - tabla['Tr'][0])*xi**2
+		Tr = np.where(Pr == 1, 1.0, Tr)
+		return (float(Tr) if Tr.ndim == 0 else Tr)*self.T_critica
+
+	def _interpolar_saturacion(self, T, columna):
+		"""
+		Interpola el logaritmo de una columna de la tabla de saturación reducida en la variable xi, suave cerca del punto crítico.
+		"""
+		tabla = _tabla_saturacion_reducida()
+		Tr = np.asarray(T, dtype=float)/self.T_critica
+		Tr_min = tabla['Tr'][0]
+		with np.errstate(invalid='ignore'):
+			xi = np.sqrt((1 - Tr)/(1 - Tr_min))
+			valor = np.exp(np.interp(xi, tabla['xi'][::-1], np.log(tabla[columna][::-1]), left=np.nan, right=np.nan))
+		return float(valor) if valor.ndim == 0 else valor
+
 	def calcular_estado(self, estado):
 		"""
 		Calcula las propiedades del estado para un gas de Van der Waals
@@ -760,6 +1449,10 @@ class ModeloVanDerWaals(ModeloTermodinamico):
 		- (P, x)  # Calidad
 		- (T, x)  # Calidad
 
+		(P, x) y (T, x) describen una mezcla saturada dentro del domo de Maxwell (ver `presion_saturacion`) y solo se
+		usan si la calidad se asignó como dato del estado y no hay otro par conocido. Con (P, T) la calidad elige la
+		raíz de la cúbica (x = 0 líquido, x = 1 vapor).
+
 		Args:
 			estado (Estado): Instancia del estado a calcular.
 
@@ -777,40 +1470,10 @@ class ModeloVanDerWaals(ModeloTermodinamico):
 		def calcular_P(T, v):
 			return self.R_gas * T / (v - self.b) - self.a / v**2
 		
-		def resolver_volumen(self,estado, T, P):
-			"""
-			args : T,P
-				Temperatura y Presión en ese punto
-			returns: v_solution
-				(np Array) Si es solo gas, devuelve el volumen del gas
-				Si es una mezcla líquido/gas devuelve una lista, de la forma
-				[v_líquido,v_gas.v_total]
-			"""
-			if self.x == 1:
-			# Resuelve numéricamente el volumen molar usando fsolve
-			#Esto es para casos que no tienen estados mixtos
-				def f(v):
-					return P - self._presion(T, v)
-				v_guess = self.R_gas * T / P  # estimación inicial (gas ideal)
-				v_solution = fsolve(f, v_guess)
-			else:
-			#La ecuación de Van der Waals puede ser expresada de esta forma:
-			#PV**3 - (Pb+RT)*V**2 + a*V - a*b = 0.
-			#Al resolver para el volumen se tienen tres soluciones:
-			#La solución más grande corresponde al volumen del gas
-			#La solución más pequeña corresponde al volumen del líquido
-			#La solución del intermedio no tiene significado físico
-				sol = np.roots([P,-(P*self.b+self.R_gas*T), self.a, -self.a*self.b])
-				sol.sort()
-				if self.MM == 0.018:
-					print(f"Usando Masa Molar del agua: {self.MM}")
-				v_liquid = sol[0]/self.MM
-				v_gas = sol[-1]/self.MM
-				v_solution = [v_liquid, v_gas, v_liquid + estado.x*(v_gas - v_liquid)]
-
-			return v_solution
+		# Función auxiliar para resolver v desde P y T con la calidad del estado
+		def calcular_v(P, T):
+			return float(self._volumen(P, T, estado.x))
 
-		
 		# Ahora los casos:
 		if self.calores_constantes == True:
 
@@ -819,99 +1482,199 @@ class ModeloVanDerWaals(ModeloTermodinamico):
 				estado.v = calcular_v(estado.P, estado.T)
 				estado.u = self.cv * (estado.T - self.T0) - self.a / estado.v
 				estado.h = estado.u + estado.P * estado.v
-				estado.s = self.cp * np.log(estado.T / self.T0) - self.R_gas * np.log((estado.v - self.b) / (self.v0 - self.b))
+				estado.s = self._entropia(estado.T, estado.v)
 
 			# Caso 2: (P, v)
 			elif (estado.P is not None) and (estado.v is not None):
 				estado.T = calcular_T(estado.P, estado.v)
 				estado.u = self.cv * (estado.T - self.T0) - self.a / estado.v
 				estado.h = estado.u + estado.P * estado.v
-				estado.s = self.cp * np.log(estado.T / self.T0) - self.R_gas * np.log((estado.v - self.b) / (self.v0 - self.b))
+				estado.s = self._entropia(estado.T, estado.v)
 
 			# Caso 3: (T, v)
 			elif (estado.T is not None) and (estado.v is not None):
 				estado.P = calcular_P(estado.T, estado.v)
 				estado.u = self.cv * (estado.T - self.T0) - self.a / estado.v
 				estado.h = estado.u + estado.P * estado.v
-				estado.s = self.cp * np.log(estado.T / self.T0) - self.R_gas * np.log((estado.v - self.b) / (self.v0 - self.b))
+				estado.s = self._entropia(estado.T, estado.v)
 
 			# Caso 4: (P, h)
 			elif (estado.P is not None) and (estado.h is not None):
-				# Para este caso es necesario un método iterativo para encontrar T:
-				from scipy.optimize import root_scalar
-
-				def f(T):
-					v = calcular_v(estado.P, T)
-					u = self.cv * (T - self.T0) - self.a / v
-					h_calc = u + estado.P * v
-					return h_calc - estado.h
-
-				sol = root_scalar(f, bracket=[self.T0, 2000], method='brentq')
-				if not sol.converged:
+				# Para este caso es necesario un método iterativo para encontrar T
+				estado.T = self._temperatura_desde_Ph(estado.P, estado.h, estado.x)
+				if np.isnan(estado.T):
 					raise ValueError("No se pudo encontrar temperatura para P y h dados.")
-				estado.T = sol.root
 				estado.v = calcular_v(estado.P, estado.T)
 				estado.u = self.cv * (estado.T - self.T0) - self.a / estado.v
-				estado.s = self.cp * np.log(estado.T / self.T0) - self.R_gas * np.log((estado.v - self.b) / (self.v0 - self.b))
+				estado.s = self._entropia(estado.T, estado.v)
 
 			# Caso 5: (s, v)
 			elif (estado.s is not None) and (estado.v is not None):
-				# Se debe encontrar T que satisface s:
-				from scipy.optimize import root_scalar
-
-				def f(T):
-					s_calc = self.cp * np.log(T / self.T0) - self.R_gas * np.log((estado.v - self.b) / (self.v0 - self.b))
-					return s_calc - estado.s
-
-				sol = root_scalar(f, bracket=[self.T0*0.1, self.T0*10], method='brentq')
-				if not sol.converged:
-					raise ValueError("No se pudo encontrar temperatura para s y v dados.")
-				estado.T = sol.root
+				estado.T = float(self._temperatura_desde_sv(estado.s, estado.v))
 				estado.P = calcular_P(estado.T, estado.v)
 				estado.u = self.cv * (estado.T - self.T0) - self.a / estado.v
 				estado.h = estado.u + estado.P * estado.v
 
 			# Caso 6: (s, P)
 			elif (estado.s is not None) and (estado.P is not None):
-				from scipy.optimize import root_scalar
-
-				def f(T):
-					v = calcular_v(estado.P, T)
-					s_calc = self.cp * np.log(T / self.T0) - self.R * np.log((v - self.b) / (self.v0 - self.b))
-					return s_calc - estado.s
-
-				sol = root_scalar(f, bracket=[self.T0*0.1, self.T0*10], method='brentq')
-				if not sol.converged:
+				estado.T = self._temperatura_desde_sP(estado.s, estado.P, estado.x)
+				if np.isnan(estado.T):
 					raise ValueError("No se pudo encontrar temperatura para s y P dados.")
-				estado.T = sol.root
 				estado.v = calcular_v(estado.P, estado.T)
 				estado.u = self.cv * (estado.T - self.T0) - self.a / estado.v
 				estado.h = estado.u + estado.P * estado.v
 
 			# Caso 7: (T, s)
 			elif (estado.T is not None) and (estado.s is not None):
-				from scipy.optimize import root_scalar
-
-				def f(P):
-					v = calcular_v(P, estado.T)
-					s_calc = self.cp * np.log(estado.T / self.T0) - self.R_gas * np.log((v - self.b) / (self.v0 - self.b))
-					return s_calc - estado.s
-
-				# Buscamos P en un rango razonable
-				sol = root_scalar(f, bracket=[1e3, 1e8], method='brentq')
-				if not sol.converged:
-					raise ValueError("No se pudo encontrar presión para T y s dados.")
-				estado.P = sol.root
-				estado.v = calcular_v(estado.P, estado.T)
+				estado.v = float(self._volumen_desde_Ts(estado.T, estado.s))
+				estado.P = calcular_P(estado.T, estado.v)
 				estado.u = self.cv * (estado.T - self.T0) - self.a / estado.v
 				estado.h = estado.u + estado.P * estado.v
 
+			# Casos 8 y 9: (P, x) y (T, x), mezcla saturada
+			elif 'x' in getattr(estado, 'entradas', ()) and (estado.P is not None or estado.T is not None):
+				T = estado.T if estado.T is not None else self.temperatura_saturacion(estado.P)
+				P, v, u, h, s = (float(valor) for valor in self._propiedades_saturacion(T, estado.x))
+				if np.isnan(v):
+					raise ValueError("El estado está fuera del domo de saturación (por encima del punto crítico o del rango tabulado).")
+				estado.T, estado.v, estado.u, estado.h, estado.s = T, v, u, h, s
+				if estado.P is None:
+					estado.P = P
+
 			else:
 				raise ValueError("Combinación de propiedades no soportada o insuficiente.")
 
 
 		elif self.calores_constantes == False:
-			print("No se ha implementado")
+			self._registrar('no_implementado', "Van der Waals con calores específicos variables no está implementado (estado {}).", estado)
+
+	def _propiedades_energeticas(self, T, P, v):
+		"""
+		Devuelve u, h y s de Van der Waals (calores constantes) a partir de T, P y v, de forma vectorizada.
+		"""
+		u = self.cv * (T - self.T0) - self.a / v
+		h = u + P * v
+		s = self._entropia(T, v)
+		return u, h, s
+
+	def _propiedades_saturacion(self, T, x):
+		"""
+		Presión, v, u, h y s de la mezcla saturada a la temperatura T con calidad x, de forma vectorizada. Las
+		propiedades específicas siguen la regla de la palanca entre el líquido y el vapor saturados (u no es
+		lineal en v, así que no se evalúa en el volumen de la mezcla); todas son `NaN` fuera del domo.
+		"""
+		P = self.presion_saturacion(T)
+		v_f, v_g = self.volumenes_saturacion(T)
+		liquido = self._propiedades_energeticas(T, P, v_f)
+		vapor = self._propiedades_energeticas(T, P, v_g)
+		v = v_f + x*(v_g - v_f)
+		return (P, v, *(f + x*(g - f) for f, g in zip(liquido, vapor)))
+
+	def _entropia(self, T, v):
+		"""
+		Entropía de Van der Waals con cv constante, s = cv ln(T/T0) + R ln((v - b)/(v0 - b)), con referencia en (T0, v0).
+		"""
+		return self.cv * np.log(T / self.T0) + self.R_gas * np.log((v - self.b) / (self.v0 - self.b))
+
+	def calcular_estados(self, P=None, T=None, v=None, h=None, s=None, x=None):
+		"""
+		Calcula por lotes las propiedades de muchos estados de Van der Waals.
+
+		Todas las combinaciones de `calcular_estado` se resuelven por grupos vectorizados. (P, T) usa la solución
+		analítica de la cúbica (`_volumenes`) junto con la calidad `x` de cada punto; (s, v) y (T, s) tienen forma
+		cerrada, y (P, h) y (s, P) se resuelven en paralelo con `raices_acotadas` dentro de `intervalo_T`. Los puntos
+		con x dado y solo P o T se resuelven como mezcla saturada (`_propiedades_saturacion`). Los puntos que no
+		convergen o quedan fuera del domo quedan como `NaN`. Las combinaciones no soportadas se delegan a
+		`ModeloTermodinamico`.
+
+		Args:
+			P, T, v, h, s (float | array_like, optional): Propiedades conocidas, con `None` o `NaN` para las desconocidas.
+			x (float | array_like, optional): Calidad de cada punto. Por defecto 1 (vapor).
+
+		Returns:
+			dict[str, np.ndarray]: Arreglos con 'P', 'T', 'v', 'u', 'h', 's' y 'x'.
+		"""
+		entradas = _arreglos_entrada(P=P, T=T, v=v, h=h, s=s, x=x)
+		P, T, v, x = (entradas[nombre] for nombre in ('P', 'T', 'v', 'x'))
+		conocido = {nombre: ~np.isnan(entradas[nombre]) for nombre in ('P', 'T', 'v', 'h', 's', 'x')}
+		x[np.isnan(x)] = 1.0
+
+		# Mismo orden de prioridad que calcular_estado
+		pares = (('P', 'T'), ('P', 'v'), ('T', 'v'), ('P', 'h'), ('s', 'v'), ('s', 'P'), ('T', 's'), ('P', 'x'), ('T', 'x'))
+		casos = {}
+		resuelto = np.zeros(P.shape, dtype=bool)
+		for a, b in pares:
+			casos[a, b] = ~resuelto & conocido[a] & conocido[b]
+			resuelto |= casos[a, b]
+
+		with np.errstate(invalid='ignore', divide='ignore'):
+			m = casos['P', 'T']
+			if np.any(m):
+				v[m] = self._volumen(P[m], T[m], x[m])
+			m = casos['P', 'v']
+			T[m] = self._temperatura(P[m], v[m])
+			m = casos['T', 'v']
+			P[m] = self._presion(T[m], v[m])
+			m = casos['P', 'h']
+			if np.any(m):
+				T[m], v[m] = self._resolver_implicito('h', P[m], entradas['h'][m], x[m])
+			m = casos['s', 'v']
+			T[m] = self._temperatura_desde_sv(entradas['s'][m], v[m])
+			P[m] = self._presion(T[m], v[m])
+			m = casos['s', 'P']
+			if np.any(m):
+				T[m], v[m] = self._resolver_implicito('s', P[m], entradas['s'][m], x[m])
+			m = casos['T', 's']
+			v[m] = self._volumen_desde_Ts(T[m], entradas['s'][m])
+			P[m] = self._presion(T[m], v[m])
+			m = casos['P', 'x']
+			T[m] = self.temperatura_saturacion(P[m])
+			u, h, s = self._propiedades_energeticas(T, P, v)
+			m = casos['P', 'x'] | casos['T', 'x']
+			if np.any(m):
+				P_sat, v[m], u[m], h[m], s[m] = self._propiedades_saturacion(T[m], x[m])
+				P[m] = np.where(casos['P', 'x'][m], P[m], P_sat)
+
+		# Se conservan los valores dados de h y s
+		h = np.where(conocido['h'] & resuelto, entradas['h'], h)
+		s = np.where(conocido['s'] & resuelto, entradas['s'], s)
+		resultado = {'P': P, 'T': T, 'v': v, 'u': u, 'h': h, 's': s, 'x': x}
+		if not np.all(resuelto):
+			# Combinaciones no soportadas: la implementación punto a punto informa el error
+			implicito = ~resuelto
+			parcial = super().calcular_estados(**{nombre: entradas[nombre][implicito] for nombre in ('P', 'T', 'v', 'h', 's', 'x')})
+			for nombre, valores in parcial.items():
+				resultado[nombre][implicito] = valores
+		return resultado
+
+	def _volumenes(self, P, T):
+		r"""
+		Devuelve los volúmenes de líquido y de vapor de Van der Waals para arreglos de (P, T).
+
+		La ecuación de Van der Waals puede ser expresada de esta forma:
+		$Pv^3 - (Pb + RT)v^2 + av - ab = 0$.
+		Al resolver para el volumen se tienen hasta tres soluciones: la más grande corresponde al volumen del gas,
+		la más pequeña al volumen del líquido y la intermedia no tiene significado físico. Las raíces se obtienen
+		de forma analítica con `raices_cubicas`, sin llamar a ningún solucionador de SciPy.
+
+		Args:
+			P (float | array_like): Presión [Pa].
+			T (float | array_like): Temperatura [K].
+
+		Returns:
+			tuple[np.ndarray, np.ndarray]: Volúmenes (v_líquido, v_gas). Si solo existe una raíz real, ambos coinciden.
+		"""
+		P = np.asarray(P, dtype=float)
+		T = np.asarray(T, dtype=float)
+		v_liquido, _, v_gas = raices_cubicas(-(self.b + self.R_gas*T/P), self.a/P, -self.a*self.b/P)
+		return v_liquido, v_gas
+
+	def _volumen(self, P, T, x=1):
+		"""
+		Devuelve el volumen específico de la mezcla v = v_líquido + x (v_gas - v_líquido) para arreglos de (P, T, x).
+		"""
+		v_liquido, v_gas = self._volumenes(P, T)
+		return v_liquido + np.asarray(x, dtype=float)*(v_gas - v_liquido)
 
 	def _presion(self, T, v):
 		"""Devuelve la presión (Pa) usando la ecuación de Van der Waals."""
@@ -921,29 +1684,92 @@ class ModeloVanDerWaals(ModeloTermodinamico):
 		"""Devuelve la temperatura (K) a partir de presión y volumen."""
 		return ((P + self.a / v**2) * (v - self.b)) / self.R_gas
 
-	
-	def _resolver_temperatura_desde_sv(self, s, v):
-		"""Calcula T desde entropía y volumen."""
-		T_guess = self.T0
-		def f(T):
-			s_calc = self.R_gas * np.log((T / self.T0) * ((v - self.b) / self.v0))
-			return s_calc - s
-		T_solution, = fsolve(f, T_guess)
-		return T_solution
+	def _temperatura_desde_sv(self, s, v):
+		"""Temperatura (K) a partir de entropía y volumen; forma cerrada de la expresión de s."""
+		return self.T0 * np.exp((np.asarray(s, dtype=float) - self.R_gas * np.log((v - self.b) / (self.v0 - self.b))) / self.cv)
 
-	def resolver_politropico(self, estado_in, estado_out, n, **kwargs):
-		super().resolver_politropico(estado_in, estado_out)
+	def _volumen_desde_Ts(self, T, s):
+		"""Volumen a partir de temperatura y entropía; forma cerrada de la expresión de s."""
+		return self.b + (self.v0 - self.b) * np.exp((s - self.cv * np.log(np.asarray(T, dtype=float) / self.T0)) / self.R_gas)
 
-	def _calcular_propiedades(self, estado):
+	def _temperatura_desde_Ph(self, P, h, x=1):
 		"""
-		Calcula u, h, s a partir de P, T y v. Se asume gas monoatómico (Cv = 3/2 R).
+		Temperatura (K) a partir de presión y entalpía, resolviendo en paralelo h(T; P, x) = h dentro de `intervalo_T`.
 		"""
-		Cv = 1.5 * self.R_gas
-		Cp = Cv + self.R_gas
+		def residuo(T):
+			v = self._volumen(P, T, x)
+			return self._propiedades_energeticas(T, P, v)[1] - h
+		forma = np.broadcast(P, h, x).shape
+		T, _ = raices_acotadas(residuo, *(np.full(forma, extremo) for extremo in self.intervalo_T))
+		return float(T) if T.ndim == 0 else T
+
+	def _resolver_implicito(self, propiedad, P, objetivo, x):
+		"""
+		Resuelve (T, v) para puntos con P y h (o s) conocidos.
+
+		Sin continuación todos los puntos se resuelven a la vez con `raices_acotadas`. Con continuación, si los
+		puntos son vapor (x = 1), solo el primero se resuelve así y el resto sigue la rama con `continuar_raices`;
+		los puntos en que la continuación no puede avanzar se resuelven de nuevo desde cero.
 
-		estado.u = Cv * estado.T - self.a / estado.v
-		estado.h = estado.u + estado.P * estado.v
-		estado.s = self.R_gas * np.log((estado.T / self.T0) * ((estado.v - self.b) / self.v0))
+		Args:
+			propiedad (str): 'h' o 's'.
+			P, objetivo, x (np.ndarray): Presión, valor buscado de la propiedad y calidad de cada punto.
+
+		Returns:
+			tuple[np.ndarray, np.ndarray]: Temperatura y volumen de cada punto.
+		"""
+		resolver_T = self._temperatura_desde_Ph if propiedad == 'h' else lambda P, s, x: self._temperatura_desde_sP(s, P, x)
+		if not self.continuacion or len(P) < 2 or np.any(x != 1):
+			T = resolver_T(P, objetivo, x)
+			return T, self._volumen(P, T, x)
+
+		T_inicial = float(resolver_T(P[0], objetivo[0], 1.0))
+		v_inicial = float(self._volumen(P[0], T_inicial))
+		sistema = self._sistema_Ph if propiedad == 'h' else self._sistema_sP
+		soluciones, self.iteraciones_continuacion = continuar_raices(sistema, [T_inicial, v_inicial], np.column_stack((P, objetivo)))
+		T, v = soluciones[:, 0], soluciones[:, 1]
+		fallido = np.isnan(T)
+		if np.any(fallido):
+			T[fallido] = resolver_T(P[fallido], objetivo[fallido], x[fallido])
+			v[fallido] = self._volumen(P[fallido], T[fallido], x[fallido])
+		return T, v
+
+	def _sistema_Ph(self, incognitas, objetivo):
+		"""
+		Residuo y jacobiano de la ecuación de estado y de h(T, v) = h respecto a (T, v), para la continuación.
+		"""
+		T, v = incognitas
+		P, h = objetivo
+		residuo = (self.R_gas*T/(v - self.b) - self.a/v**2 - P, self.cv*(T - self.T0) - self.a/v + P*v - h)
+		jacobiano = ((self.R_gas/(v - self.b), -self.R_gas*T/(v - self.b)**2 + 2*self.a/v**3),
+					 (self.cv, self.a/v**2 + P))
+		return np.array(residuo), np.array(jacobiano)
+
+	def _sistema_sP(self, incognitas, objetivo):
+		"""
+		Residuo y jacobiano de la ecuación de estado y de s(T, v) = s respecto a (T, v), para la continuación.
+		"""
+		T, v = incognitas
+		P, s = objetivo
+		residuo = (self.R_gas*T/(v - self.b) - self.a/v**2 - P,
+				   self._entropia(T, v) - s)
+		jacobiano = ((self.R_gas/(v - self.b), -self.R_gas*T/(v - self.b)**2 + 2*self.a/v**3),
+					 (self.cv/T, self.R_gas/(v - self.b)))
+		return np.array(residuo), np.array(jacobiano)
+
+	def _temperatura_desde_sP(self, s, P, x=1):
+		"""
+		Temperatura (K) a partir de entropía y presión, resolviendo en paralelo s(T; P, x) = s dentro de `intervalo_T`.
+		"""
+		def residuo(T):
+			v = self._volumen(P, T, x)
+			return self._propiedades_energeticas(T, P, v)[2] - s
+		forma = np.broadcast(s, P, x).shape
+		T, _ = raices_acotadas(residuo, *(np.full(forma, extremo) for extremo in self.intervalo_T))
+		return float(T) if T.ndim == 0 else T
+
+	def resolver_politropico(self, estado_in, estado_out, n, **kwargs):
+		super().resolver_politropico(estado_in, estado_out)
 
 	def resolver_isocorico(self, estado_in, estado_out):
 		super().resolver_isocorico(estado_in, estado_out)
@@ -968,7 +1794,7 @@ class ModeloVanDerWaals(ModeloTermodinamico):
 			Retorna la presión P para un gas VanDerWaals en un proceso isotermico, dado v.
 			"""
 			v = np.asarray(v)
-			return (self.R_gas*estado_in.T)/(estado_in.v - self.b) - self.a/(estado_in.v)**2
+			return (self.R_gas*estado_in.T)/(v - self.b) - self.a/(v)**2
 		return isotermico_ModeloVanDerWaals
 
 	def resolver_isobarico(self, estado_in, estado_out):
@@ -990,61 +1816,44 @@ class ModeloVanDerWaals(ModeloTermodinamico):
 		# Van der Waals
 		self.calcular_estado(estado_in)
 		self.calcular_estado(estado_out)
-		# En gases ideales, los procesos isoentalpicos siguen isotermas
-
-		# Ambos están definidos
-		if estado_in.T is not None and estado_out.T is not None:
-			if estado_in.T == estado_out.T:
-				print(f"Las temperaturas de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas y son iguales.")
-			else:
-				print(f"Las temperaturas de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidas pero no son iguales. Se recomienda revisar.")
-
-		# Solo el estado_in tiene volumen definido
-		elif estado_in.T is not None:
-			estado_out.T = estado_in.T
-
-		# Solo el estado_out tiene volumen definido
-		elif estado_out.T is not None:
-			estado_in.T = estado_out.T
-
-		# Ninguno tiene volumen definido
-		else:
-			print(f"Ninguno de los estados {estado_in.nombre} ni {estado_out.nombre} tiene la temperatura definida. Se requiere al menos una.")
-
+		# A diferencia del gas ideal, las isoentálpicas de Van der Waals no son isotermas: con cv constante,
+		# h = cv (T - T0) - 2a/v + R T v/(v - b), de donde T(v) a entalpía constante tiene forma cerrada
 		def isoentalpico_ModeloVanDerWaals(v):
 			"""
-			Retorna la presión P para un gas VanDerWaals en un proceso isoentalpico -> isotermico, dado v.
+			Retorna la presión P para un gas VanDerWaals en un proceso isoentalpico, dado v.
 			"""
 			v = np.asarray(v)
-			return (self.R_gas*estado_in.T)/(estado_in.v - self.b) - self.a/(estado_in.v)**2
-		return isoentalpico_VanDerWaals
+			T = (estado_in.h + self.cv*self.T0 + 2*self.a/v)*(v - self.b)/(self.cv*(v - self.b) + self.R_gas*v)
+			return (self.R_gas*T)/(v - self.b) - self.a/(v)**2
+		return isoentalpico_ModeloVanDerWaals
 
 	def resolver_isoentropico(self, estado_in, estado_out):
 		super().resolver_isoentropico(estado_in, estado_out)
 		# Van der Waals
 		self.calcular_estado(estado_in)
 		self.calcular_estado(estado_out)
-		gamma = self.cp/self.cv
+		exponente = self.R_gas/self.cv
 		def isoentropico_ModeloVanDerWaals(v):
 			"""
 			Retorna la presión P para un gas VanDerWaals en un proceso isoentropico, dado v.
+			Con cv constante, a entropía constante se conserva T (v - b)^(R/cv).
 			"""
 			# Ambos están definidos
 			v = np.asarray(v)
 			if estado_in.v is not None:
 				if (estado_in.T is not None):
-					return (self.R_gas*estado_in.T*(estadp_in.T - self.b)**(gamma))/(v-self.b)**gamma - self.a/(v)**2
+					return (self.R_gas*estado_in.T*(estado_in.v - self.b)**exponente)/(v - self.b)**(exponente + 1) - self.a/(v)**2
 				else:
-					print("ERROR: No estan definida la temperatura en el estado de entrada")
+					self._registrar('dato_faltante', "No esta definida la temperatura en el estado {}", estado_in)
 					return None
 			elif estado_out.v is not None:
 				if estado_out.T is not None:
-					return  (self.R_gas*estado_out.T*(estado_out.T - self.b)**(gamma))/(v-self.b)**gamma - self.a/(v)**2
+					return (self.R_gas*estado_out.T*(estado_out.v - self.b)**exponente)/(v - self.b)**(exponente + 1) - self.a/(v)**2
 				else:
-					print("ERROR: No estan definida la temperatura en el estado de salida")
+					self._registrar('dato_faltante', "No esta definida la temperatura en el estado {}", estado_out)
 					return None
 			else:
-				print("ERROR: No estan definidos los volumenes")
+				self._registrar('dato_faltante', "No estan definidos los volumenes de los estados {} ni {}", estado_in, estado_out)
 				return None
 		return isoentropico_ModeloVanDerWaals
 
@@ -1055,12 +1864,13 @@ class ModeloVanDerWaals(ModeloTermodinamico):
 		# La entropia
 		if estado_in.s is not None and estado_out.s is not None:
 			if estado_in.s == estado_out.s:
-				print(f"Las entropias de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidos y son iguales. Esto es un error, agregar o sacar calor cambia la entropia.")
+				self._registrar('incongruente', "Las entropias de los estados {} y {} fueron definidos y son iguales. Esto es un error, agregar o sacar calor cambia la entropia.", estado_in, estado_out)
 			else:
 				if (estado_in.s -(estado_out.s + calor/estado_out.T)< 1e-6):
-					print(f"Las entropias de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidos pero no son iguales. Son congruentes con el cambio esperado")
+					self._registrar('congruente', "Las entropias de los estados {} y {} fueron definidos pero no son iguales. Son congruentes con el cambio esperado", estado_in, estado_out)
 				else:
-					print(f"Las entropias de los estados {estado_in.nombre} y {estado_out.nombre} fueron definidos pero no son iguales. NO SON congruentes con el cambio esperado " + r"$\Delta$ s =" + f"{estado_in.s - estado_out.s}" + r"Q/T =" +f"{calor/estado_out.T}")
+					self._registrar('incongruente', "Las entropias de los estados {} y {} fueron definidos pero no son iguales. NO SON congruentes con el cambio esperado: Δs = {delta_s}, Q/T = {calor_T}", estado_in, estado_out,
+									 delta_s=estado_in.s - estado_out.s, calor_T=calor/estado_out.T)
 
 		# Solo el estado_in tiene volumen definido
 		elif estado_in.s is not None:
@@ -1076,12 +1886,35 @@ class ModeloVanDerWaals(ModeloTermodinamico):
 
 		# Ninguno tiene volumen definido
 		else:
-			print(f"Ninguno de los estados {estado_in.nombre} ni {estado_out.nombre} puede ser definido.")
+			self._registrar('datos_insuficientes', "Ninguno de los estados {} ni {} puede ser definido.", estado_in, estado_out)
 
 		def in_or_out_calor_ModeloVanDerWaals(v):
 			"""
 			Retorna la presión P para un gas VanDerWaals en un proceso de adicion o rechazo de calor -> isotermico, dado v.
 			"""
 			v = np.asarray(v)
-			return (self.R_gas*estado_in.T)/(estado_in.v - self.b) - self.a/(estado_in.v)**2
+			return (self.R_gas*estado_in.T)/(v - self.b) - self.a/(v)**2
 		return in_or_out_calor_ModeloVanDerWaals
+
+	def _trabajo_isotermico(self, inicial, final):
+		"""Trabajo isotérmico de Van der Waals, W = R T ln((v_f - b)/(v_i - b)) + a (1/v_f - 1/v_i)."""
+		return self.R_gas*inicial['T']*np.log((final['v'] - self.b)/(inicial['v'] - self.b)) + self.a*(1/final['v'] - 1/inicial['v'])
+
+	def _trabajo_isoentalpico(self, inicial, final):
+		r"""
+		Trabajo de Van der Waals a entalpía constante (cv constante), integrando P dv sobre la trayectoria de
+		`resolver_isoentalpico` en forma cerrada.
+
+		Con H = h + cv T0 y k = cv + R, a lo largo de la trayectoria $P = R(Hv + 2a)/(v(kv - cv b)) - a/v^2$, cuyas
+		fracciones parciales dan
+		$W = R[-\frac{2a}{cv\,b}\ln\frac{v_f}{v_i} + \frac{1}{k}(H + \frac{2ak}{cv\,b})\ln\frac{kv_f - cv\,b}{kv_i - cv\,b}] + a(\frac{1}{v_f} - \frac{1}{v_i})$.
+		"""
+		H = inicial['h'] + self.cv*self.T0
+		k = self.cv + self.R_gas
+		m = self.cv*self.b
+		v_i, v_f = inicial['v'], final['v']
+		if m == 0:
+			integral = H/k*np.log(v_f/v_i) - 2*self.a/k*(1/v_f - 1/v_i)
+		else:
+			integral = -2*self.a/m*np.log(v_f/v_i) + (H + 2*self.a*k/m)/k*np.log((k*v_f - m)/(k*v_i - m))
+		return self.R_gas*integral + self.a*(1/v_f - 1/v_i)
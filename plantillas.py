@@ -0,0 +1,237 @@
+import numpy as np
+
+class PlantillaCiclo:
+	"""
+	Plantilla compilada de un ciclo termodinámico para evaluarlo de forma vectorizada en barridos paramétricos.
+
+	La plantilla se graba a partir de un `CicloTermodinamico` con sus estados, procesos declarados
+	(`declarar_proceso`) y relaciones (`relacionar`), indicando qué datos son parámetros. Al compilarla se
+	determina una sola vez el orden en que se propagan las restricciones y se calculan los estados, tal como lo
+	haría `CicloTermodinamico.resolver`. Luego `evaluar` repite ese plan con arreglos de valores de los
+	parámetros: cada paso es una operación de NumPy o una llamada a `calcular_estados` del modelo para los N
+	ciclos a la vez, sin construir objetos por ciclo.
+
+	Attributes:
+		modelo (ModeloTermodinamico): Modelo termodinámico del ciclo.
+		nombres (list): Nombres de los estados, en el orden del ciclo.
+		procesos (list[tuple]): (tipo, i, j, calor) de cada proceso declarado, con índices de estado.
+		parametros (dict): Destino de cada parámetro.
+		n_values (int): Número de puntos de cada trayectoria, incluidos los extremos.
+		metodo_trabajo (str): 'exacto' o 'trapecio' (ver `evaluar`).
+	"""
+
+	def __init__(self, ciclo, parametros=None, metodo_trabajo='exacto'):
+		"""
+		Graba y compila la plantilla.
+
+		Args:
+			ciclo (CicloTermodinamico): Ciclo con estados agregados y procesos declarados (no hace falta resolverlo).
+			parametros (dict, optional): Nombre de cada parámetro y su destino, que puede ser:
+				- (i, propiedad): dato `propiedad` del estado de índice i.
+				- ('relacion', k): desplazamiento de la k-ésima relación de `ciclo.relaciones`.
+				- ('calor', k): calor del k-ésimo proceso declarado, que debe ser 'in_or_out_calor'.
+			metodo_trabajo (str): 'exacto' para el trabajo y el calor en forma cerrada del modelo, o 'trapecio' para
+				integrar sobre trayectorias de `n_values` puntos como `CicloTermodinamico.calcular_eficiencia_num`.
+
+		Raises:
+			ValueError: Si algún destino o el método de trabajo no es válido, o si el ciclo requiere resolver estados acoplados.
+		"""
+		if metodo_trabajo not in ('exacto', 'trapecio'):
+			raise ValueError(f"Método de trabajo '{metodo_trabajo}' no válido. Use 'exacto' o 'trapecio'.")
+		self.modelo = ciclo.modelo
+		self.n_values = ciclo.n_values
+		self.metodo_trabajo = metodo_trabajo
+		estados = [estado for estado in ciclo.estados if estado is not None]
+		indice = {id(estado): i for i, estado in enumerate(estados)}
+		self.nombres = [estado.nombre for estado in estados]
+		self.datos = [{nombre: getattr(estado, nombre) for nombre in estado.entradas} for estado in estados]
+		self.procesos = [(tipo, indice[id(estado_in)], indice[id(estado_out)], kwargs.get('calor'))
+						 for tipo, estado_in, estado_out, kwargs in ciclo.procesos_declarados]
+
+		# Restricciones como (tipo, origen, destino, propiedad, factor, desplazamiento); las relaciones van primero,
+		# y en las de calor el último campo es el índice del proceso
+		self.restricciones = [('relacion', indice[id(r.origen)], indice[id(r.destino)], r.propiedad, r.factor, r.desplazamiento)
+							  for r in ciclo.relaciones]
+		for k, (tipo, i, j, calor) in enumerate(self.procesos):
+			self.restricciones.append(('relacion', i, j, ciclo._PROPIEDAD_CONSERVADA[tipo], 1.0, 0.0))
+			if tipo == 'in_or_out_calor':
+				self.restricciones.append(('calor', i, j, 's', 1.0, k))
+
+		self.n_relaciones = len(ciclo.relaciones)
+		self.parametros = dict(parametros or {})
+		for nombre, destino in self.parametros.items():
+			self._validar_destino(nombre, destino)
+		self.plan = self._compilar()
+
+	def _validar_destino(self, nombre, destino):
+		"""Revisa que el destino de un parámetro exista en el ciclo grabado."""
+		clase, k = destino
+		if clase == 'relacion':
+			valido = 0 <= k < self.n_relaciones
+		elif clase == 'calor':
+			valido = 0 <= k < len(self.procesos) and self.procesos[k][0] == 'in_or_out_calor'
+		else:
+			valido = 0 <= clase < len(self.nombres) and k in ('P', 'T', 'v', 'h', 's')
+		if not valido:
+			raise ValueError(f"El destino {destino} del parámetro '{nombre}' no es válido.")
+
+	def _compilar(self):
+		"""
+		Determina el orden de propagación y de cálculo de los estados, a partir de qué propiedades se conocen.
+
+		Returns:
+			list[tuple]: Pasos ('propagar', k, sentido) y ('calcular', i).
+		"""
+		conocidas = [set(datos) - {'x', 'u'} for datos in self.datos]
+		for clase, k in self.parametros.values():
+			if clase not in ('relacion', 'calor'):
+				conocidas[clase].add(k)
+		plan = []
+		calculados = set()
+		hubo_cambios = True
+		while hubo_cambios:
+			hubo_cambios = False
+			for k, (tipo, i, j, propiedad, _, _) in enumerate(self.restricciones):
+				listo = tipo == 'relacion' or 'T' in conocidas[i] | conocidas[j]
+				if not listo:
+					continue
+				if propiedad in conocidas[i] and propiedad not in conocidas[j]:
+					plan.append(('propagar', k, 1))
+					conocidas[j].add(propiedad)
+					hubo_cambios = True
+				elif propiedad in conocidas[j] and propiedad not in conocidas[i]:
+					plan.append(('propagar', k, -1))
+					conocidas[i].add(propiedad)
+					hubo_cambios = True
+			for i, props in enumerate(conocidas):
+				if i not in calculados and len(props) >= 2:
+					plan.append(('calcular', i))
+					calculados.add(i)
+					props.update(('P', 'T', 'v', 'h', 's'))
+					hubo_cambios = True
+		faltantes = [str(self.nombres[i]) for i in range(len(self.nombres)) if i not in calculados]
+		if faltantes:
+			raise ValueError(f"Los estados {', '.join(faltantes)} están acoplados; use CicloTermodinamico.resolver para este ciclo.")
+		return plan
+
+	def evaluar(self, **valores):
+		"""
+		Evalúa N ciclos a la vez.
+
+		Args:
+			**valores: Valor (escalar o arreglo) de cada parámetro. Se difunden (broadcast) a un largo común N.
+
+		Returns:
+			dict[str, np.ndarray]: 'P', 'T', 'v', 'u', 'h', 's' y 'x' con forma (N, n_estados); 'trabajo' y 'calor'
+			de cada proceso con forma (N, n_procesos); y 'trabajo_neto', 'calor_entrada' y 'eficiencia' con forma (N,).
+			Con `metodo_trabajo='exacto'` el trabajo y el calor salen de `ModeloTermodinamico.trabajo_y_calor`, con
+			una llamada por tipo de proceso para todos los procesos y ciclos a la vez; con 'trapecio' el trabajo se
+			integra sobre la trayectoria de cada proceso y el calor se obtiene de la primera ley, como en
+			`CicloTermodinamico.calcular_eficiencia_num`.
+		"""
+		faltantes = set(self.parametros) - set(valores)
+		if faltantes:
+			raise ValueError(f"Faltan valores para los parámetros: {', '.join(sorted(faltantes))}.")
+		desconocidos = set(valores) - set(self.parametros)
+		if desconocidos:
+			raise ValueError(f"Parámetros desconocidos: {', '.join(sorted(desconocidos))}.")
+		arreglos = np.broadcast_arrays(*(np.atleast_1d(np.asarray(valores[nombre], dtype=float)) for nombre in self.parametros))
+		N = arreglos[0].shape[0] if arreglos else 1
+		parametro = dict(zip(self.parametros, arreglos))
+
+		propiedades = ('P', 'T', 'v', 'u', 'h', 's', 'x')
+		estados = [{nombre: np.full(N, np.nan) for nombre in propiedades} for _ in self.nombres]
+		for estado, datos in zip(estados, self.datos):
+			estado['x'][:] = 1.0
+			for nombre, valor in datos.items():
+				estado[nombre][:] = valor
+		desplazamientos = {k: self.restricciones[k][5] for k in range(self.n_relaciones)}
+		calores = {k: calor for k, (_, _, _, calor) in enumerate(self.procesos)}
+		for nombre, (clase, k) in self.parametros.items():
+			if clase == 'relacion':
+				desplazamientos[k] = parametro[nombre]
+			elif clase == 'calor':
+				calores[k] = parametro[nombre]
+			else:
+				estados[clase][k][:] = parametro[nombre]
+
+		for paso in self.plan:
+			if paso[0] == 'calcular':
+				estado = estados[paso[1]]
+				conocidas = {nombre: estado[nombre] for nombre in ('P', 'T', 'v', 'h', 's', 'x')}
+				estados[paso[1]] = dict(self.modelo.calcular_estados(**conocidas))
+				continue
+			_, k, sentido = paso
+			tipo, i, j, propiedad, factor, extra = self.restricciones[k]
+			a, b = estados[i], estados[j]
+			if tipo == 'calor':
+				T = np.where(np.isnan(b['T']), a['T'], b['T'])
+				if sentido == 1:
+					b['s'] = a['s'] + calores[extra]/T
+				else:
+					a['s'] = b['s'] - calores[extra]/T
+			elif sentido == 1:
+				b[propiedad] = factor*a[propiedad] + desplazamientos.get(k, extra)
+			else:
+				a[propiedad] = (b[propiedad] - desplazamientos.get(k, extra))/factor
+
+		resultado = {nombre: np.column_stack([estado[nombre] for estado in estados]) for nombre in propiedades}
+		if self.metodo_trabajo == 'exacto':
+			trabajo, calor = self._trabajo_y_calor_exacto(estados, N)
+		else:
+			trabajo, calor = self._trabajo_y_calor(estados, N)
+		resultado['trabajo'] = trabajo
+		resultado['calor'] = calor
+		resultado['trabajo_neto'] = trabajo.sum(axis=1)
+		resultado['calor_entrada'] = np.where(calor > 0, calor, 0.0).sum(axis=1)
+		with np.errstate(invalid='ignore', divide='ignore'):
+			resultado['eficiencia'] = np.where(resultado['calor_entrada'] > 0, resultado['trabajo_neto']/resultado['calor_entrada'], 0.0)
+		return resultado
+
+	def _trabajo_y_calor_exacto(self, estados, N):
+		"""
+		Trabajo y calor en forma cerrada de cada proceso, agrupando los procesos por tipo, para los N ciclos.
+		"""
+		trabajo = np.zeros((N, len(self.procesos)))
+		calor = np.zeros((N, len(self.procesos)))
+		grupos = {}
+		for k, (tipo, _, _, _) in enumerate(self.procesos):
+			grupos.setdefault(tipo, []).append(k)
+		for tipo, indices in grupos.items():
+			extremos = [{nombre: np.column_stack([estados[self.procesos[k][lado]][nombre] for k in indices])
+						 for nombre in ('P', 'T', 'v', 'u', 'h', 's')} for lado in (1, 2)]
+			trabajo[:, indices], calor[:, indices] = self.modelo.trabajo_y_calor(tipo, *extremos)
+		return trabajo, calor
+
+	def _trabajo_y_calor(self, estados, N):
+		"""
+		Trabajo (regla del trapecio sobre P dv) y calor (primera ley) de cada proceso, para los N ciclos.
+		"""
+		n = self.n_values
+		fraccion = np.linspace(0, 1, n)[None, :]
+		trabajo = np.zeros((N, len(self.procesos)))
+		calor = np.zeros((N, len(self.procesos)))
+		for k, (tipo, i, j, _) in enumerate(self.procesos):
+			a, b = estados[i], estados[j]
+			def lineal(nombre):
+				return a[nombre][:, None] + fraccion*(b[nombre] - a[nombre])[:, None]
+			def constante(nombre):
+				return np.repeat(a[nombre][:, None], n, axis=1)
+			v = lineal('v')
+			if tipo == 'isocorico':
+				P = lineal('P')
+			elif tipo == 'isobarico':
+				P = constante('P')
+			elif tipo in ('isotermico', 'in_or_out_calor'):
+				P = self.modelo.calcular_estados(T=constante('T'), v=v)['P']
+			elif tipo == 'isoentropico':
+				P = self.modelo.calcular_estados(s=constante('s'), v=v)['P']
+			else:
+				camino = self.modelo.calcular_estados(P=lineal('P'), h=constante('h'))
+				P, v = camino['P'], camino['v']
+			# Los extremos son los estados ya calculados
+			P[:, 0], P[:, -1] = a['P'], b['P']
+			v[:, 0], v[:, -1] = a['v'], b['v']
+			trabajo[:, k] = np.sum((P[:, 1:] + P[:, :-1])/2*np.diff(v, axis=1), axis=1)
+			calor[:, k] = b['u'] - a['u'] + trabajo[:, k]
+		return trabajo, calor
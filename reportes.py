@@ -0,0 +1,170 @@
+import concurrent.futures
+import math
+import os
+
+from barridos import (EspecificacionModelo, _comprobar_modelo_serializable, _ejecutar_bloques, _lista_configuraciones,
+					  _serializable, _silenciar)
+
+# Método de `CicloTermodinamico` que dibuja cada diagrama
+DIAGRAMAS = {'Pv': 'graficar_diagrama_Pv', 'Ts': 'graficar_diagrama_Ts'}
+
+# Figuras reutilizadas dentro de cada proceso, una por (diagrama, dpi) (ver `_eje_limpio`)
+_FIGURAS = {}
+
+def renderizar_lote(casos, directorio, construir_ciclo=None, modelo=None, nombres=None, diagramas=('Pv', 'Ts'),
+					formatos=('png',), tablas=True, dpi=100, n_procesos=None, tamano_bloque=None, progreso=None,
+					silencioso=True, indice='indice.csv'):
+	"""
+	Dibuja los diagramas P-v y T-s y escribe las tablas de `generar_dataframes` de muchos ciclos, repartidos en
+	bloques entre procesos, sin interfaz gráfica.
+
+	Cada proceso de trabajo usa el backend Agg y dibuja sobre figuras de matplotlib que no pasan por `pyplot`; la
+	figura de cada diagrama se crea una sola vez por proceso y se limpia entre un caso y el siguiente, en lugar de
+	crear una figura nueva por caso. Un error en un caso, o en el bloque completo que lo contiene, se registra en
+	el índice y no detiene el resto del lote. Los ciclos ya resueltos que no se pueden serializar (por ejemplo, con
+	un cp definido como función local) se dibujan en el proceso principal en lugar de enviarse a los de trabajo.
+
+	Args:
+		casos (list): Ciclos ya resueltos (`CicloTermodinamico`), o bien, si se indica `construir_ciclo`, las
+			configuraciones de cada caso (lista de diccionarios o DataFrame), como en `barridos.barrer`.
+		directorio (str): Directorio donde se escriben los archivos; se crea si no existe.
+		construir_ciclo (callable, optional): Función definida en el nivel superior de un módulo, con firma
+			`construir_ciclo(modelo, **configuracion)`, que devuelve el ciclo resuelto de una configuración.
+		modelo (EspecificacionModelo | ModeloTermodinamico, optional): Modelo que recibe `construir_ciclo`. Con
+			varios procesos, una instancia que no se puede serializar produce `ValueError` (ver `barridos.barrer`).
+		nombres (list[str], optional): Nombre de cada caso, usado en los archivos y en el título de los
+			diagramas. Por defecto 'caso_0000', 'caso_0001', ...
+		diagramas (tuple[str]): Diagramas a dibujar: 'Pv' y/o 'Ts'.
+		formatos (tuple[str]): Formatos de imagen, por ejemplo ('png', 'pdf').
+		tablas (bool): Si es `True` se escriben, en CSV, los estados principales y todos los estados de cada caso.
+		dpi (int): Resolución de las imágenes.
+		n_procesos (int, optional): Número de procesos. Por defecto, el número de núcleos; con 1 no se crean procesos.
+		tamano_bloque (int, optional): Casos por bloque. Por defecto se reparten unos cuatro bloques por proceso.
+		progreso (callable, optional): Se llama en el proceso principal como `progreso(completados, total)` cada
+			vez que termina un bloque.
+		silencioso (bool): Si es `True` se descarta lo que los ciclos impriman y sus diagnósticos se crean en
+			modo 'silencioso'.
+		indice (str): Nombre del archivo índice (CSV) que se escribe en `directorio`.
+
+	Returns:
+		pandas.DataFrame: El índice: una fila por caso con 'caso', las columnas de la configuración (si las hay),
+		la ruta relativa de cada archivo escrito ('Pv_png', ..., 'tabla_principales', 'tabla_estados') y 'error'
+		(nulo si el caso se generó sin problemas).
+	"""
+	import pandas as pd
+
+	for diagrama in diagramas:
+		if diagrama not in DIAGRAMAS:
+			raise ValueError(f"Diagrama '{diagrama}' no válido. Use uno de: {', '.join(DIAGRAMAS)}.")
+	if construir_ciclo is None:
+		casos = list(casos)
+		configuraciones = [{} for _ in casos]
+		# Los estados internos pendientes (modo perezoso) se calculan antes de enviar los ciclos
+		for ciclo in casos:
+			ciclo.almacen
+	else:
+		casos = configuraciones = _lista_configuraciones(casos)
+	total = len(casos)
+	if nombres is None:
+		nombres = [f"caso_{k:04d}" for k in range(total)]
+	nombres = [str(nombre) for nombre in nombres]
+	if len(nombres) != total:
+		raise ValueError(f"Se dieron {len(nombres)} nombres para {total} casos.")
+
+	os.makedirs(directorio, exist_ok=True)
+	n_procesos = n_procesos or os.cpu_count() or 1
+	tamano_bloque = tamano_bloque or max(1, math.ceil(total/(4*n_procesos)))
+	locales = set()
+	if n_procesos > 1:
+		if construir_ciclo is None:
+			locales = {k for k, ciclo in enumerate(casos) if not _serializable(ciclo)}
+		else:
+			_comprobar_modelo_serializable(modelo)
+	# Bloques contiguos de casos que se envían a los procesos; los casos locales forman bloques de uno
+	bloques, inicio = [], None
+	for k in range(total + 1):
+		if inicio is not None and (k == total or k in locales or k - inicio == tamano_bloque):
+			bloques.append((inicio, list(zip(nombres[inicio:k], casos[inicio:k]))))
+			inicio = None
+		if inicio is None and k < total and k not in locales:
+			inicio = k
+	bloques_locales = [(k, [(nombres[k], casos[k])]) for k in sorted(locales)]
+	opciones = {'diagramas': tuple(diagramas), 'formatos': tuple(formatos), 'tablas': tablas, 'dpi': dpi,
+				'silencioso': silencioso}
+
+	filas = [None]*total
+	completados = 0
+	def recibir(inicio, filas_bloque):
+		nonlocal completados
+		filas[inicio:inicio + len(filas_bloque)] = filas_bloque
+		completados += len(filas_bloque)
+		if progreso is not None:
+			progreso(completados, total)
+
+	argumentos = (construir_ciclo, modelo, directorio, opciones)
+	if n_procesos == 1:
+		for inicio, bloque in bloques:
+			recibir(*_renderizar_bloque(*argumentos, inicio, bloque))
+	else:
+		with concurrent.futures.ProcessPoolExecutor(max_workers=n_procesos, initializer=_inicializar_trabajador) as ejecutor:
+			_ejecutar_bloques(ejecutor, _renderizar_bloque, argumentos, bloques, recibir,
+							  lambda mensaje, inicio, bloque: [{'error': mensaje} for _ in bloque])
+		for inicio, bloque in bloques_locales:
+			recibir(*_renderizar_bloque(*argumentos, inicio, bloque))
+
+	tabla_indice = pd.DataFrame([{'caso': nombre, **configuracion, **fila}
+								 for nombre, configuracion, fila in zip(nombres, configuraciones, filas)])
+	tabla_indice.to_csv(os.path.join(directorio, indice), index=False)
+	return tabla_indice
+
+def _inicializar_trabajador():
+	"""Fija el backend Agg en cada proceso de trabajo, antes de que se dibuje nada."""
+	import matplotlib
+	matplotlib.use('Agg')
+
+def _eje_limpio(diagrama, dpi):
+	"""
+	Eje de la figura reutilizable de un diagrama en este proceso, vacío. La figura no se registra en `pyplot`,
+	así que no queda abierta entre casos ni depende del backend interactivo.
+	"""
+	from matplotlib.figure import Figure
+
+	figura = _FIGURAS.get((diagrama, dpi))
+	if figura is None:
+		figura = _FIGURAS[(diagrama, dpi)] = Figure(figsize=(6, 4), dpi=dpi)
+		figura.add_subplot()
+	eje = figura.axes[0]
+	eje.clear()
+	return eje
+
+def _renderizar_bloque(construir_ciclo, modelo, directorio, opciones, inicio, bloque):
+	"""
+	Dibuja y escribe los archivos de un bloque de casos en un proceso de trabajo.
+
+	Returns:
+		tuple[int, list[dict]]: Posición del bloque y, para cada caso, los archivos escritos y la llave 'error'.
+	"""
+	if isinstance(modelo, EspecificacionModelo):
+		modelo = modelo.construir()
+	filas = []
+	for nombre, caso in bloque:
+		fila = {}
+		try:
+			with _silenciar(opciones['silencioso']):
+				ciclo = caso if construir_ciclo is None else construir_ciclo(modelo, **caso)
+				for diagrama in opciones['diagramas']:
+					figura, _ = getattr(ciclo, DIAGRAMAS[diagrama])(nombre_ciclo=nombre, ax=_eje_limpio(diagrama, opciones['dpi']))
+					for formato in opciones['formatos']:
+						archivo = fila[f"{diagrama}_{formato}"] = f"{nombre}_{diagrama}.{formato}"
+						figura.savefig(os.path.join(directorio, archivo), dpi=opciones['dpi'])
+				if opciones['tablas']:
+					principales, completo = ciclo.generar_dataframes(opcion=2)
+					fila['tabla_principales'] = f"{nombre}_principales.csv"
+					fila['tabla_estados'] = f"{nombre}_estados.csv"
+					principales.to_csv(os.path.join(directorio, fila['tabla_principales']), index=False)
+					completo.to_csv(os.path.join(directorio, fila['tabla_estados']), index=False)
+			fila['error'] = None
+		except Exception as error:
+			fila['error'] = f"{type(error).__name__}: {error}"
+		filas.append(fila)
+	return inicio, filas
@@ -0,0 +1,231 @@
+import numpy as np
+
+def raices_cubicas(A, B, C, refinar=True, max_iter=60):
+	r"""
+	Resuelve de forma analítica y vectorizada la cúbica mónica $x^3 + Ax^2 + Bx + C = 0$ con coeficientes reales.
+
+	La raíz real mayor se estima con la forma trigonométrica (tres raíces reales) o con la fórmula de Cardano
+	escrita para evitar cancelación (una raíz real), y se pule con Newton partiendo desde arriba, donde la
+	convergencia es monótona. Las otras dos raíces se obtienen por deflación con las relaciones de Vieta y la
+	fórmula cuadrática estable, lo que mantiene la precisión aun cuando las raíces difieren en muchos órdenes
+	de magnitud (por ejemplo, volúmenes de líquido y de gas a baja presión).
+
+	Args:
+		A, B, C (float | array_like): Coeficientes de la cúbica. Se difunden (broadcast) a una forma común.
+		refinar (bool): Si es `True` aplica un paso final de Newton a las raíces obtenidas por deflación.
+		max_iter (int): Número máximo de pasos de Newton para la raíz mayor.
+
+	Returns:
+		tuple[np.ndarray, np.ndarray, np.ndarray]: Raíces (menor, intermedia, mayor). Cuando hay una sola raíz real,
+		la menor y la mayor coinciden con ella y la intermedia es `NaN`.
+	"""
+	A, B, C = np.broadcast_arrays(*(np.asarray(coef, dtype=float) for coef in (A, B, C)))
+
+	with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+		# Estimación analítica de la raíz real mayor
+		p = B - A**2/3
+		q = 2*A**3/27 - A*B/3 + C
+		discriminante = (q/2)**2 + (p/3)**3
+		tres_raices = discriminante < 0
+		m = 2*np.sqrt(np.where(tres_raices, -p/3, 0.0))
+		theta = np.arccos(np.clip(np.where(tres_raices, 3*q/(p*m), 0.0), -1, 1))/3
+		raiz_disc = np.sqrt(np.where(tres_raices, 0.0, discriminante))
+		w = np.cbrt(-q/2 - np.where(q >= 0, 1.0, -1.0)*raiz_disc)
+		unica = np.where(w != 0, w - p/(3*w), 0.0)
+		mayor = np.where(tres_raices, m*np.cos(theta), unica) - A/3
+
+		# Punto de partida por encima de la raíz mayor: si f, f' y f'' son positivas no hay raíces a la derecha.
+		# Si la estimación no lo garantiza se usa la cota de Fujiwara.
+		x = mayor + 1e-6*np.abs(mayor) + 1e-300
+		f, df, d2f = _cubica(x, A, B, C)
+		cota = 2*np.maximum.reduce([np.abs(A), np.sqrt(np.abs(B)), np.cbrt(np.abs(C)/2)]) + 1e-300
+		x = np.where((f > 0) & (df > 0) & (d2f > 0), x, cota)
+		for _ in range(max_iter):
+			f, df, _ = _cubica(x, A, B, C)
+			paso = np.where(df > 0, f/df, 0.0)
+			x = x - paso
+			if not np.any(np.abs(paso) > 4*np.finfo(float).eps*np.abs(x)):
+				break
+
+		# Deflación: las otras dos raíces cumplen r1 + r2 = s y r1 r2 = producto
+		es_cero = x == 0
+		x_seguro = np.where(es_cero, 1.0, x)
+		producto = np.where(es_cero, B, -C/x_seguro)
+		suma_directa = -A - x
+		suma_vieta = (B - producto)/x_seguro
+		suma = np.where(es_cero | (np.abs(suma_directa) >= 0.5*np.abs(x)), suma_directa, suma_vieta)
+		disc_cuadratica = suma**2 - 4*producto
+		dos_raices = disc_cuadratica >= 0
+		w = (suma + np.where(suma >= 0, 1.0, -1.0)*np.sqrt(np.where(dos_raices, disc_cuadratica, 0.0)))/2
+		r_a = w
+		r_b = np.where(w != 0, producto/w, 0.0)
+
+		if refinar:
+			r_a = _paso_newton_cubica(r_a, A, B, C)
+			r_b = _paso_newton_cubica(r_b, A, B, C)
+
+	ordenadas = np.sort(np.stack([r_a, r_b, x]), axis=0)
+	menor = np.where(dos_raices, ordenadas[0], x)
+	intermedia = np.where(dos_raices, ordenadas[1], np.nan)
+	mayor = np.where(dos_raices, ordenadas[2], x)
+	return menor, intermedia, mayor
+
+def _cubica(x, A, B, C):
+	"""
+	Evalúa la cúbica mónica y sus dos primeras derivadas.
+	"""
+	f = ((x + A)*x + B)*x + C
+	df = (3*x + 2*A)*x + B
+	d2f = 6*x + 2*A
+	return f, df, d2f
+
+def _paso_newton_cubica(x, A, B, C):
+	"""
+	Aplica un paso de Newton a una raíz aproximada de la cúbica mónica; los puntos con derivada nula no se modifican.
+	"""
+	f, df, _ = _cubica(x, A, B, C)
+	with np.errstate(invalid='ignore', divide='ignore'):
+		paso = np.where(df != 0, f/df, 0.0)
+	return x - np.nan_to_num(paso)
+
+def raices_acotadas(f, a, b, xtol=1e-12, rtol=4*np.finfo(float).eps, max_iter=100):
+	r"""
+	Resuelve en paralelo muchas ecuaciones escalares independientes $f_i(x_i) = 0$ con el método de Chandrupatla.
+
+	Cada elemento parte de su propio intervalo $[a_i, b_i]$ con cambio de signo y avanza en paralelo con los demás:
+	en cada iteración se elige entre interpolación cuadrática inversa y bisección según el criterio de
+	Chandrupatla, de modo que la convergencia es superlineal sin perder la garantía de la bisección. Los elementos
+	que ya convergieron se congelan con una máscara, y el bucle termina cuando no queda ninguno activo.
+
+	Args:
+		f (callable): Función vectorizada; recibe un arreglo con la forma común de `a` y `b` y devuelve otro igual.
+			El elemento i del resultado debe depender solo del elemento i de la entrada.
+		a, b (float | array_like): Extremos de los intervalos. Se difunden (broadcast) a una forma común.
+		xtol (float): Tolerancia absoluta en x.
+		rtol (float): Tolerancia relativa en x.
+		max_iter (int): Número máximo de iteraciones.
+
+	Returns:
+		tuple[np.ndarray, np.ndarray]: Raíces y máscara de convergencia. Los elementos cuyo intervalo no encierra
+		un cambio de signo, o que no convergieron en `max_iter` iteraciones, quedan como `NaN` con máscara `False`.
+	"""
+	x1, x2 = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+	x1, x2 = x1.copy(), x2.copy()
+	f1 = np.asarray(f(x1), dtype=float)
+	f2 = np.asarray(f(x2), dtype=float)
+	x3, f3 = x2.copy(), f2.copy()
+
+	with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+		valido = (np.sign(f1) != np.sign(f2)) | (f1 == 0) | (f2 == 0)
+		valido &= np.isfinite(f1) & np.isfinite(f2)
+		convergido = valido & ((f1 == 0) | (f2 == 0))
+		x_mejor = np.where(np.abs(f1) < np.abs(f2), x1, x2)
+		activo = valido & ~convergido
+		t = np.full(x1.shape, 0.5)
+
+		for _ in range(max_iter):
+			if not np.any(activo):
+				break
+			xt = np.where(activo, x1 + t*(x2 - x1), x_mejor)
+			ft = np.asarray(f(xt), dtype=float)
+
+			# El nuevo punto reemplaza al extremo con su mismo signo; el descartado pasa a ser x3
+			mismo_signo = np.sign(ft) == np.sign(f1)
+			x3 = np.where(activo, np.where(mismo_signo, x1, x2), x3)
+			f3 = np.where(activo, np.where(mismo_signo, f1, f2), f3)
+			x2 = np.where(activo & ~mismo_signo, x1, x2)
+			f2 = np.where(activo & ~mismo_signo, f1, f2)
+			x1 = np.where(activo, xt, x1)
+			f1 = np.where(activo, ft, f1)
+
+			x_mejor = np.where(activo, np.where(np.abs(f1) < np.abs(f2), x1, x2), x_mejor)
+			f_mejor = np.minimum(np.abs(f1), np.abs(f2))
+			tl = (2*rtol*np.abs(x_mejor) + xtol)/np.abs(x2 - x1)
+			terminado = activo & ((tl > 0.5) | (f_mejor == 0) | ~np.isfinite(ft))
+			convergido |= terminado & np.isfinite(ft)
+			activo &= ~terminado
+
+			# Interpolación cuadrática inversa si la parábola es monótona en el intervalo; si no, bisección
+			xi = (x1 - x2)/(x3 - x2)
+			phi = (f1 - f2)/(f3 - f2)
+			cuadratica = (phi**2 < xi) & ((1 - phi)**2 < 1 - xi)
+			t_cuadratica = f1/(f2 - f1)*f3/(f2 - f3) + (x3 - x1)/(x2 - x1)*f1/(f3 - f1)*f2/(f3 - f2)
+			t = np.clip(np.where(cuadratica, t_cuadratica, 0.5), tl, 1 - tl)
+
+	return np.where(convergido, x_mejor, np.nan), convergido
+
+def continuar_raices(sistema, x_inicial, objetivos, tol=1e-12, max_iter=6, salto_maximo=0.25, max_subdivisiones=12):
+	r"""
+	Sigue una rama de soluciones de un sistema pequeño $g(x; c) = 0$ a lo largo de una secuencia de objetivos $c_k$.
+
+	Es un método de continuación predictor-corrector: la solución del punto anterior, extrapolada con la tangente
+	(secante) del último paso aceptado, sirve de punto de partida a Newton en el punto siguiente. Un paso se acepta
+	si Newton converge en `max_iter` iteraciones sin alejarse del predictor más de `salto_maximo` veces el valor
+	actual en ninguna componente; así la región de búsqueda se estrecha alrededor de la rama y no se salta a otra
+	raíz. Si el paso se rechaza, el tramo hacia el objetivo se subdivide a la mitad (y vuelve a crecer tras cada
+	paso aceptado), hasta `max_subdivisiones` veces.
+
+	Args:
+		sistema (callable): `sistema(x, c)` devuelve `(residuo, jacobiano)` con formas (m,) y (m, m) para la
+			incógnita `x` de forma (m,) y el objetivo `c` de forma (k,).
+		x_inicial (array_like): Solución de forma (m,) correspondiente a `objetivos[0]`.
+		objetivos (array_like): Secuencia de objetivos de forma (n, k), ordenados a lo largo de la trayectoria.
+		tol (float): Error relativo buscado en la solución.
+		max_iter (int): Iteraciones de Newton permitidas por paso.
+		salto_maximo (float): Cambio relativo máximo entre el predictor y la solución aceptada.
+		max_subdivisiones (int): Número máximo de pasos rechazados en un mismo punto.
+
+	Returns:
+		tuple[np.ndarray, np.ndarray]: Soluciones de forma (n, m) e iteraciones de Newton usadas en cada punto.
+		Si la continuación no puede avanzar, ese punto y los siguientes quedan como `NaN`.
+	"""
+	objetivos = np.asarray(objetivos, dtype=float)
+	objetivos = objetivos.reshape(len(objetivos), -1)
+	x_actual = np.asarray(x_inicial, dtype=float).copy()
+	n = objetivos.shape[0]
+	soluciones = np.full((n, x_actual.size), np.nan)
+	iteraciones = np.zeros(n, dtype=int)
+	soluciones[0] = x_actual
+	tangente = np.zeros_like(x_actual)
+	delta_anterior = 0.0
+
+	for k in range(1, n):
+		c_actual = objetivos[k - 1]
+		delta = objetivos[k] - c_actual
+		# La tangente se reescala a la longitud del nuevo tramo
+		norma = np.linalg.norm(delta)
+		tangente = tangente*(norma/delta_anterior) if delta_anterior > 0 else tangente
+		delta_anterior = norma
+		fraccion, paso, rechazos = 0.0, 1.0, 0
+		while fraccion < 1.0:
+			paso = min(paso, 1.0 - fraccion)
+			c = c_actual + (fraccion + paso)*delta
+			x_predicho = x_actual + paso*tangente
+			x, convergido = x_predicho.copy(), False
+			for _ in range(max_iter):
+				residuo, jacobiano = sistema(x, c)
+				try:
+					dx = np.linalg.solve(jacobiano, -np.asarray(residuo, dtype=float))
+				except np.linalg.LinAlgError:
+					break
+				x = x + dx
+				iteraciones[k] += 1
+				if not np.all(np.isfinite(x)):
+					break
+				# Con convergencia cuadrática el error tras este paso es del orden de (dx/x)^2
+				if np.all(np.abs(dx) <= np.sqrt(tol)*np.abs(x)):
+					convergido = True
+					break
+			if convergido and np.all(np.abs(x - x_predicho) <= salto_maximo*np.abs(x_actual)):
+				# Tangente por unidad de tramo, para predecir el siguiente paso
+				tangente = (x - x_actual)/paso
+				x_actual = x
+				fraccion += paso
+				paso *= 2
+			else:
+				rechazos += 1
+				if rechazos > max_subdivisiones:
+					return soluciones, iteraciones
+				paso /= 2
+		soluciones[k] = x_actual
+	return soluciones, iteraciones